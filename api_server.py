@@ -0,0 +1,339 @@
+"""Local HTTP API for the PDF, image, OCR and conversion engines.
+
+    python api_server.py --port 8502 --workers 4
+
+    curl -F file=@notes.md "http://127.0.0.1:8502/convert?to=pdf" -o notes.pdf
+    curl -F files=@a.pdf -F files=@b.pdf http://127.0.0.1:8502/merge -o merged.pdf
+    curl -F file=@scan.png -F layout="Text regions" http://127.0.0.1:8502/ocr
+
+Uploads are streamed to a per-request temp folder, the work runs in a process
+pool under a time and address-space limit, and results are streamed back
+from disk. The folder is removed once the response has been sent.
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import shutil
+import signal
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.datastructures import UploadFile
+from starlette.responses import FileResponse, JSONResponse
+from starlette.routing import Route
+
+import batch_cli
+import converter_registry
+
+try:
+    import resource
+except ImportError:  # Windows: no per-process limits
+    resource = None
+
+SETTINGS = {
+    "workers": max(1, (os.cpu_count() or 2) - 1),
+    "timeout": 120,           # seconds per job
+    "memory_mb": 2048,        # extra address space a job may allocate
+    "max_upload_mb": 200,     # whole request body
+    "queue": 32,              # jobs in flight before answering 503
+}
+
+CHUNK_SIZE = 1024 * 1024
+
+STATE = {}
+
+
+def _bad_input_errors():
+    """Exception types meaning an upload is not a readable file of its type (answered with 422)."""
+    errors = [ValueError, zipfile.BadZipFile]
+    for module, name in [("PyPDF2.errors", "PdfReadError"),
+                         ("pdfminer.pdfparser", "PDFSyntaxError"),
+                         ("pdfplumber.utils.exceptions", "PdfminerException"),
+                         ("PIL", "UnidentifiedImageError"),
+                         ("docx.opc.exceptions", "PackageNotFoundError")]:
+        try:
+            errors.append(getattr(importlib.import_module(module), name))
+        except (ImportError, AttributeError):
+            pass
+    return tuple(errors)
+
+
+BAD_INPUT = _bad_input_errors()
+
+
+class LimitExceeded(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+# ---- WORKER SIDE ----
+def _on_alarm(signum, frame):
+    raise TimeoutError("job time limit exceeded")
+
+
+def run_job(task, inputs, out_path, options, timeout, memory_mb):
+    """Run one task inside a pool worker under SIGALRM and RLIMIT_AS limits."""
+    old_limit = None
+    if resource is not None:
+        import psutil
+
+        old_limit = resource.getrlimit(resource.RLIMIT_AS)
+        budget = psutil.Process().memory_info().vms + memory_mb * 1024 * 1024
+        hard = old_limit[1]
+        resource.setrlimit(resource.RLIMIT_AS,
+                           (budget if hard == resource.RLIM_INFINITY else min(budget, hard), hard))
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.alarm(timeout)
+    try:
+        if task == "merge-pdf":
+            import pdf_tools
+            with open(out_path, "wb") as out:
+                pdf_tools.merge_pdfs(inputs, out)
+        else:
+            batch_cli.TASKS[task][0](inputs[0], out_path, **options)
+    finally:
+        if hasattr(signal, "SIGALRM"):
+            signal.alarm(0)
+        if old_limit is not None:
+            resource.setrlimit(resource.RLIMIT_AS, old_limit)
+
+
+# ---- REQUEST SIDE ----
+async def save_uploads(request, folder, field, many=False):
+    """Copy uploaded parts to files in folder. Returns (paths, other form fields).
+
+    many endpoints (merge) need at least two files, like the CLI's merge.
+    """
+    form = await request.form(max_files=100)
+    uploads = [v for v in form.getlist(field) if isinstance(v, UploadFile)]
+    if many and len(uploads) < 2:
+        raise LimitExceeded(f"expected two or more files in field '{field}'", 422)
+    if not many and len(uploads) != 1:
+        raise LimitExceeded(f"expected one file in field '{field}'")
+
+    paths = []
+    for i, upload in enumerate(uploads):
+        name = os.path.basename(upload.filename or f"upload_{i}")
+        path = os.path.join(folder, f"{i:04d}_{name}")
+        with open(path, "wb") as out:
+            while chunk := await upload.read(CHUNK_SIZE):
+                out.write(chunk)
+        await upload.close()
+        paths.append(path)
+    fields = {k: v for k, v in form.items() if not isinstance(v, UploadFile)}
+    await form.close()
+    return paths, fields
+
+
+def _restart_pool(broken):
+    """Replace a pool a worker died in (killed by the OS, crashed in a C extension)."""
+    if STATE["pool"] is broken:
+        STATE["pool"] = ProcessPoolExecutor(max_workers=SETTINGS["workers"])
+        broken.shutdown(wait=False, cancel_futures=True)
+    return STATE["pool"]
+
+
+def _submit(*args):
+    pool = STATE["pool"]
+    try:
+        return pool, pool.submit(run_job, *args)
+    except BrokenProcessPool:
+        pool = _restart_pool(pool)
+        return pool, pool.submit(run_job, *args)
+
+
+async def dispatch(task, inputs, out_path, options):
+    """Queue a job on the pool; raises LimitExceeded when the queue is full.
+
+    A job counts as in flight until the pool is done with it, not just
+    while its request waits: one that overran the wait keeps its worker
+    busy, so it keeps its slot until it finishes.
+    """
+    if STATE["waiting"] >= SETTINGS["queue"]:
+        raise LimitExceeded("server busy, retry later", 503)
+    loop = asyncio.get_running_loop()
+    pool, future = _submit(task, inputs, out_path, options, SETTINGS["timeout"], SETTINGS["memory_mb"])
+    STATE["waiting"] += 1
+
+    def finished():
+        STATE["waiting"] -= 1
+
+    future.add_done_callback(lambda _: loop.call_soon_threadsafe(finished))
+    try:
+        # The worker enforces the limit itself; the grace period covers queueing
+        # and code stuck in C extensions that never sees the alarm. Timing out
+        # cancels the job only if it has not started.
+        await asyncio.wait_for(asyncio.wrap_future(future), SETTINGS["timeout"] * 2)
+    except BrokenProcessPool:
+        _restart_pool(pool)
+        raise
+
+
+def endpoint(task, out_ext, field="file", many=False, options=None):
+    """Build a handler: save uploads → run task on the pool → stream the result file."""
+    async def handler(request):
+        folder = tempfile.mkdtemp(prefix="suh_api_")
+        cleanup = BackgroundTask(shutil.rmtree, folder, ignore_errors=True)
+        try:
+            inputs, fields = await save_uploads(request, folder, field, many)
+            opts = options(request, fields, inputs) if options else {}
+            ext = out_ext(opts) if callable(out_ext) else out_ext
+            out_path = os.path.join(folder, "result" + ext)
+            await dispatch(task, inputs, out_path, opts)
+        except LimitExceeded as e:
+            shutil.rmtree(folder, ignore_errors=True)
+            return JSONResponse({"error": str(e)}, status_code=e.status)
+        except (asyncio.TimeoutError, TimeoutError):
+            shutil.rmtree(folder, ignore_errors=True)
+            return JSONResponse({"error": "time limit exceeded"}, status_code=504)
+        except MemoryError:
+            shutil.rmtree(folder, ignore_errors=True)
+            return JSONResponse({"error": "memory limit exceeded"}, status_code=507)
+        except BAD_INPUT as e:
+            shutil.rmtree(folder, ignore_errors=True)
+            return JSONResponse({"error": str(e)}, status_code=422)
+        except Exception as e:
+            shutil.rmtree(folder, ignore_errors=True)
+            return JSONResponse({"error": f"{type(e).__name__}: {e}"}, status_code=500)
+
+        stem = os.path.splitext(os.path.basename(inputs[0]))[0][5:] or "result"
+        filename = ("merged" if many else stem) + ext
+        return FileResponse(out_path, filename=filename, background=cleanup,
+                            media_type=_media_type(ext))
+
+    return handler
+
+
+def _media_type(ext):
+    for fmt_ext, mime in converter_registry.FORMATS.values():
+        if fmt_ext == ext:
+            return mime
+    return "application/octet-stream"
+
+
+def _convert_options(request, fields, inputs):
+    target = request.query_params.get("to") or fields.get("to")
+    if target not in converter_registry.FORMATS:
+        raise LimitExceeded(f"'to' must be one of {sorted(converter_registry.FORMATS)}")
+    if converter_registry.format_for_path(inputs[0]) is None:
+        raise LimitExceeded("unsupported input file type")
+    return {"target": target}
+
+
+def _ocr_options(request, fields, inputs):
+    layout = fields.get("layout", "Text regions")
+    preprocessing = fields.get("preprocessing", "None")
+    if layout not in ("Full page", "Text regions"):
+        raise LimitExceeded("layout must be 'Full page' or 'Text regions'")
+    if preprocessing not in ("None", "Threshold", "Adaptive Threshold", "Noise Removal"):
+        raise LimitExceeded("unknown preprocessing")
+    return {"layout": layout, "preprocessing": preprocessing}
+
+
+def _image_options(request, fields, inputs):
+    try:
+        quality = int(fields.get("quality", 75))
+    except ValueError:
+        raise LimitExceeded("quality must be an integer")
+    return {"quality": min(max(quality, 1), 100)}
+
+
+async def health(request):
+    return JSONResponse({"status": "ok", "workers": SETTINGS["workers"], "waiting": STATE["waiting"]})
+
+
+async def routes(request):
+    table = {
+        source: {target: converter_registry.describe_route(route)
+                 for target, route in converter_registry.reachable_targets(source).items()}
+        for source in sorted(converter_registry.REGISTRY)
+    }
+    return JSONResponse(table)
+
+
+class BodyLimit:
+    """ASGI middleware rejecting request bodies over max_upload_mb, even when chunked."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        limit = SETTINGS["max_upload_mb"] * 1024 * 1024
+        headers = dict(scope.get("headers") or [])
+        if int(headers.get(b"content-length", b"0") or 0) > limit:
+            response = JSONResponse({"error": "upload too large"}, status_code=413)
+            return await response(scope, receive, send)
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise LimitExceeded("upload too large", 413)
+            return message
+
+        try:
+            await self.app(scope, limited_receive, send)
+        except LimitExceeded as e:
+            response = JSONResponse({"error": str(e)}, status_code=e.status)
+            await response(scope, receive, send)
+
+
+@asynccontextmanager
+async def lifespan(app):
+    STATE["waiting"] = 0
+    STATE["pool"] = ProcessPoolExecutor(max_workers=SETTINGS["workers"])
+    try:
+        yield
+    finally:
+        STATE["pool"].shutdown(cancel_futures=True)
+
+
+def create_app():
+    app = Starlette(lifespan=lifespan, routes=[
+        Route("/health", health),
+        Route("/routes", routes),
+        Route("/merge", endpoint("merge-pdf", ".pdf", field="files", many=True), methods=["POST"]),
+        Route("/compress", endpoint("compress-pdf", ".pdf"), methods=["POST"]),
+        Route("/compress-image", endpoint("compress-image", ".jpg", options=_image_options), methods=["POST"]),
+        Route("/ocr", endpoint("ocr", ".txt", options=_ocr_options), methods=["POST"]),
+        Route("/convert", endpoint("convert", lambda opts: converter_registry.FORMATS[opts["target"]][0],
+                                   options=_convert_options), methods=["POST"]),
+    ])
+    return BodyLimit(app)
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--workers", type=int, default=SETTINGS["workers"], help="pool processes")
+    parser.add_argument("--timeout", type=int, default=SETTINGS["timeout"], help="seconds per job")
+    parser.add_argument("--memory-mb", type=int, default=SETTINGS["memory_mb"], help="memory per job")
+    parser.add_argument("--max-upload-mb", type=int, default=SETTINGS["max_upload_mb"])
+    parser.add_argument("--queue", type=int, default=SETTINGS["queue"], help="max jobs in flight")
+    args = parser.parse_args()
+
+    SETTINGS.update(workers=args.workers, timeout=args.timeout, memory_mb=args.memory_mb,
+                    max_upload_mb=args.max_upload_mb, queue=args.queue)
+    uvicorn.run(create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
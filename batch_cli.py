@@ -0,0 +1,396 @@
+"""Headless batch processing for Student Utility Hub.
+
+Every subcommand runs the same processing code as the Streamlit tools, one
+input file at a time:
+
+    python batch_cli.py compress-pdf "submissions/**/*.pdf" --out compressed --jobs 8
+    python batch_cli.py ocr "scans/*.png" --layout "Text regions" --out text
+    python batch_cli.py convert notes/ --to pdf --out pdfs
+    python batch_cli.py merge-pdf "chapters/*.pdf" --out thesis.pdf
+
+Finished files are appended to a manifest (OUT/.manifest.jsonl by default) so
+an interrupted run picks up where it stopped. One JSON record per file with
+its timing is written to --report (stdout by default).
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import converter_registry
+
+MANIFEST_NAME = ".manifest.jsonl"
+
+# Options never written to the manifest, not even hashed (a hash of a short
+# password can be brute-forced); changing one needs --force to redo files
+SECRET_OPTIONS = {"password"}
+
+
+# ---- TASKS ----
+# Each task reads src_path and writes out_path; imports stay inside so a
+# worker only loads the modules its task needs.
+def task_compress_pdf(src_path, out_path):
+    import pdf_tools
+    with open(out_path, "wb") as out:
+        pdf_tools.compress_pdf(src_path, out)
+
+
+def task_rotate_pdf(src_path, out_path, rotation):
+    import pdf_tools
+    with open(out_path, "wb") as out:
+        pdf_tools.rotate_pdf(src_path, rotation, output=out)
+
+
+def task_watermark_pdf(src_path, out_path, text):
+    import pdf_tools
+    with open(out_path, "wb") as out:
+        pdf_tools.watermark_pdf(src_path, text, out)
+
+
+def task_protect_pdf(src_path, out_path, password):
+    import pdf_tools
+    with open(out_path, "wb") as out:
+        pdf_tools.protect_pdf(src_path, password, out)
+
+
+def task_pdf_text(src_path, out_path):
+    import pdf_tools
+    with open(out_path, "w", encoding="utf-8") as out:
+        out.write(pdf_tools.extract_text(src_path))
+
+
+def task_compress_image(src_path, out_path, quality, width=None, height=None):
+    from PIL import Image
+    import image_tools
+    with Image.open(src_path) as image:
+        data = image_tools.compress_image(image, quality, width, height)
+    with open(out_path, "wb") as out:
+        out.write(data)
+
+
+def task_filter_image(src_path, out_path, filter_type):
+    from PIL import Image
+    import image_tools
+    with Image.open(src_path) as image:
+        image_tools.apply_filter(image, filter_type).save(out_path, format="PNG")
+
+
+def task_upscale_image(src_path, out_path, scale):
+    from PIL import Image
+    import image_tools
+    with Image.open(src_path) as image:
+        image_tools.upscale_image(image, scale).save(out_path, format="PNG")
+
+
+def task_ocr(src_path, out_path, layout, preprocessing):
+    from PIL import Image
+    import ocr_text_tools
+    reader = ocr_text_tools.get_ocr_reader()
+    if reader is None and ocr_text_tools.pytesseract is None:
+        raise RuntimeError("No OCR engine installed (easyocr or pytesseract)")
+    image = Image.open(src_path).convert("RGB")
+    if preprocessing != "None":
+        image = ocr_text_tools.preprocess_image(image, preprocessing).convert("RGB")
+    with open(out_path, "w", encoding="utf-8") as out:
+        out.write(ocr_text_tools.extract_text(reader, image, layout))
+
+
+def task_convert(src_path, out_path, target):
+    source_format = converter_registry.format_for_path(src_path)
+    if source_format is None:
+        raise ValueError(f"Unknown input format: {src_path}")
+    with open(src_path, "rb") as src, open(out_path, "wb") as dst:
+        converter_registry.convert(src, source_format, target, dst)
+
+
+# name: (function, output extension, option names taken from the parsed args)
+TASKS = {
+    "compress-pdf": (task_compress_pdf, ".pdf", []),
+    "rotate-pdf": (task_rotate_pdf, ".pdf", ["rotation"]),
+    "watermark-pdf": (task_watermark_pdf, ".pdf", ["text"]),
+    "protect-pdf": (task_protect_pdf, ".pdf", ["password"]),
+    "pdf-text": (task_pdf_text, ".txt", []),
+    "compress-image": (task_compress_image, ".jpg", ["quality", "width", "height"]),
+    "filter-image": (task_filter_image, ".png", ["filter_type"]),
+    "upscale-image": (task_upscale_image, ".png", ["scale"]),
+    "ocr": (task_ocr, ".txt", ["layout", "preprocessing"]),
+    "convert": (task_convert, None, ["target"]),
+}
+
+
+def run_one(task, src_path, out_path, options):
+    """Run a task on one file in the current process and return its timing record."""
+    func = TASKS[task][0]
+    record = {"task": task, "input": src_path, "output": out_path,
+              "bytes_in": os.path.getsize(src_path)}
+    tmp_path = out_path + ".part"
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        func(src_path, tmp_path, **options)
+        os.replace(tmp_path, out_path)
+        record.update(status="ok", bytes_out=os.path.getsize(out_path))
+    except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        record.update(status="error", error=f"{type(e).__name__}: {e}")
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+# ---- INPUTS & OUTPUTS ----
+def expand_inputs(patterns):
+    """Files matching the given paths, folders or glob patterns, de-duplicated in order."""
+    paths = []
+    seen = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*")
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            key = os.path.abspath(path)
+            if os.path.isfile(path) and key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+def output_paths(paths, out_dir, ext):
+    """Mirror the inputs' folder layout under out_dir so equal file names never collide.
+
+    Inputs that would still share an output name once given the new
+    extension (x.md and x.html → x.txt) keep their own in front of it:
+    x.md.txt and x.html.txt. Raises ValueError if two inputs would still
+    be written to one file.
+    """
+    if not paths:
+        return []
+    dirs = [os.path.dirname(os.path.abspath(p)) for p in paths]
+    root = os.path.commonpath(dirs)
+    outputs = []
+    for path, folder in zip(paths, dirs):
+        name = os.path.basename(path)
+        stem, own_ext = os.path.splitext(name)
+        folder = os.path.join(out_dir, os.path.relpath(folder, root))
+        outputs.append((folder, name, os.path.normpath(os.path.join(folder, stem + (ext or own_ext)))))
+
+    taken = Counter(os.path.normcase(out) for _, _, out in outputs)
+    outputs = [os.path.normpath(os.path.join(folder, name + ext)) if taken[os.path.normcase(out)] > 1 else out
+               for folder, name, out in outputs]
+    clashes = [out for out, count in Counter(map(os.path.normcase, outputs)).items() if count > 1]
+    if clashes:
+        raise ValueError(f"several inputs would be written to {clashes[0]}; convert them separately")
+    return outputs
+
+
+# ---- MANIFEST ----
+def job_key(task, src_path, options):
+    """Digest identifying a job; changes when the input file or a non-secret option changes."""
+    stat = os.stat(src_path)
+    public = sorted((k, v) for k, v in options.items() if k not in SECRET_OPTIONS)
+    identity = json.dumps([task, os.path.abspath(src_path), stat.st_size, stat.st_mtime_ns, public], default=str)
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def load_manifest(path):
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn last line from an interrupted run
+            if entry.get("status") == "ok":
+                done.add(entry["key"])
+    return done
+
+
+# ---- RUNNER ----
+def run_batch(task, jobs, manifest_path, report, workers=1, resume=True):
+    """Run (src_path, out_path, options) jobs, skipping ones the manifest marks done.
+
+    Returns a summary dict.
+    """
+    done = load_manifest(manifest_path) if resume else set()
+    pending = []
+    skipped = 0
+    for src_path, out_path, options in jobs:
+        key = job_key(task, src_path, options)
+        if key in done and os.path.exists(out_path):
+            skipped += 1
+        else:
+            pending.append((key, src_path, out_path, options))
+
+    os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+    summary = {"task": task, "files": len(pending), "skipped": skipped, "ok": 0, "errors": 0}
+    start = time.perf_counter()
+
+    with open(manifest_path, "a", encoding="utf-8") as manifest:
+        def record_result(key, record):
+            summary["ok" if record["status"] == "ok" else "errors"] += 1
+            report.write(json.dumps(record) + "\n")
+            report.flush()
+            manifest.write(json.dumps({"key": key, **record}) + "\n")
+            manifest.flush()
+
+        if workers <= 1:
+            for key, src_path, out_path, options in pending:
+                record_result(key, run_one(task, src_path, out_path, options))
+        else:
+            # Keep a bounded window in flight so 10k inputs don't become 10k futures
+            queue = iter(pending)
+            in_flight = {}
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                while True:
+                    while len(in_flight) < workers * 4:
+                        job = next(queue, None)
+                        if job is None:
+                            break
+                        key, src_path, out_path, options = job
+                        in_flight[pool.submit(run_one, task, src_path, out_path, options)] = key
+                    if not in_flight:
+                        break
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record_result(in_flight.pop(future), future.result())
+
+    elapsed = time.perf_counter() - start
+    summary["seconds"] = round(elapsed, 3)
+    summary["files_per_second"] = round(summary["files"] / elapsed, 2) if elapsed and summary["files"] else 0
+    return summary
+
+
+# ---- COMMANDS ----
+def cmd_task(args):
+    # Never pick up earlier results when a ** pattern covers the output folder
+    out_root = os.path.abspath(args.out) + os.sep
+    paths = [p for p in expand_inputs(args.inputs) if not os.path.abspath(p).startswith(out_root)]
+    if not paths:
+        print("No input files matched", file=sys.stderr)
+        return 1
+
+    func, ext, option_names = TASKS[args.command]
+    if args.command == "convert":
+        ext = converter_registry.FORMATS[args.target][0]
+    options = {name: getattr(args, name) for name in option_names}
+    try:
+        outputs = output_paths(paths, args.out, ext)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    jobs = [(src, out, options) for src, out in zip(paths, outputs)]
+
+    manifest_path = args.manifest or os.path.join(args.out, MANIFEST_NAME)
+    report = sys.stdout if args.report == "-" else open(args.report, "a", encoding="utf-8")
+    try:
+        summary = run_batch(args.command, jobs, manifest_path, report,
+                            workers=args.jobs, resume=not args.force)
+    finally:
+        if report is not sys.stdout:
+            report.close()
+
+    print(json.dumps({"summary": summary}), file=sys.stderr)
+    return 1 if summary["errors"] else 0
+
+
+def cmd_merge(args):
+    import pdf_tools
+
+    paths = expand_inputs(args.inputs)
+    if len(paths) < 2:
+        print("Need at least two PDFs to merge", file=sys.stderr)
+        return 1
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    start = time.perf_counter()
+    with open(args.out, "wb") as out:
+        pdf_tools.merge_pdfs(paths, out)
+    record = {"task": "merge-pdf", "inputs": len(paths), "output": args.out,
+              "bytes_in": sum(os.path.getsize(p) for p in paths),
+              "bytes_out": os.path.getsize(args.out), "status": "ok",
+              "seconds": round(time.perf_counter() - start, 4)}
+    print(json.dumps(record))
+    return 0
+
+
+def cmd_routes(args):
+    for source in sorted(converter_registry.REGISTRY):
+        for target, route in sorted(converter_registry.reachable_targets(source).items()):
+            print(f"{source:>5} → {target:10} cost {converter_registry.route_cost(route):5.1f}  "
+                  f"via {converter_registry.describe_route(route)}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="batch_cli",
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="\n".join(__doc__.splitlines()[2:])
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("inputs", nargs="+", help="files, folders or glob patterns (quote ** patterns)")
+    common.add_argument("--out", default="output", help="output folder")
+    common.add_argument("--jobs", "-j", type=int, default=1, help="worker processes")
+    common.add_argument("--manifest", help=f"progress file (default OUT/{MANIFEST_NAME})")
+    common.add_argument("--report", default="-", help="JSON-lines timing output (default stdout)")
+    common.add_argument("--force", action="store_true", help="ignore the manifest and redo every file")
+
+    def task_parser(name, help_text):
+        p = sub.add_parser(name, parents=[common], help=help_text)
+        p.set_defaults(func=cmd_task)
+        return p
+
+    task_parser("compress-pdf", "compress PDF content streams")
+    p = task_parser("rotate-pdf", "rotate every page")
+    p.add_argument("--rotation", type=int, choices=[90, 180, 270], default=90)
+    p = task_parser("watermark-pdf", "stamp a diagonal text watermark")
+    p.add_argument("--text", default="CONFIDENTIAL")
+    p = task_parser("protect-pdf", "encrypt with a password")
+    p.add_argument("--password", default=os.environ.get("PDF_PASSWORD"),
+                   required="PDF_PASSWORD" not in os.environ, help="or set PDF_PASSWORD")
+    task_parser("pdf-text", "extract the text layer")
+
+    p = task_parser("compress-image", "re-encode as JPEG, optionally resized")
+    p.add_argument("--quality", type=int, default=75)
+    p.add_argument("--width", type=int)
+    p.add_argument("--height", type=int)
+    p = task_parser("filter-image", "apply an image filter")
+    p.add_argument("--filter", dest="filter_type", default="Sharpen",
+                   choices=["None", "Blur", "Sharpen", "Black & White", "Sepia",
+                            "Edge Detect", "Emboss", "Vintage"])
+    p = task_parser("upscale-image", "bicubic upscale")
+    p.add_argument("--scale", type=int, choices=[2, 3, 4], default=2)
+    p = task_parser("ocr", "extract text from images")
+    p.add_argument("--layout", choices=["Full page", "Text regions"], default="Text regions")
+    p.add_argument("--preprocessing", default="None",
+                   choices=["None", "Threshold", "Adaptive Threshold", "Noise Removal"])
+
+    p = task_parser("convert", "convert via the cheapest converter route")
+    p.add_argument("--to", dest="target", required=True, choices=sorted(converter_registry.FORMATS))
+
+    p = sub.add_parser("merge-pdf", help="merge PDFs, in name order, into one file")
+    p.add_argument("inputs", nargs="+")
+    p.add_argument("--out", default="merged.pdf", help="output PDF")
+    p.set_defaults(func=cmd_merge)
+
+    p = sub.add_parser("routes", help="list every available conversion route")
+    p.set_defaults(func=cmd_routes)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
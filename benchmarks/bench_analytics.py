@@ -0,0 +1,90 @@
+"""Study analytics aggregates: rebuilt per rerun vs kept up to date by StudyLog.
+
+Usage:
+    python benchmarks/bench_analytics.py [--sessions 100000]
+
+"rebuild" is the work Study Analytics and the Performance Dashboard used
+to do on every rerun: a DataFrame from the session list, a groupby for
+subjects, date parsing and a groupby for days, a sum over the list and
+seven scans for the weekly overview. StudyLog rolls the list up once,
+updates its totals on each logged session and caches the chart series
+until the next one.
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import study_log  # noqa: E402
+
+
+def best_of(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def rebuild(sessions, today):
+    df = pd.DataFrame(sessions)
+    df['duration'].sum()
+    df.groupby('subject')['duration'].sum().reset_index()
+    df['date'] = pd.to_datetime(df['date'])
+    df.groupby('date')['duration'].sum().reset_index()
+    sum(s['duration'] for s in sessions)
+    pd.DataFrame(sessions).groupby('subject')['duration'].sum().reset_index()
+    week_start = today - datetime.timedelta(days=today.weekday())
+    for i in range(7):
+        day = week_start + datetime.timedelta(days=i)
+        sum(1 for s in sessions if s['date'] == str(day))
+
+
+def read(log, today):
+    log.total
+    log.week_hours(today)
+    log.by_subject().reset_index()
+    log.daily().reset_index()
+    log.sessions_per_day(study_log.week_start(today))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    today = datetime.date.today()
+    subjects = [f"Subject {i}" for i in range(25)]
+    sessions = [{"subject": rng.choice(subjects), "duration": rng.choice([0.5, 1.0, 1.5, 2.0]),
+                 "date": str(today - datetime.timedelta(days=rng.randrange(5 * 365)))}
+                for _ in range(args.sessions)]
+
+    elapsed = best_of(lambda: study_log.StudyLog(sessions), 3)
+    log = study_log.StudyLog(sessions)
+    print(f"{args.sessions:,} sessions; one-time rollup of an existing list: {elapsed * 1000:.0f} ms")
+
+    rebuilt = best_of(lambda: rebuild(sessions, today))
+    cached = best_of(lambda: read(log, today), 50)
+    new = {"subject": "Subject 1", "duration": 1.0, "date": str(today)}
+
+    def log_and_read():
+        log.append(new)
+        read(log, today)
+    logged = best_of(log_and_read, 20)
+    print(f"{'per rerun':32} {'ms':>9}")
+    print(f"{'rebuild from the list':32} {rebuilt * 1000:9.1f}")
+    print(f"{'StudyLog, nothing new':32} {cached * 1000:9.3f}")
+    print(f"{'StudyLog, after logging one':32} {logged * 1000:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
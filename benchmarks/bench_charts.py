@@ -0,0 +1,98 @@
+"""Analytics figures per rerun: rebuilt with plotly express vs memoized and downsampled.
+
+Usage:
+    python benchmarks/bench_charts.py [--sessions 100000] [--days 1825]
+
+For each of the five analytics charts, times building the figure plus
+serializing its spec (what st.plotly_chart does with it every rerun) and
+reports the spec size. "before" is the old px call on every rerun; "first"
+is charts.figure() on new data; "rerun" is charts.figure() again with
+unchanged data. Browser-side render time is not measured here; the daily
+line goes from one point per day to at most charts.POINT_BUDGET, drawn
+with Scattergl.
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+import plotly.express as px
+import plotly.io as pio
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import charts  # noqa: E402
+import study_log  # noqa: E402
+
+
+def best_of(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=5 * 365)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    today = datetime.date.today()
+    log = study_log.StudyLog({"subject": f"Subject {rng.randrange(25)}", "duration": rng.choice([0.5, 1.0, 1.5, 2.0]),
+                              "date": str(today - datetime.timedelta(days=rng.randrange(args.days)))}
+                             for _ in range(args.sessions))
+    tasks = pd.DataFrame({'Status': ['Completed', 'Pending'], 'Count': [17, 33]})
+    week = pd.DataFrame({'Day': ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+                         'Sessions': log.sessions_per_day(study_log.week_start(today))})
+
+    cases = [
+        ("study_pie", log.by_subject(),
+         lambda s: px.pie(s.reset_index(), values='duration', names='subject', title='Study Time Distribution by Subject'),
+         None),
+        ("daily_line", log.daily(),
+         lambda s: px.line(s.reset_index(), x='date', y='duration', title='Daily Study Hours',
+                           labels={'duration': 'Hours', 'date': 'Date'}),
+         lambda s: charts.date_line(s, 'Daily Study Hours', 'Hours')),
+        ("subject_bar", log.by_subject(),
+         lambda s: px.bar(s.reset_index(), x='subject', y='duration', title='Hours by Subject',
+                          labels={'duration': 'Hours', 'subject': 'Subject'}),
+         None),
+        ("task_pie", tasks,
+         lambda d: px.pie(d, values='Count', names='Status', title='Task Status',
+                          color_discrete_sequence=['#00ff00', '#ff6b6b']),
+         None),
+        ("week_bar", week,
+         lambda d: px.bar(d, x='Day', y='Sessions', title='Study Sessions This Week',
+                          labels={'Sessions': 'Number of Sessions'}),
+         None),
+    ]
+    print(f"{args.sessions:,} sessions over {len(log.daily()):,} days")
+    print(f"{'chart':12} {'before ms':>10} {'first ms':>9} {'rerun ms':>9} {'before KB':>10} {'after KB':>9}")
+    totals = [0.0] * 5
+    for name, data, old, new in cases:
+        new = new or old
+        before = best_of(lambda: pio.to_json(old(data), validate=False))
+        before_kb = len(pio.to_json(old(data), validate=False)) / 1024
+
+        def first():
+            charts._figures.clear()
+            pio.to_json(charts.figure(name, data, new), validate=False)
+        cold = best_of(first)
+        warm = best_of(lambda: pio.to_json(charts.figure(name, data, new), validate=False), 20)
+        after_kb = len(pio.to_json(charts.figure(name, data, new), validate=False)) / 1024
+        row = [before * 1000, cold * 1000, warm * 1000, before_kb, after_kb]
+        totals = [t + r for t, r in zip(totals, row)]
+        print(f"{name:12} {row[0]:10.1f} {row[1]:9.1f} {row[2]:9.2f} {row[3]:10.1f} {row[4]:9.1f}")
+    print(f"{'total':12} {totals[0]:10.1f} {totals[1]:9.1f} {totals[2]:9.2f} {totals[3]:10.1f} {totals[4]:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Bytes of element payload sent per rerun, with the theme CSS inlined vs linked.
+
+Usage:
+    python benchmarks/bench_css_payload.py [--page study_resources] [--reruns 5]
+
+Sums the serialized size of every element in the rendered tree, which is
+what the server pushes over the websocket on each rerun. Inline mode
+(SUH_INLINE_CSS=1) is what runs when static serving is disabled. Linked
+mode sends the @import of app/static/theme.css instead.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+def tree_bytes(node):
+    total = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None:
+        total += proto.ByteSize()
+    for child in getattr(node, "children", {}).values():
+        total += tree_bytes(child)
+    return total
+
+
+def css_element_bytes(at):
+    for md in at.markdown:
+        if "suh-theme-" in md.value:
+            return md.proto.ByteSize()
+    return 0
+
+
+def measure(page, reruns):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.session_state["current_page"] = page
+    rows = []
+    for theme in ["dark", "light"] * reruns:
+        at.session_state["theme"] = theme
+        at.run()
+        rows.append((tree_bytes(at._tree), css_element_bytes(at)))
+    print(json.dumps({"total": sum(r[0] for r in rows) / len(rows),
+                      "css": sum(r[1] for r in rows) / len(rows)}))
+
+
+def run_mode(inline, page, reruns):
+    env = dict(os.environ, SUH_INLINE_CSS="1" if inline else "0")
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", "--page", page, "--reruns", str(reruns)],
+        env=env, cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page", default="study_resources")
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, ROOT)
+        measure(args.page, args.reruns)
+        return
+
+    inline = run_mode(True, args.page, args.reruns)
+    linked = run_mode(False, args.page, args.reruns)
+    print(f"{'mode':8} {'css B/rerun':>12} {'total B/rerun':>14}")
+    print(f"{'inline':8} {inline['css']:12,.0f} {inline['total']:14,.0f}")
+    print(f"{'linked':8} {linked['css']:12,.0f} {linked['total']:14,.0f}")
+    saved = inline["total"] - linked["total"]
+    print(f"saved {saved:,.0f} B per rerun per session ({saved / inline['total']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Startup time and memory of the reference data, JSON files vs the compiled store.
+
+Usage:
+    python benchmarks/bench_data_store.py [--sessions 50] [--procs 4]
+
+startup   time to load every reference file (json.load) vs opening the
+          store and reading the same top-level keys
+sessions  Python heap held by N sessions that each keep their own parsed
+          copy (tracemalloc) vs N sessions sharing one mapped store
+procs     unique set size (psutil USS) of N worker processes that each
+          hold the data, i.e. memory that is not shared between them
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import data_store  # noqa: E402
+
+
+def load_json():
+    docs = {}
+    for name in data_store.REFERENCE_FILES:
+        with open(data_store.DATA_DIR / name, encoding="utf-8") as f:
+            docs[name] = json.load(f)
+    return docs
+
+
+def load_store():
+    store = data_store.Store()
+    return {name: store.document(name) for name in data_store.REFERENCE_FILES}
+
+
+def touch(docs):
+    """What a page does: walk every value once."""
+    count = 0
+    stack = list(docs.values())
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (dict, data_store.FrozenDict)):
+            stack.extend(value.values())
+        elif isinstance(value, (list, data_store.FrozenList)):
+            stack.extend(value)
+        else:
+            count += 1
+    return count
+
+
+def bench_startup(repeat=30):
+    rows = {}
+    for label, loader in [("json", load_json), ("store", load_store)]:
+        open_times, walk_times = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            docs = loader()
+            opened = time.perf_counter()
+            touch(docs)
+            open_times.append(opened - start)
+            walk_times.append(time.perf_counter() - opened)
+        rows[label] = (statistics.median(open_times), statistics.median(walk_times))
+    return rows
+
+
+def bench_sessions(sessions):
+    rows = {}
+    for label, loader in [("json", load_json), ("store", None)]:
+        tracemalloc.start()
+        if loader is None:
+            shared = data_store.open_store()
+            held = [{name: shared.document(name) for name in data_store.REFERENCE_FILES}
+                    for _ in range(sessions)]
+        else:
+            held = [loader() for _ in range(sessions)]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rows[label] = current
+        del held
+    return rows
+
+
+def child(mode):
+    docs = load_json() if mode == "json" else load_store()
+    touch(docs)
+    print("ready", flush=True)
+    sys.stdin.readline()
+
+
+def bench_procs(procs):
+    import psutil
+
+    rows = {}
+    for mode in ("json", "store"):
+        children = [subprocess.Popen([sys.executable, __file__, "--child", mode],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+                    for _ in range(procs)]
+        try:
+            for p in children:
+                p.stdout.readline()
+            rows[mode] = sum(psutil.Process(p.pid).memory_full_info().uss for p in children)
+        finally:
+            for p in children:
+                p.communicate("\n")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--procs", type=int, default=4)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+
+    if data_store.open_store() is None:
+        data_store.build()
+
+    startup = bench_startup()
+    print(f"{'startup':10} {'load ms':>10} {'walk ms':>10}")
+    for label, (opened, walked) in startup.items():
+        print(f"{label:10} {opened * 1000:10.2f} {walked * 1000:10.2f}")
+
+    sessions = bench_sessions(args.sessions)
+    print(f"\n{args.sessions} sessions, Python heap held")
+    for label, size in sessions.items():
+        print(f"{label:10} {size / 1024:10,.0f} KiB")
+
+    try:
+        procs = bench_procs(args.procs)
+    except ImportError:
+        print("\npsutil not installed; skipping process USS")
+        return
+    print(f"\n{args.procs} processes, total USS")
+    for label, size in procs.items():
+        print(f"{label:10} {size / 1024 / 1024:10.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Build time, file size and lookup latency of the offline dictionary.
+
+Usage:
+    python benchmarks/bench_dictionary.py [--words 300000] [--source words.csv]
+
+Without --source a synthetic word list is generated (syllable soup, which
+is far denser than real English, so fuzzy timings are a worst case).
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import dictionary_engine  # noqa: E402
+
+SYLLABLES = ("ab ac al an ar be ca co de di el en er ex fa ga in is ka la le li lo ma me mi mo "
+             "na ne no on or pa pe pi po ra re ri ro sa se si so ta te ti to tr un ur va ve vi wa ze").split()
+
+
+def synthetic_csv(path, count, seed=1):
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 6))))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("word,pos,definition\n")
+        for word in words:
+            f.write(f"{word},noun,A synthetic headword used to benchmark lookups.\n")
+
+
+def timed(func, queries):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1e6, sorted(samples)[int(len(samples) * 0.99)] * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=300000)
+    parser.add_argument("--source", help="CSV/TSV/TXT word list instead of synthetic words")
+    parser.add_argument("--queries", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = args.source
+        if not source:
+            source = os.path.join(tmp, "words.csv")
+            synthetic_csv(source, args.words)
+        output = os.path.join(tmp, "bench.dict")
+
+        start = time.perf_counter()
+        count = dictionary_engine.build([source], output=output, base=None)
+        print(f"built {count:,} headwords in {time.perf_counter() - start:.1f}s: "
+              f"{os.path.getsize(output) / 1024 / 1024:.1f} MiB (source {os.path.getsize(source) / 1024 / 1024:.1f} MiB)")
+
+        tracemalloc.start()
+        dictionary = dictionary_engine.Dictionary(output)
+        print(f"open: {tracemalloc.get_traced_memory()[0]:,} B of Python heap (the rest is mmap)")
+        tracemalloc.stop()
+
+        rng = random.Random(2)
+        words = [dictionary.headword(rng.randrange(count)) for _ in range(args.queries)]
+        typos = [w[:-1] + ("x" if w[-1] != "x" else "y") for w in words]
+        print(f"{'operation':16} {'p50 us':>10} {'p99 us':>10}")
+        for label, func, queries in [
+            ("exact", dictionary.get, words),
+            ("prefix (3)", lambda w: dictionary.complete(w[:3]), words),
+            ("fuzzy (1 edit)", lambda w: dictionary.fuzzy(w, 1), typos),
+            ("fuzzy (default)", dictionary.fuzzy, typos),
+        ]:
+            p50, p99 = timed(func, queries)
+            print(f"{label:16} {p50:10.1f} {p99:10.1f}")
+        dictionary.close()
+
+
+if __name__ == "__main__":
+    main()
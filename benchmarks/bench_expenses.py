@@ -0,0 +1,115 @@
+"""Expense Tracker aggregates: list-of-dict loops vs the columnar ledger.
+
+Usage:
+    python benchmarks/bench_expenses.py [--rows 100000]
+
+The loop baseline is what the tracker did on every rerun: sum the list,
+build category totals in a dict and re-sort it for "Recent Expenses".
+The ledger timings are shown cold (first rerun after a change) and warm
+(memoized until the next change), plus a bank statement CSV import and
+the Parquet round trip.
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+
+import expense_ledger  # noqa: E402
+
+NARRATIONS = ["UPI-SWIGGY", "UBER TRIP", "AMAZON BOOKS", "NETFLIX.COM", "AIRTEL RECHARGE", "CAMPUS STORE"]
+
+# A signed amount column: only the negative row is money going out, whichever
+# chunk the credits land in
+SIGNED_STATEMENT = "Date,Narration,Amount\n01/01/2024,SALARY,5000\n02/01/2024,SWIGGY,-250\n03/01/2024,REFUND,100\n"
+
+
+def best_of(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def loop_rerun(expenses):
+    total = sum(exp["amount"] for exp in expenses)
+    category_totals = {}
+    for exp in expenses:
+        category_totals[exp["category"]] = category_totals.get(exp["category"], 0) + exp["amount"]
+    recent = sorted(expenses, key=lambda x: x["date"], reverse=True)[:10]
+    return total, category_totals, recent
+
+
+def ledger_rerun(ledger, month):
+    ledger.month_total(month)
+    ledger.by_category(month)
+    ledger.monthly(12)
+    ledger.rolling(30)
+    ledger.alerts(10_000)
+    return ledger.query("date", True, {}, "", 0, 10)
+
+
+def check_signs():
+    for chunksize in (1, 2, 50_000):
+        rows = pd.concat(expense_ledger.parse_statement(io.BytesIO(SIGNED_STATEMENT.encode()), chunksize=chunksize))
+        assert rows[["name", "amount"]].values.tolist() == [["SWIGGY", 250.0]], (chunksize, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    check_signs()
+    rng = random.Random(0)
+    today = pd.Timestamp.today().normalize()
+    records = [{"name": rng.choice(NARRATIONS), "amount": rng.randint(10, 2000),
+                "category": rng.choice(expense_ledger.CATEGORIES),
+                "date": str((today - pd.Timedelta(days=rng.randint(0, 1000))).date())}
+               for _ in range(args.rows)]
+    month = today.to_period("M")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = expense_ledger.Ledger(Path(tmp) / "expenses.parquet")
+        start = time.perf_counter()
+        ledger.add_records(records)
+        print(f"load {args.rows:,} expenses + write Parquet: {time.perf_counter() - start:.2f} s "
+              f"({ledger.path.stat().st_size / 2**20:.1f} MiB)")
+        start = time.perf_counter()
+        expense_ledger.Ledger(ledger.path)
+        print(f"reopen from Parquet: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        loop = best_of(lambda: loop_rerun(records))
+
+        def cold():
+            ledger._cache.clear()
+            ledger_rerun(ledger, month)
+
+        print(f"per rerun: loops {loop * 1000:.1f} ms   ledger cold {best_of(cold) * 1000:.1f} ms   "
+              f"ledger warm {best_of(lambda: ledger_rerun(ledger, month)) * 1000:.2f} ms")
+
+        lines = ["Txn Date,Narration,Withdrawal Amt.,Deposit Amt."]
+        for i in range(args.rows):
+            day = today - pd.Timedelta(days=rng.randint(0, 365))
+            lines.append(f"{day:%d/%m/%Y},{rng.choice(NARRATIONS)} {i},\"{rng.randint(10, 5000):,}.00\",")
+        statement = "\n".join(lines)
+        start = time.perf_counter()
+        added, duplicates = ledger.import_statement(io.StringIO(statement))
+        print(f"import {args.rows:,}-row statement: {time.perf_counter() - start:.2f} s ({added:,} added)")
+        start = time.perf_counter()
+        added, duplicates = ledger.import_statement(io.StringIO(statement))
+        print(f"re-import same statement: {time.perf_counter() - start:.2f} s ({duplicates:,} duplicates)")
+
+
+if __name__ == "__main__":
+    main()
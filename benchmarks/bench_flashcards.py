@@ -0,0 +1,101 @@
+"""Due-queue serving, review latency and bulk import on a large flashcard deck.
+
+Usage:
+    python benchmarks/bench_flashcards.py [--cards 50000]
+
+Builds a throwaway SQLite deck, then times opening it (heap build from
+(due, id) pairs), finding the next due card, and grading it, and reports
+the memory the in-process queue holds compared with the card rows. It
+then streams a CSV of the same size through flashcard_io (once fresh,
+once all duplicates), exports it, and times a card-list page.
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import flashcard_io  # noqa: E402
+import flashcard_store  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=50_000)
+    parser.add_argument("--reviews", type=int, default=2_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    now = time.time()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        deck = flashcard_store.Deck(path)
+        start = time.perf_counter()
+        with deck._db:
+            deck._db.executemany(
+                "INSERT INTO cards (question, answer, category, created, due) VALUES (?, ?, ?, ?, ?)",
+                ((f"Question {i} " + "x" * rng.randint(20, 200), f"Answer {i} " + "y" * rng.randint(20, 200),
+                  "General", now, now + rng.uniform(-30, 30) * flashcard_store.DAY)
+                 for i in range(args.cards)))
+        deck.close()
+        print(f"insert {args.cards:,} cards: {time.perf_counter() - start:.2f} s "
+              f"({os.path.getsize(path) / 2**20:.1f} MiB on disk)")
+
+        start = time.perf_counter()
+        deck = flashcard_store.Deck(path)
+        opened = time.perf_counter() - start
+        deck.close()
+        tracemalloc.start()
+        deck = flashcard_store.Deck(path)
+        queue_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"open deck (heap build): {opened * 1000:.1f} ms, queue holds {queue_bytes / 2**20:.1f} MiB")
+
+        start = time.perf_counter()
+        rows = [dict(r) for r in deck._query(f"SELECT {flashcard_store.CARD_COLUMNS} FROM cards")]
+        print(f"loading every card instead: {(time.perf_counter() - start) * 1000:.1f} ms for {len(rows):,} dicts")
+        del rows
+
+        serve = review = 0.0
+        for _ in range(args.reviews):
+            start = time.perf_counter()
+            card = deck.next_due(now)
+            serve += time.perf_counter() - start
+            if card is None:
+                break
+            start = time.perf_counter()
+            deck.review(card["id"], rng.choice(list(flashcard_store.GRADES.values())), now)
+            review += time.perf_counter() - start
+        print(f"next_due: {serve / args.reviews * 1e6:.0f} us   review: {review / args.reviews * 1e6:.0f} us "
+              f"(over {args.reviews:,} reviews)")
+        deck.close()
+
+        csv_data = "question,answer,category\r\n" + "".join(
+            f"Imported question {i},Answer {i},Subject {i % 12}\r\n" for i in range(args.cards))
+        deck = flashcard_store.Deck(os.path.join(tmp, "import.db"))
+        for label in ("import", "re-import"):
+            start = time.perf_counter()
+            report = flashcard_io.import_file(deck, io.BytesIO(csv_data.encode()), "csv")
+            print(f"{label} {len(csv_data) / 2**20:.1f} MiB CSV: {time.perf_counter() - start:.2f} s ({report})")
+
+        start = time.perf_counter()
+        size = len(flashcard_io.export_file(deck, "json").read())
+        print(f"export JSON: {time.perf_counter() - start:.2f} s ({size / 2**20:.1f} MiB)")
+
+        for search, category in (("", None), ("question 4999", None), ("", "Subject 3")):
+            start = time.perf_counter()
+            total = deck.count(search, category)
+            deck.page(search, category, 0, 100)
+            print(f"card list page (search={search!r}, category={category!r}): "
+                  f"{(time.perf_counter() - start) * 1000:.1f} ms, {total:,} matches")
+        deck.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Habit Tracker statistics per rerun: date-string lists vs habit_log bitsets.
+
+Usage:
+    python benchmarks/bench_habits.py [--habits 20] [--years 3]
+
+The list baseline is what the tracker used to do for every habit on every
+rerun: an O(n) `today in list` check and a full sort-and-walk for the
+streak. The bitset path reads incrementally maintained fields, and the
+26-week heatmap is built from the bitsets with NumPy.
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import habit_log  # noqa: E402
+
+
+def list_stats(log, today):
+    done_today = today.isoformat() in log
+    streak = 0
+    for i, log_date in enumerate(sorted(log, reverse=True)):
+        if log_date == (today - datetime.timedelta(days=i)).isoformat():
+            streak += 1
+        else:
+            break
+    return done_today, streak, len(log)
+
+
+def list_heatmap(logs, today, weeks=26):
+    first = today - datetime.timedelta(days=today.weekday() + 7 * (weeks - 1))
+    grid = [[0] * weeks for _ in range(7)]
+    for log in logs:
+        for day in log:
+            d = datetime.date.fromisoformat(day)
+            if first <= d <= today:
+                offset = (d - first).days
+                grid[offset % 7][offset // 7] += 1
+    return grid
+
+
+def best_of(func, repeat=20):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--habits", type=int, default=20)
+    parser.add_argument("--years", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    today = datetime.date.today()
+    days = 365 * args.years
+    lists = [[(today - datetime.timedelta(days=i)).isoformat() for i in range(days) if rng.random() < 0.7]
+             for _ in range(args.habits)]
+
+    start = time.perf_counter()
+    logs = [habit_log.HabitLog(log) for log in lists]
+    print(f"{args.habits} habits x {days} days: converted in {(time.perf_counter() - start) * 1000:.1f} ms, "
+          f"bitsets {sum(len(log.bits.to_bytes((log.bits.bit_length() + 7) // 8, 'little')) for log in logs):,} bytes")
+
+    before = best_of(lambda: [list_stats(log, today) for log in lists])
+    after = best_of(lambda: [(today in log, log.streak(today), len(log), log.longest, log.rate(30, today))
+                             for log in logs])
+    print(f"stats per rerun:  lists {before * 1000:7.2f} ms   bitsets {after * 1000:6.3f} ms  ({before / after:.0f}x)")
+
+    before = best_of(lambda: list_heatmap(lists, today), repeat=5)
+    after = best_of(lambda: habit_log.heatmap(logs, today=today))
+    print(f"26-week heatmap:  lists {before * 1000:7.2f} ms   bitsets {after * 1000:6.3f} ms  ({before / after:.0f}x)")
+
+    log = habit_log.HabitLog(lists[0])
+    elapsed = best_of(lambda: (log.unmark(today), log.mark(today)), repeat=200)
+    print(f"mark (after an unmark's full recount): {elapsed * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Throughput benchmark for the streaming HTML → Text / HTML → PDF pipeline.
+
+Usage:
+    python benchmarks/bench_html.py [--mb 5] [--file saved_page.html] [--trace-memory]
+
+Without --file a saved-web-page-like document is generated: inline scripts
+and styles, nested divs, lists, links and a large table.
+"""
+import argparse
+import io
+import os
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import render_engine
+
+SECTION = """
+<div class="post"><script>window.tracker = {{"id": 1, "html": "<p>not text</p>"}};</script>
+<style>.post {{ margin: 0 }} p {{ color: #333 }}</style>
+<h2>Section {n}</h2>
+<p>Lorem ipsum <b>dolor</b> sit amet, <a href="https://example.com/{n}">consectetur</a> adipiscing elit,
+sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. <i>Ut enim ad minim veniam</i>.</p>
+<ul><li>First point for {n}</li><li>Second point with <code>code()</code></li></ul>
+<table><tr><th>Name</th><th>Score</th></tr>{rows}</table>
+</div>
+"""
+
+
+# Known answers checked before timing: optional </td>, </th> and </tr>
+TABLE_CASES = [
+    ("<table><tr><th>a<th>b<tr><td>1<td>2</table>", [("table", [["a", "b"], ["1", "2"]], True)]),
+    ("<table><tr><td>1</td><td>2</td><tr><td>3</td><td>4</td></table>",
+     [("table", [["1", "2"], ["3", "4"]], False)]),
+]
+
+
+def check_tables():
+    for markup, expected in TABLE_CASES:
+        parser = render_engine.HTMLBlockParser()
+        parser.feed(markup)
+        parser.close()
+        assert parser.blocks == expected, (markup, parser.blocks)
+
+
+def synthetic_html(path, megabytes):
+    rows = "".join(f"<tr><td>Student {i}</td><td>{i * 7 % 100}</td></tr>" for i in range(20))
+    target = megabytes * 1024 * 1024
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("<html><head><title>Saved page</title><script>var big = 1;</script></head><body>")
+        n = 0
+        while f.tell() < target:
+            f.write(SECTION.format(n=n, rows=rows))
+            n += 1
+        f.write("</body></html>")
+
+
+def measure(label, size, fn, trace_memory):
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    line = f"{label:12} {size / 1024 / 1024:6.1f} MB in {elapsed:6.2f}s  {size / 1024 / 1024 / elapsed:6.2f} MB/s"
+    if trace_memory:
+        line += f"  peak heap {tracemalloc.get_traced_memory()[1] / 1024 / 1024:.1f} MB"
+        tracemalloc.stop()
+    print(line)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=5)
+    parser.add_argument("--file", help="HTML file to convert instead of the synthetic one")
+    parser.add_argument("--trace-memory", action="store_true")
+    args = parser.parse_args()
+
+    check_tables()
+    render_engine.get_styles()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = pathlib.Path(args.file or os.path.join(tmp, "page.html"))
+        if not args.file:
+            synthetic_html(path, args.mb)
+        size = path.stat().st_size
+
+        measure("HTML → Text", size, lambda: render_engine.html_to_text(path, io.StringIO()), args.trace_memory)
+        pages = measure("HTML → PDF", size, lambda: render_engine.html_to_pdf(path, io.BytesIO()), args.trace_memory)
+        print(f"  {pages} pages")
+
+
+if __name__ == "__main__":
+    main()
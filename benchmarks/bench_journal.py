@@ -0,0 +1,124 @@
+"""Journal search and mood trends over years of entries: index vs scanning.
+
+Usage:
+    python benchmarks/bench_journal.py [--years 5] [--words 150]
+
+Builds a throwaway journal with one entry a day, then times opening it
+(index build), re-indexing one saved entry, and each query through the
+inverted index against a scan over every entry (lowercase + substring/
+regex checks, date compare, mood average in a loop).
+"""
+import argparse
+import datetime
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import journal_store  # noqa: E402
+
+VOCABULARY = ("today exam stress study group physics lab report deadline friends coffee walk music read revise "
+              "quiz tired happy calm anxious project lecture library notes gym sleep family call plan goals "
+              "chemistry maths history essay presentation practice slow productive focus break").split()
+
+
+def best_of(func, repeat=50):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def scan(entries, phrase=None, words=(), mood=None, tag=None, after=None, before=None):
+    out = []
+    for date, data in entries.items():
+        text = data["entry"].lower()
+        if phrase and phrase not in text:
+            continue
+        if any(not re.search(r"\b" + re.escape(w), text) for w in words):
+            continue
+        if mood and data["mood"] != mood or tag and tag not in data["tags"]:
+            continue
+        if after and date < after or before and date > before:
+            continue
+        out.append(date)
+    return sorted(out, reverse=True)
+
+
+def scan_trend(entries):
+    months = {}
+    for date, data in entries.items():
+        months.setdefault(date[:7], []).append(journal_store.MOOD_SCORES[data["mood"]])
+    return sorted((k, statistics.fmean(v), len(v)) for k, v in months.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--words", type=int, default=150)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    # Zipf-like word frequencies: a few very common words, a long tail of rare ones
+    vocabulary = list(VOCABULARY) + [f"{rng.choice(VOCABULARY)[:4]}{i}" for i in range(5000)]
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    first = datetime.date.today() - datetime.timedelta(days=365 * args.years)
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = journal_store.Journal(Path(tmp) / "journal.db")
+        entries = {}
+        for i in range(365 * args.years):
+            date = str(first + datetime.timedelta(days=i))
+            words = rng.choices(vocabulary, weights, k=args.words)
+            entries[date] = {"entry": " ".join(words).capitalize() + ".", "mood": rng.choice(journal_store.MOODS),
+                             "tags": rng.sample(journal_store.TAGS, rng.randint(0, 2))}
+        with journal._db:
+            journal._db.executemany(
+                "INSERT INTO entries (date, entry, mood, tags, updated) VALUES (?, ?, ?, ?, 0)",
+                ((d, e["entry"], e["mood"], json.dumps(e["tags"]))
+                 for d, e in entries.items()))
+        journal.close()
+
+        start = time.perf_counter()
+        journal = journal_store.Journal(Path(tmp) / "journal.db")
+        print(f"{len(entries):,} entries x {args.words} words: index built in "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms, {len(journal._vocab)} distinct words")
+
+        date = str(first + datetime.timedelta(days=42))
+        data = entries[date]
+        elapsed = best_of(lambda: journal.save(date, data["entry"] + " edited", data["mood"], data["tags"]), 20)
+        print(f"save one entry (SQLite write + re-index): {elapsed * 1000:.2f} ms")
+        journal.save(date, data["entry"], data["mood"], data["tags"])
+
+        mid = str(first + datetime.timedelta(days=365))
+        end = str(first + datetime.timedelta(days=730))
+        cases = [
+            ("word prefix 'chem'", lambda: journal.search("chem"), lambda: scan(entries, words=["chem"])),
+            ('phrase "exam stress"', lambda: journal.search('"exam stress"'),
+             lambda: scan(entries, phrase="exam stress")),
+            ("phrase + 1 year range", lambda: journal.search('"exam stress"', after=mid, before=end),
+             lambda: scan(entries, phrase="exam stress", after=mid, before=end)),
+            ("mood + tag", lambda: journal.search(mood="🙂 Good", tags=["Goals"]),
+             lambda: scan(entries, mood="🙂 Good", tag="Goals")),
+            ("monthly mood trend", lambda: journal.mood_trend("M"), lambda: scan_trend(entries)),
+        ]
+        print(f"{'query':24} {'scan ms':>9} {'index ms':>9} {'matches':>8}")
+        for label, indexed, scanned in cases:
+            result = indexed()
+            if label != "monthly mood trend":
+                assert result == scanned(), label
+            print(f"{label:24} {best_of(scanned, 5) * 1000:9.2f} {best_of(indexed) * 1000:9.3f} {len(result):8,}")
+        journal.close()
+
+
+if __name__ == "__main__":
+    main()
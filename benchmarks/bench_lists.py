@@ -0,0 +1,117 @@
+"""List page queries at 10k items: list_view.ItemList indexes vs sort-and-filter.
+
+Usage:
+    python benchmarks/bench_lists.py [--items 10000] [--reruns 10]
+
+The baseline is what the pages used to do on every rerun: sort the whole
+list, filter it in Python and slice a page. The indexed path walks the
+sort index (or sorts just the matches when they are few). Finally each
+list page is rerun headlessly with AppTest at the same size.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import list_view  # noqa: E402
+
+PRIORITIES = ["🔴 High", "🟡 Medium", "🟢 Low"]
+WORDS = ["read", "chapter", "lab", "report", "revise", "essay", "quiz", "physics", "history", "maths"]
+
+
+def todos(n, rng):
+    return [{"task": f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}", "priority": rng.choice(PRIORITIES),
+             "completed": rng.random() < 0.3, "created": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 09:00"}
+            for i in range(n)]
+
+
+def naive(items, sort, descending, filters, search, offset, limit):
+    words = search.lower().split()
+    matches = [item for item in items
+               if all(item[k] == v for k, v in filters.items())
+               and all(any(w.startswith(q) for w in item["task"].lower().split()) for q in words)]
+    if sort:
+        matches.sort(key=lambda item: item[sort], reverse=descending)
+    return matches[offset:offset + limit], len(matches)
+
+
+def best_of(func, repeat=20):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def rerun_pages(n, reruns):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(1)
+    cases = [
+        ("student_utils", "To-Do List", "todo_list", todos(n, rng)),
+        ("learning_tools", "Assignment Tracker", "assignments",
+         [{"name": f"Assignment {i}", "subject": rng.choice(WORDS), "due_date": f"2026-11-{rng.randint(1, 28):02d}",
+           "priority": rng.choice(PRIORITIES), "status": "Not Started", "grade": "", "created": "2026-10-01"}
+          for i in range(n)]),
+        ("creative_tools", "Code Snippet Manager", "snippets",
+         [{"name": f"snippet {i}", "language": "Python", "code": "print()", "description": "",
+           "tags": "util", "created": "2026-10-01 10:00"} for i in range(n)]),
+        ("productivity_tools", "Expense Tracker", "expenses",
+         [{"name": f"expense {i}", "amount": rng.randint(1, 500), "category": "Food",
+           "date": f"2026-10-{rng.randint(1, 28):02d}"} for i in range(n)]),
+    ]
+    for page, tab, key, items in cases:
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+        at.session_state["current_page"] = page
+        at.session_state[f"tabs_{page}"] = tab
+        at.session_state[key] = items
+        at.run()  # converts the list and builds its indexes
+        elapsed = best_of(at.run, reruns)
+        if at.exception:
+            raise SystemExit(f"{page}: {at.exception[0].message}")
+        print(f"  {tab:22} {elapsed * 1000:7.1f} ms per rerun")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--reruns", type=int, default=10)
+    args = parser.parse_args()
+
+    data = todos(args.items, random.Random(0))
+    items = list_view.ItemList(sort=["created", "priority", "task"], index=["priority", "completed"], text=["task"])
+    start = time.perf_counter()
+    for item in data:
+        items.add(item)
+    print(f"index {args.items:,} items: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    queries = [
+        ("newest, first page", ("created", True, {}, "", 0, 20)),
+        ("newest, page 100", ("created", True, {}, "", 1980, 20)),
+        ("active, by priority", ("priority", False, {"completed": False}, "", 0, 20)),
+        ("high + done", ("created", True, {"priority": "🔴 High", "completed": True}, "", 0, 20)),
+        ("search 'lab rep'", ("created", True, {}, "lab rep", 0, 20)),
+    ]
+    print(f"{'query':22} {'sort+filter ms':>15} {'indexed ms':>11} {'speedup':>8}")
+    for label, query in queries:
+        expected = naive(data, *query)[1]
+        assert items.query(*query)[1] == expected, label
+        before = best_of(lambda: naive(data, *query))
+        after = best_of(lambda: items.query(*query))
+        print(f"{label:22} {before * 1000:15.2f} {after * 1000:11.3f} {before / after:7.0f}x")
+
+    item_id = items.find(completed=False)[0]
+    elapsed = best_of(lambda: (items.update(item_id, completed=True), items.update(item_id, completed=False)))
+    print(f"toggle one item (re-index): {elapsed / 2 * 1e6:.0f} us")
+
+    print(f"AppTest rerun with {args.items:,} items (paginated):")
+    rerun_pages(args.items, args.reruns)
+
+
+if __name__ == "__main__":
+    main()
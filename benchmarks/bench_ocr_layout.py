@@ -0,0 +1,83 @@
+"""Compare full-page OCR against text-region OCR on a folder of scans.
+
+Usage:
+    python benchmarks/bench_ocr_layout.py "scans/*.png" [--repeat 1]
+
+If a ``<image>.txt`` file sits next to an image it is used as ground truth,
+otherwise the full-page output is the reference for the region mode.
+"""
+import argparse
+import difflib
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PIL import Image
+
+import ocr_text_tools
+
+
+def similarity(a, b):
+    return difflib.SequenceMatcher(None, " ".join(a.split()), " ".join(b.split())).ratio()
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pattern", help="glob of images to OCR")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(args.pattern))
+    if not paths:
+        sys.exit(f"No images match {args.pattern}")
+
+    reader = ocr_text_tools.get_ocr_reader()
+    if reader is None and ocr_text_tools.pytesseract is None:
+        sys.exit("Neither EasyOCR nor pytesseract is installed")
+
+    totals = {"Full page": 0.0, "Text regions": 0.0}
+    scores = {"Full page": [], "Text regions": []}
+
+    print(f"{'image':30} {'full s':>8} {'roi s':>8} {'speedup':>8} {'full acc':>9} {'roi acc':>8}")
+    for path in paths:
+        image = Image.open(path).convert("RGB")
+        truth_path = os.path.splitext(path)[0] + ".txt"
+        truth = open(truth_path, encoding="utf-8").read() if os.path.exists(truth_path) else None
+
+        full_t, full_text = timed(lambda: ocr_text_tools.extract_text(reader, image, "Full page"), args.repeat)
+        roi_t, roi_text = timed(lambda: ocr_text_tools.extract_text(reader, image, "Text regions"), args.repeat)
+
+        reference = truth if truth is not None else full_text
+        full_acc = similarity(full_text, reference)
+        roi_acc = similarity(roi_text, reference)
+
+        totals["Full page"] += full_t
+        totals["Text regions"] += roi_t
+        scores["Full page"].append(full_acc)
+        scores["Text regions"].append(roi_acc)
+
+        print(f"{os.path.basename(path)[:30]:30} {full_t:8.2f} {roi_t:8.2f} "
+              f"{full_t / roi_t if roi_t else 0:7.1f}x {full_acc:9.3f} {roi_acc:8.3f}")
+
+    print()
+    for mode in totals:
+        mean_acc = sum(scores[mode]) / len(scores[mode])
+        print(f"{mode:13} total {totals[mode]:.2f}s  "
+              f"{len(paths) / totals[mode] if totals[mode] else 0:.2f} img/s  mean accuracy {mean_acc:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Pages-per-second benchmark for the DOCX/Markdown → PDF renderer.
+
+Usage:
+    python benchmarks/bench_render.py [--chapters 30] [--docx thesis.docx] [--markdown notes.md]
+
+Without input files a synthetic thesis (headings, body text, lists and a
+table per chapter) is generated in memory. Peak Python heap is measured
+with tracemalloc when --trace-memory is given.
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import render_engine
+
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud "
+    "exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. "
+)
+
+# Inline markup reportlab rejects (overlapping emphasis, a quote in a link
+# URL) in every kind of Markdown block; each must still render
+MALFORMED_MARKDOWN = [
+    "**a *b** c*",
+    "# **a *b** c*",
+    "Title **a *b** c*\n===",
+    "- [link](http://example.com/a\"b)",
+    "1. **a *b** c*",
+    "> **a *b** c*",
+    "| **a *b** c* | b |\n|---|---|\n| 1 | [link](http://example.com/a\"b) |",
+]
+
+
+def synthetic_docx(chapters):
+    from docx import Document
+
+    doc = Document()
+    doc.add_heading("Synthetic Thesis", 0)
+    for c in range(chapters):
+        doc.add_heading(f"Chapter {c + 1}", 1)
+        for s in range(4):
+            doc.add_heading(f"Section {c + 1}.{s + 1}", 2)
+            for _ in range(12):
+                p = doc.add_paragraph(LOREM * 2)
+                p.add_run(" Emphasised result.").bold = True
+            for i in range(5):
+                doc.add_paragraph(f"Point {i + 1}: {LOREM[:80]}", style="List Bullet")
+        table = doc.add_table(rows=20, cols=4)
+        for r, row in enumerate(table.rows):
+            for k, cell in enumerate(row.cells):
+                cell.text = f"R{r} C{k}"
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def synthetic_markdown(chapters):
+    lines = ["# Synthetic Thesis", ""]
+    for c in range(chapters):
+        lines += [f"## Chapter {c + 1}", ""]
+        for s in range(4):
+            lines += [f"### Section {c + 1}.{s + 1}", ""]
+            for _ in range(12):
+                lines += [LOREM * 2 + "**Emphasised result.**", ""]
+            lines += [f"- Point {i + 1}: {LOREM[:80]}" for i in range(5)] + [""]
+        lines += ["```python", "def f(x):", "    return x * 2", "```", ""]
+        lines += ["| A | B | C | D |", "|---|---|---|---|"]
+        lines += [f"| R{r} | 1 | 2 | 3 |" for r in range(20)] + [""]
+    return "\n".join(lines)
+
+
+def run(name, convert, trace_memory):
+    output = io.BytesIO()
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    pages = convert(output)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    line = (f"{name:9} {pages:5d} pages  {elapsed:7.2f}s  {pages / elapsed:7.1f} pages/s  "
+            f"{len(output.getvalue()) / 1024 / 1024:6.2f} MB out")
+    if peak is not None:
+        line += f"  peak heap {peak / 1024 / 1024:.1f} MB"
+    print(line)
+
+
+def quoted_link_docx():
+    """A DOCX whose hyperlink target contains double quotes."""
+    from docx import Document
+    from docx.opc.constants import RELATIONSHIP_TYPE
+    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn
+
+    doc = Document()
+    paragraph = doc.add_paragraph("See ")
+    link = OxmlElement("w:hyperlink")
+    link.set(qn("r:id"), paragraph.part.relate_to('https://example.com/?q="hi"', RELATIONSHIP_TYPE.HYPERLINK,
+                                                  is_external=True))
+    run = OxmlElement("w:r")
+    text = OxmlElement("w:t")
+    text.text = "the search"
+    run.append(text)
+    link.append(run)
+    paragraph._p.append(link)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+def check_malformed():
+    for markdown in MALFORMED_MARKDOWN:
+        assert render_engine.markdown_to_pdf(markdown, io.BytesIO()) == 1, markdown
+    assert render_engine.docx_to_pdf(quoted_link_docx(), io.BytesIO()) == 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chapters", type=int, default=30)
+    parser.add_argument("--docx", help="DOCX file to convert instead of the synthetic one")
+    parser.add_argument("--markdown", help="Markdown file to convert instead of the synthetic one")
+    parser.add_argument("--trace-memory", action="store_true")
+    args = parser.parse_args()
+
+    # Warm the font and style caches so they are not billed to the first run
+    render_engine.get_styles()
+    check_malformed()
+
+    docx_source = args.docx or synthetic_docx(args.chapters)
+    run("DOCX", lambda out: render_engine.docx_to_pdf(docx_source, out), args.trace_memory)
+
+    if args.markdown:
+        with open(args.markdown, encoding="utf-8") as f:
+            run("Markdown", lambda out: render_engine.markdown_to_pdf(f, out), args.trace_memory)
+    else:
+        md = synthetic_markdown(args.chapters)
+        run("Markdown", lambda out: render_engine.markdown_to_pdf(md, out), args.trace_memory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Rerun latency per page, eager tabs (every body runs) vs lazy tabs.
+
+Usage:
+    python benchmarks/bench_reruns.py [--reruns 20] [--pages student_utils analytics_tools]
+
+Each mode runs in its own subprocess because SUH_EAGER_TABS is read at
+import. Pages are driven headlessly with streamlit.testing's AppTest and
+sample study sessions and to-dos are seeded so the chart tabs have
+data to draw.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+PAGES = [
+    "image_tools", "pdf_tools", "ocr_text", "student_utils", "file_manager",
+    "file_converter", "learning_tools", "productivity_tools", "analytics_tools",
+    "creative_tools", "utility_tools", "study_resources", "extra_tools",
+]
+
+
+def seed(at):
+    import datetime
+
+    today = datetime.date.today()
+    at.session_state["study_sessions"] = [
+        {"subject": f"Subject {i % 6}", "duration": 1.0 + i % 3,
+         "date": str(today - datetime.timedelta(days=i % 30))}
+        for i in range(300)
+    ]
+    at.session_state["todo_list"] = [
+        {"task": f"Task {i}", "priority": "Medium", "completed": i % 3 == 0,
+         "created": f"{today} 09:00"}
+        for i in range(50)
+    ]
+
+
+def measure(pages, reruns):
+    """Runs inside the subprocess; prints {page: [seconds, ...]} as JSON."""
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    for page in pages:
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+        seed(at)
+        at.session_state["current_page"] = page
+        at.run()  # warm imports and caches
+        samples = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            at.run()
+            samples.append(time.perf_counter() - start)
+        if at.exception:
+            raise SystemExit(f"{page}: {at.exception[0].message}")
+        results[page] = samples
+    print(json.dumps(results))
+
+
+def run_mode(eager, pages, reruns):
+    env = dict(os.environ, SUH_EAGER_TABS="1" if eager else "0", SUH_PROFILE="0")
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", "--reruns", str(reruns), "--pages", *pages],
+        env=env, cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--pages", nargs="+", default=PAGES)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, ROOT)
+        measure(args.pages, args.reruns)
+        return
+
+    eager = run_mode(True, args.pages, args.reruns)
+    lazy = run_mode(False, args.pages, args.reruns)
+
+    print(f"{'page':20} {'eager ms':>10} {'lazy ms':>10} {'speedup':>8}")
+    for page in args.pages:
+        before = statistics.median(eager[page]) * 1000
+        after = statistics.median(lazy[page]) * 1000
+        print(f"{page:20} {before:10.1f} {after:10.1f} {before / after:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Throughput benchmark for streaming CSV ↔ Excel conversion.
+
+Usage:
+    python benchmarks/bench_sheets.py [--rows 2000000] [--sheet-rows 1048576] [--trace-memory]
+
+Generates an attendance-style CSV in a temp directory, converts it to XLSX
+(splitting sheets at --sheet-rows) and back to CSV, and prints rows/s.
+"""
+import argparse
+import csv
+import datetime
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import sheet_engine
+
+
+def write_csv(path, rows):
+    start = datetime.date(2024, 1, 1)
+    rng = random.Random(42)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["roll_no", "name", "date", "present", "score"])
+        for i in range(rows):
+            writer.writerow([
+                f"0{i % 90000 + 10000}",
+                f"Student {i % 5000}",
+                (start + datetime.timedelta(days=i % 365)).isoformat(),
+                rng.randint(0, 1),
+                round(rng.random() * 100, 2),
+            ])
+
+
+def check_rectangular():
+    """Rows with trailing blanks must come back as wide as the header."""
+    xlsx = io.BytesIO()
+    sheet_engine.csv_to_xlsx(io.StringIO("id,name,n,note\n008,b,2\n009,c,3,x\n"), xlsx, preview_rows=0)
+    xlsx.seek(0)
+    output = io.StringIO(newline="")
+    sheet_engine.xlsx_to_csv(xlsx, output)
+    rows = list(csv.reader(io.StringIO(output.getvalue())))
+    assert [len(row) for row in rows] == [4, 4, 4], rows
+
+
+def measure(label, rows, fn, trace_memory):
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    line = f"{label:12} {rows:>10,} rows  {elapsed:7.2f}s  {rows / elapsed:>10,.0f} rows/s"
+    if trace_memory:
+        line += f"  peak heap {tracemalloc.get_traced_memory()[1] / 1024 / 1024:.1f} MB"
+        tracemalloc.stop()
+    print(line)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--sheet-rows", type=int, default=sheet_engine.EXCEL_MAX_ROWS)
+    parser.add_argument("--trace-memory", action="store_true")
+    args = parser.parse_args()
+
+    check_rectangular()
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "attendance.csv")
+        xlsx_path = os.path.join(tmp, "attendance.xlsx")
+        out_path = os.path.join(tmp, "roundtrip.csv")
+
+        write_csv(csv_path, args.rows)
+        print(f"input CSV {os.path.getsize(csv_path) / 1024 / 1024:.1f} MB")
+
+        result = measure("CSV → Excel", args.rows,
+                         lambda: sheet_engine.csv_to_xlsx(csv_path, xlsx_path, max_rows=args.sheet_rows),
+                         args.trace_memory)
+        print(f"  {result['sheets']} sheet(s), types {result['column_types']}")
+
+        def to_csv():
+            with open(out_path, "w", newline="", encoding="utf-8") as f:
+                return sheet_engine.xlsx_to_csv(xlsx_path, f)
+
+        measure("Excel → CSV", min(args.rows, args.sheet_rows - 1), to_csv, args.trace_memory)
+
+
+if __name__ == "__main__":
+    main()
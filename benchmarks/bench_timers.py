@@ -0,0 +1,61 @@
+"""Server work for one timed session: a rerun per second vs browser-side ticking.
+
+Usage:
+    python benchmarks/bench_timers.py [--reruns 20] [--minutes 25]
+
+Times a rerun of each timer tab with streamlit.testing's AppTest while
+its timer is running. A server-side tick would pay that once a second
+for the whole session; with timers.py the browser ticks and the server
+reruns only on start and on completion (pause and resume add one each).
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+TABS = [
+    ("student_utils", "Countdown Timer", "countdown_start"),
+    ("student_utils", "Stopwatch", "sw_start"),
+    ("student_utils", "Pomodoro Timer", "pomodoro_start"),
+    ("productivity_tools", "Focus Mode", "focus_start"),
+]
+
+
+def rerun_ms(page, tab, start_key, reruns):
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.session_state["current_page"] = page
+    at.session_state[f"tabs_{page}"] = tab
+    at.run()
+    at.button(key=start_key).click().run()
+    times = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+    assert not at.exception, at.exception
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--minutes", type=int, default=25)
+    args = parser.parse_args()
+
+    seconds = args.minutes * 60
+    print(f"{args.minutes}-minute session, server CPU per user:")
+    print(f"{'tab':18} {'rerun ms':>9} {'tick/second':>13} {'browser tick':>13}")
+    for page, tab, start_key in TABS:
+        ms = rerun_ms(page, tab, start_key, args.reruns)
+        print(f"{tab:18} {ms:9.1f} {ms * seconds / 1000:12.1f}s {ms * 2 / 1000:12.3f}s")
+    print(f"(tick/second = {seconds} reruns; browser tick = 2: start and completion, or stop)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Values converted per second: vectorized unit_engine vs a per-value Python loop.
+
+Usage:
+    python benchmarks/bench_units.py [--values 5000000]
+
+The loop mirrors the old converter (one multiply per value in Python);
+the vectorized path is one NumPy pass per column, including the affine
+temperature case.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import unit_engine  # noqa: E402
+
+CASES = [("mi", "km"), ("°F", "°C"), ("psi", "kPa"), ("kg*m^2/s^2", "kWh")]
+
+
+def best_of(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=5_000_000)
+    args = parser.parse_args()
+
+    registry = unit_engine.REGISTRY
+    values = np.random.default_rng(0).uniform(-50, 150, args.values)
+    as_list = values[:min(args.values, 500_000)].tolist()
+
+    print(f"{'conversion':22} {'loop M/s':>10} {'numpy M/s':>10} {'speedup':>8}")
+    for source, target in CASES:
+        factor, shift = registry.factors(source, target)
+        loop = best_of(lambda: [v * factor + shift for v in as_list], repeat=1)
+        vectorized = best_of(lambda: registry.convert(values, source, target))
+        loop_rate = len(as_list) / loop / 1e6
+        numpy_rate = len(values) / vectorized / 1e6
+        print(f"{source + ' → ' + target:22} {loop_rate:10.1f} {numpy_rate:10.1f} {numpy_rate / loop_rate:7.0f}x")
+
+    lookups = 100_000
+    elapsed = best_of(lambda: [registry.factors("ft", "m") for _ in range(lookups)])
+    print(f"table lookup: {elapsed / lookups * 1e6:.2f} us per unit pair")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Memoized, size-bounded plotly figures for the analytics charts.
+
+figure(name, data, build) hands back the figure build() made the last
+time the same data was charted (matched by a fingerprint of its values),
+so an unchanged chart costs a hash instead of a rebuild. The spec
+st.plotly_chart sends is then byte-identical from rerun to rerun, and
+Streamlit's message cache lets the browser reuse anything over 10 KB
+it already has.
+
+Date series longer than POINT_BUDGET are reduced with LTTB (Largest
+Triangle Three Buckets), which keeps the peaks and dips plain striding
+would drop, and large ones are drawn with Scattergl (WebGL).
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+import perf_monitor
+
+POINT_BUDGET = 1000     # points per line trace after downsampling
+WEBGL_POINTS = 1000     # series longer than this are drawn with Scattergl
+MAX_FIGURES = 64        # memoized figures kept per process
+
+_figures = OrderedDict()
+_lock = threading.Lock()
+
+
+def fingerprint(data):
+    """Digest of a Series/DataFrame's values, index and names (or of repr(data))."""
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+        names = list(data.columns) if isinstance(data, pd.DataFrame) else [data.name]
+        digest.update(repr((names, data.index.names)).encode())
+    else:
+        digest.update(repr(data).encode())
+    return digest.hexdigest()
+
+
+def figure(name, data, build):
+    """build(data), memoized per process by name and data fingerprint.
+
+    Figures are shared between sessions, so callers must not modify them.
+    """
+    key = (name, fingerprint(data))
+    with _lock:
+        fig = _figures.get(key)
+        if fig is not None:
+            _figures.move_to_end(key)
+            return fig
+    with perf_monitor.timer(f"plotly.{name}"):
+        fig = build(data)
+    with _lock:
+        _figures[key] = fig
+        while len(_figures) > MAX_FIGURES:
+            _figures.popitem(last=False)
+    return fig
+
+
+def lttb(x, y, threshold):
+    """Indices of the `threshold` points Largest-Triangle-Three-Buckets keeps.
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the point
+    kept before it and the average of the next bucket.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype="float64")
+    y = np.asarray(y, dtype="float64")
+    edges = np.arange(threshold - 1, dtype=np.int64) * (n - 2) // (threshold - 2) + 1
+    keep = np.empty(threshold, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[hi:next_hi].mean(), y[hi:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def date_line(series, title, y_label, budget=POINT_BUDGET):
+    """Line chart of a date-indexed Series, downsampled and WebGL when large."""
+    dates, values = series.index, series.to_numpy(dtype="float64")
+    large = len(series) > WEBGL_POINTS
+    if len(series) > budget:
+        keep = lttb(dates.asi8, values, budget)
+        dates, values = dates[keep], values[keep]
+    trace = (go.Scattergl if large else go.Scatter)(
+        x=dates.strftime("%Y-%m-%d"), y=values.astype("float32"), mode="lines",
+        hovertemplate="%{x|%d %b %Y}: %{y:.2f}<extra></extra>")
+    fig = go.Figure(trace)
+    fig.update_layout(title=title, xaxis_title="Date", yaxis_title=y_label)
+    return fig
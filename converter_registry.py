@@ -0,0 +1,262 @@
+import heapq
+import importlib.util
+import os
+import shutil
+import tempfile
+import zipfile
+from collections import namedtuple
+
+import render_engine
+import sheet_engine
+
+# Intermediate results stay in memory up to this size, then spill to a temp file
+SPOOL_LIMIT = 16 * 1024 * 1024
+
+Converter = namedtuple("Converter", "name source target cost func needs_text drops_text")
+
+REGISTRY = {}
+
+EXTENSIONS = {
+    ".html": "html", ".htm": "html",
+    ".md": "md", ".markdown": "md",
+    ".txt": "txt",
+    ".docx": "docx",
+    ".pdf": "pdf",
+    ".csv": "csv",
+    ".xlsx": "xlsx",
+    ".png": "png",
+    ".jpg": "jpg", ".jpeg": "jpg",
+}
+
+# Output file extension and MIME type per format
+FORMATS = {
+    "html": (".html", "text/html"),
+    "md": (".md", "text/markdown"),
+    "txt": (".txt", "text/plain"),
+    "docx": (".docx", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    "pdf": (".pdf", "application/pdf"),
+    "csv": (".csv", "text/csv"),
+    "xlsx": (".xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "png": (".png", "image/png"),
+    "jpg": (".jpg", "image/jpeg"),
+    "png-pages": ("_pages.zip", "application/zip"),
+}
+
+
+def register(source, target, cost, needs_text=False, drops_text=False):
+    """Decorator adding func(input_file, output_file) as a source → target edge.
+
+    Both arguments are seekable binary files; cost is a relative estimate
+    used by the router (roughly seconds per typical document). Direct
+    converters are priced below lossy detours through plain text so the
+    router never drops formatting to save a hop.
+
+    needs_text marks converters that read an existing text layer (PDF text
+    extraction), drops_text ones whose output has none (an image saved as a
+    PDF). Routes never run the first kind after the second: that would only
+    extract blank pages.
+    """
+    def decorator(func):
+        REGISTRY.setdefault(source, []).append(
+            Converter(func.__name__, source, target, cost, func, needs_text, drops_text))
+        return func
+    return decorator
+
+
+def format_for_path(path):
+    return EXTENSIONS.get(os.path.splitext(str(path))[1].lower())
+
+
+def new_artifact():
+    return tempfile.SpooledTemporaryFile(max_size=SPOOL_LIMIT)
+
+
+class TextSink:
+    """Text stream facade that encodes UTF-8 into a binary file it does not own."""
+
+    def __init__(self, output):
+        self._output = output
+
+    def write(self, text):
+        self._output.write(text.encode("utf-8"))
+        return len(text)
+
+
+# ---- ROUTING ----
+def find_route(source, target):
+    """Cheapest chain of converters from source to target format (Dijkstra), or None."""
+    if source == target:
+        return []
+    # A state is a format plus whether the route so far has dropped the text
+    queue = [(0, 0, source, False, [])]
+    best = {(source, False): 0}
+    counter = 1
+    while queue:
+        cost, _, fmt, textless, path = heapq.heappop(queue)
+        if fmt == target:
+            return path
+        if cost > best.get((fmt, textless), float("inf")):
+            continue
+        for conv in REGISTRY.get(fmt, []):
+            if textless and conv.needs_text:
+                continue
+            state = (conv.target, textless or conv.drops_text)
+            new_cost = cost + conv.cost
+            if new_cost < best.get(state, float("inf")):
+                best[state] = new_cost
+                heapq.heappush(queue, (new_cost, counter, *state, path + [conv]))
+                counter += 1
+    return None
+
+
+def reachable_targets(source):
+    """Every format reachable from source, mapped to its cheapest route."""
+    routes = {}
+    for target in FORMATS:
+        if target != source:
+            route = find_route(source, target)
+            if route:
+                routes[target] = route
+    return routes
+
+
+def route_cost(route):
+    return sum(conv.cost for conv in route)
+
+
+def describe_route(route):
+    if not route:
+        return ""
+    return " → ".join([route[0].source] + [conv.target for conv in route])
+
+
+def run_route(route, source, output):
+    """Run each hop, handing intermediates over as spooled files. source/output are binary files."""
+    current = source
+    for i, conv in enumerate(route):
+        last = i == len(route) - 1
+        target = output if last else new_artifact()
+        conv.func(current, target)
+        if current is not source:
+            current.close()
+        if not last:
+            target.seek(0)
+        current = target
+    return output
+
+
+def convert(source, source_format, target_format, output):
+    """Convert a binary file between formats along the cheapest route. Returns the route."""
+    route = find_route(source_format, target_format)
+    if route is None:
+        raise ValueError(f"No converter path from {source_format} to {target_format}")
+    if not route:
+        shutil.copyfileobj(source, output)
+        return route
+    run_route(route, source, output)
+    return route
+
+
+# ---- CONVERTERS ----
+@register("html", "txt", cost=1)
+def html_to_txt(data, output):
+    render_engine.html_to_text(data, TextSink(output))
+
+
+@register("html", "pdf", cost=3.5)
+def html_to_pdf(data, output):
+    render_engine.html_to_pdf(data, output)
+
+
+@register("md", "pdf", cost=3)
+def md_to_pdf(data, output):
+    # Binary line iteration; the Markdown parser decodes each line itself
+    render_engine.markdown_to_pdf(data, output)
+
+
+@register("md", "txt", cost=0.5)
+def md_to_txt(data, output):
+    shutil.copyfileobj(data, output)
+
+
+@register("txt", "pdf", cost=3)
+def txt_to_pdf(data, output):
+    render_engine.text_to_pdf(data, output)
+
+
+@register("docx", "pdf", cost=3.5)
+def docx_to_pdf(data, output):
+    render_engine.docx_to_pdf(data, output)
+
+
+@register("docx", "txt", cost=1)
+def docx_to_txt(data, output):
+    from docx import Document
+    from docx.table import Table
+
+    text = TextSink(output)
+    for block in Document(data).iter_inner_content():
+        if isinstance(block, Table):
+            for row in block.rows:
+                text.write("\t".join(cell.text for cell in row.cells) + "\n")
+        else:
+            text.write(block.text + "\n")
+
+
+@register("csv", "xlsx", cost=3)
+def csv_to_xlsx(data, output):
+    sheet_engine.csv_to_xlsx(data, output, preview_rows=0)
+
+
+@register("xlsx", "csv", cost=3)
+def xlsx_to_csv(data, output):
+    sheet_engine.xlsx_to_csv(data, TextSink(output), preview_rows=0)
+
+
+@register("pdf", "txt", cost=2, needs_text=True)
+def pdf_to_txt(data, output):
+    import pdfplumber
+
+    text = TextSink(output)
+    with pdfplumber.open(data) as pdf:
+        for page in pdf.pages:
+            text.write((page.extract_text() or "") + "\n\n")
+            page.flush_cache()
+
+
+def _image_to_pdf(data, output):
+    from PIL import Image
+
+    image = Image.open(data)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    image.save(output, format="PDF")
+
+
+register("png", "pdf", cost=1, drops_text=True)(_image_to_pdf)
+register("jpg", "pdf", cost=1, drops_text=True)(_image_to_pdf)
+
+
+if importlib.util.find_spec("fitz"):
+    @register("pdf", "png-pages", cost=4)
+    def pdf_to_png_pages(data, output):
+        import fitz
+
+        doc = fitz.open(stream=data.read(), filetype="pdf")
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_STORED) as archive:
+            for page_num in range(len(doc)):
+                pix = doc[page_num].get_pixmap(dpi=150)
+                archive.writestr(f"page_{page_num + 1}.png", pix.tobytes("png"))
+
+
+if importlib.util.find_spec("easyocr") or importlib.util.find_spec("pytesseract"):
+    def _image_to_txt(data, output):
+        from PIL import Image
+        import ocr_text_tools
+
+        reader = ocr_text_tools.get_ocr_reader()
+        image = Image.open(data).convert("RGB")
+        output.write(ocr_text_tools.extract_text(reader, image, "Text regions").encode("utf-8"))
+
+    register("png", "txt", cost=2.5)(_image_to_txt)
+    register("jpg", "txt", cost=2.5)(_image_to_txt)
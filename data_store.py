@@ -0,0 +1,343 @@
+"""Compiled, memory-mapped store for the read-only reference data in data/.
+
+    python data_store.py build      # data/*.json → data/reference.store
+    python data_store.py info
+
+The app builds the store on startup when it is missing or older than any
+of the JSON files, and json_utils.save_json_data rebuilds it after edits.
+
+The JSON files are encoded once into a flat binary file with every string
+interned in a single table. Readers mmap it read-only and walk it through
+lazy Mapping/Sequence views, so every session and every worker process on
+the machine shares the same physical pages instead of holding its own
+parsed dict copies.
+
+Layout (little endian):
+    header   magic "SUHS", version, string count, string and node area offsets, root
+    strings  (count + 1) u32 offsets, then the UTF-8 blob
+    nodes    tag byte + payload; dicts keep insertion order for iteration
+             and a key-sorted permutation for binary-search lookup
+"""
+import mmap
+import os
+import struct
+import sys
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent / "data"
+STORE_PATH = DATA_DIR / "reference.store"
+
+# Read-only files compiled into the store
+REFERENCE_FILES = [
+    "formulas.json",
+    "periodic_table.json",
+    "translations.json",
+    "study_guide.json",
+    "resources.json",
+    "quotes.json",
+]
+
+MAGIC = b"SUHS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIII")
+
+NULL, FALSE, TRUE, INT, FLOAT, STR, LIST, DICT = range(8)
+
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+
+# ---- BUILD ----
+class _Encoder:
+    def __init__(self):
+        self.strings = {}
+        self.nodes = bytearray()
+
+    def intern(self, text):
+        sid = self.strings.get(text)
+        if sid is None:
+            sid = self.strings[text] = len(self.strings)
+        return sid
+
+    def encode(self, value):
+        """Append value's node and return its offset within the node area."""
+        # Children are written before their parent so offsets are known
+        if isinstance(value, dict):
+            keys = [self.intern(str(k)) for k in value]
+            children = [self.encode(v) for v in value.values()]
+            names = list(map(str, value))
+            order = sorted(range(len(names)), key=names.__getitem__)
+            offset = len(self.nodes)
+            self.nodes += bytes([DICT]) + _U32.pack(len(keys))
+            self.nodes += struct.pack(f"<{len(keys)}I", *keys)
+            self.nodes += struct.pack(f"<{len(order)}I", *order)
+            self.nodes += struct.pack(f"<{len(children)}I", *children)
+            return offset
+        if isinstance(value, (list, tuple)):
+            children = [self.encode(v) for v in value]
+            offset = len(self.nodes)
+            self.nodes += bytes([LIST]) + _U32.pack(len(children))
+            self.nodes += struct.pack(f"<{len(children)}I", *children)
+            return offset
+
+        offset = len(self.nodes)
+        if value is None:
+            self.nodes.append(NULL)
+        elif value is True:
+            self.nodes.append(TRUE)
+        elif value is False:
+            self.nodes.append(FALSE)
+        elif isinstance(value, int):
+            self.nodes += bytes([INT]) + _I64.pack(value)
+        elif isinstance(value, float):
+            self.nodes += bytes([FLOAT]) + _F64.pack(value)
+        else:
+            self.nodes += bytes([STR]) + _U32.pack(self.intern(str(value)))
+        return offset
+
+
+def _source_stamp(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def build(data_dir=DATA_DIR, names=REFERENCE_FILES, output=None):
+    """Compile the JSON files into one store file; returns its path."""
+    import json
+
+    data_dir = Path(data_dir)
+    output = Path(output or data_dir / STORE_PATH.name)
+    docs = {}
+    sources = {}
+    for name in names:
+        path = data_dir / name
+        if not path.exists():
+            continue
+        with open(path, encoding="utf-8") as f:
+            docs[name] = json.load(f)
+        sources[name] = _source_stamp(path)
+
+    enc = _Encoder()
+    root = enc.encode({"sources": sources, "docs": docs})
+
+    blob = bytearray()
+    offsets = []
+    for text in enc.strings:  # dicts keep insertion order, so ids are positions
+        offsets.append(len(blob))
+        blob += text.encode("utf-8")
+    offsets.append(len(blob))
+
+    string_table = struct.pack(f"<{len(offsets)}I", *offsets) + blob
+    strings_pos = HEADER.size
+    nodes_pos = strings_pos + len(string_table)
+    # Node offsets are relative to the node area
+    header = HEADER.pack(MAGIC, VERSION, 0, len(enc.strings), strings_pos, nodes_pos, root)
+
+    # Unique temp name: several server processes may rebuild at once
+    tmp = output.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(string_table)
+        f.write(enc.nodes)
+    os.replace(tmp, output)
+    return output
+
+
+# ---- READ ----
+class Store:
+    """Read-only view over a compiled store file."""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, count, strings_pos, nodes_pos, root = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} reference store")
+        self._count = count
+        self._offsets_pos = strings_pos
+        self._blob_pos = strings_pos + (count + 1) * 4
+        self._base = nodes_pos
+        self._string = lru_cache(maxsize=4096)(self._read_string)
+        self.root = self.child(root)
+
+    def _read_string(self, sid):
+        start, end = struct.unpack_from("<2I", self._mm, self._offsets_pos + sid * 4)
+        return self._mm[self._blob_pos + start:self._blob_pos + end].decode("utf-8")
+
+    def value(self, pos):
+        """Decode the node at absolute file position pos (containers stay lazy)."""
+        tag = self._mm[pos]
+        if tag == STR:
+            return self._string(_U32.unpack_from(self._mm, pos + 1)[0])
+        if tag == DICT:
+            return FrozenDict(self, pos)
+        if tag == LIST:
+            return FrozenList(self, pos)
+        if tag == INT:
+            return _I64.unpack_from(self._mm, pos + 1)[0]
+        if tag == FLOAT:
+            return _F64.unpack_from(self._mm, pos + 1)[0]
+        if tag == NULL:
+            return None
+        return tag == TRUE
+
+    def child(self, offset):
+        return self.value(self._base + offset)
+
+    def document(self, name):
+        return self.root["docs"].get(name)
+
+    def is_fresh(self, name, data_dir=DATA_DIR):
+        stamp = self.root["sources"].get(name)
+        path = Path(data_dir) / name
+        return stamp is not None and path.exists() and list(stamp) == _source_stamp(path)
+
+    def close(self):
+        self._mm.close()
+
+
+class FrozenList(Sequence):
+    __slots__ = ("_store", "_pos", "_len")
+
+    def __init__(self, store, pos):
+        self._store = store
+        self._pos = pos
+        self._len = _U32.unpack_from(store._mm, pos + 1)[0]
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(index)
+        offset = _U32.unpack_from(self._store._mm, self._pos + 5 + index * 4)[0]
+        return self._store.child(offset)
+
+    def __repr__(self):
+        return f"FrozenList({to_python(self)!r})"
+
+
+class FrozenDict(Mapping):
+    __slots__ = ("_store", "_pos", "_len")
+
+    def __init__(self, store, pos):
+        self._store = store
+        self._pos = pos
+        self._len = _U32.unpack_from(store._mm, pos + 1)[0]
+
+    def _key(self, i):
+        sid = _U32.unpack_from(self._store._mm, self._pos + 5 + i * 4)[0]
+        return self._store._string(sid)
+
+    def _slot(self, key):
+        """Insertion index of key via the sorted permutation, or -1."""
+        mm = self._store._mm
+        perm_pos = self._pos + 5 + self._len * 4
+        lo, hi = 0, self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = _U32.unpack_from(mm, perm_pos + mid * 4)[0]
+            probe = self._key(i)
+            if probe == key:
+                return i
+            if probe < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return -1
+
+    def __getitem__(self, key):
+        i = self._slot(key) if isinstance(key, str) else -1
+        if i < 0:
+            raise KeyError(key)
+        offset = _U32.unpack_from(self._store._mm, self._pos + 5 + self._len * 8 + i * 4)[0]
+        return self._store.child(offset)
+
+    def __contains__(self, key):
+        return isinstance(key, str) and self._slot(key) >= 0
+
+    def __iter__(self):
+        return (self._key(i) for i in range(self._len))
+
+    def __len__(self):
+        return self._len
+
+    def __repr__(self):
+        return f"FrozenDict({to_python(self)!r})"
+
+
+def to_python(value):
+    """Materialize a store view into plain dicts and lists (e.g. before editing)."""
+    if isinstance(value, Mapping):
+        return {k: to_python(v) for k, v in value.items()}
+    if isinstance(value, (list, FrozenList)):
+        return [to_python(v) for v in value]
+    return value
+
+
+_open_stores = {}
+
+
+def open_store(path=STORE_PATH):
+    """One shared Store per process, reopened when the file is rebuilt."""
+    path = Path(path)
+    try:
+        stamp = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _open_stores.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    try:
+        store = Store(path)
+    except (ValueError, struct.error):
+        return None
+    _open_stores[path] = (stamp, store)
+    return store
+
+
+def ensure_fresh(data_dir=DATA_DIR, names=REFERENCE_FILES):
+    """Build the store if it is missing or stale; returns the open Store or None."""
+    store = open_store()
+    if store is None or not all(store.is_fresh(n, data_dir)
+                                for n in names if (Path(data_dir) / n).exists()):
+        try:
+            build(data_dir, names)
+        except OSError:
+            return None  # read-only checkout: callers fall back to the JSON files
+        store = open_store()
+    return store
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "build"
+    if command == "build":
+        path = build()
+        print(f"wrote {path} ({path.stat().st_size:,} bytes)")
+    elif command == "info":
+        store = open_store()
+        if store is None:
+            print("no store; run: python data_store.py build")
+            return 1
+        print(f"{store.path}: {store.path.stat().st_size:,} bytes, {store._count:,} strings")
+        for name in store.root["docs"]:
+            json_size = (DATA_DIR / name).stat().st_size if (DATA_DIR / name).exists() else 0
+            state = "fresh" if store.is_fresh(name) else "stale"
+            print(f"  {name:22} {json_size:>8,} bytes JSON  {state}")
+    else:
+        print(__doc__)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
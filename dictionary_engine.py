@@ -0,0 +1,467 @@
+"""Offline dictionary: compact sorted headwords plus an offset-indexed definitions blob.
+
+    python dictionary_engine.py import words.csv [more files...]   # → data/dictionary.dict
+    python dictionary_engine.py lookup serendipity
+    python dictionary_engine.py info
+
+Inputs are merged on top of data/dictionary.json:
+    .json   {"words": {word: {part_of_speech, definition, example, synonyms}}}
+    .csv    header row with a word column and optional part_of_speech /
+    .tsv    pos, definition, example, synonyms columns; repeated words
+            become extra senses (the common open dictionary CSV dumps)
+    .txt    one headword per line (spell-check/autocomplete only)
+
+Layout (little endian, memory-mapped read-only):
+    header       magic "SUHD", version, block size, count, section offsets
+    blocks       u32 offset of each block of BLOCK headwords
+    headwords    front-coded: u8 shared prefix, u8 suffix length, suffix;
+                 the first word of each block is stored whole
+    def index    (count + 1) u32 offsets into the definitions blob
+    definitions  one JSON array per headword:
+                 [display form or "", [[pos, definition, example?], ...], synonyms]
+
+Headwords are sorted UTF-8 bytes, so exact and prefix lookups are a binary
+search over block heads plus a scan of at most BLOCK words. Fuzzy lookup
+walks the sorted list as if it were a trie: edit-distance rows are shared
+across common prefixes and whole subtrees are skipped once a prefix is out
+of range.
+"""
+import csv
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent / "data"
+SOURCE_PATH = DATA_DIR / "dictionary.json"
+DICT_PATH = DATA_DIR / "dictionary.dict"
+
+MAGIC = b"SUHD"
+VERSION = 1
+BLOCK = 16
+MAX_WORD_BYTES = 255
+HEADER = struct.Struct("<4sHHIIIII")
+
+_U32 = struct.Struct("<I")
+
+
+def normalize(word):
+    return " ".join(str(word).strip().lower().split())
+
+
+# ---- IMPORT ----
+def _add(entries, word, sense=None, synonyms=()):
+    key = normalize(word)
+    if not key or len(key.encode("utf-8")) > MAX_WORD_BYTES:
+        return
+    entry = entries.get(key)
+    if entry is None:
+        entry = entries[key] = {"word": str(word).strip(), "senses": [], "synonyms": []}
+    if sense and sense.get("definition") and sense not in entry["senses"]:
+        entry["senses"].append(sense)
+    for synonym in synonyms:
+        if synonym and synonym not in entry["synonyms"]:
+            entry["synonyms"].append(synonym)
+
+
+def _sense(part_of_speech, definition, example=None):
+    sense = {"part_of_speech": (part_of_speech or "").strip(), "definition": (definition or "").strip()}
+    if example and example.strip():
+        sense["example"] = example.strip()
+    return sense
+
+
+def _split_list(value):
+    if isinstance(value, list):
+        return [str(v).strip() for v in value]
+    return [v.strip() for v in str(value or "").replace(";", ",").split(",")]
+
+
+def read_json(path, entries):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    for word, info in (data.get("words") or {}).items():
+        _add(entries, info.get("word", word),
+             _sense(info.get("part_of_speech"), info.get("definition"), info.get("example")),
+             _split_list(info.get("synonyms", [])))
+
+
+def read_table(path, entries, delimiter):
+    columns = {
+        "word": ("word", "headword", "lemma", "term"),
+        "part_of_speech": ("part_of_speech", "pos", "type", "wordtype"),
+        "definition": ("definition", "definitions", "meaning", "gloss"),
+        "example": ("example", "examples", "usage"),
+        "synonyms": ("synonyms", "synonym"),
+    }
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = [h.strip().lower() for h in next(reader, [])]
+        index = {}
+        for field, names in columns.items():
+            for name in names:
+                if name in header:
+                    index[field] = header.index(name)
+                    break
+        if "word" not in index:
+            raise ValueError(f"{path}: no word column in header {header}")
+
+        def cell(row, field):
+            i = index.get(field)
+            return row[i] if i is not None and i < len(row) else ""
+
+        for row in reader:
+            if not row:
+                continue
+            _add(entries, cell(row, "word"),
+                 _sense(cell(row, "part_of_speech"), cell(row, "definition"), cell(row, "example")),
+                 _split_list(cell(row, "synonyms")))
+
+
+def read_word_list(path, entries):
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            word = line.strip()
+            if word and not word.startswith("#"):
+                _add(entries, word)
+
+
+def read_source(path, entries):
+    suffix = Path(path).suffix.lower()
+    if suffix == ".json":
+        read_json(path, entries)
+    elif suffix in (".csv", ".tsv"):
+        read_table(path, entries, "\t" if suffix == ".tsv" else ",")
+    else:
+        read_word_list(path, entries)
+
+
+def build(sources=(), output=DICT_PATH, base=SOURCE_PATH):
+    """Merge base + sources and write the compiled dictionary; returns the headword count."""
+    entries = {}
+    for path in ([base] if base and Path(base).exists() else []) + list(sources):
+        read_source(path, entries)
+
+    keys = sorted(entries, key=lambda k: k.encode("utf-8"))
+    words = bytearray()
+    blocks = []
+    defs = bytearray()
+    def_offsets = []
+    previous = b""
+    for i, key in enumerate(keys):
+        encoded = key.encode("utf-8")
+        shared = 0
+        if i % BLOCK == 0:
+            blocks.append(len(words))
+        else:
+            limit = min(len(previous), len(encoded), 255)
+            while shared < limit and previous[shared] == encoded[shared]:
+                shared += 1
+        suffix = encoded[shared:]
+        words += bytes((shared, len(suffix))) + suffix
+        previous = encoded
+
+        entry = entries[key]
+        senses = [[s["part_of_speech"], s["definition"]] + ([s["example"]] if "example" in s else [])
+                  for s in entry["senses"]]
+        compact = ["" if entry["word"] == key else entry["word"], senses, entry["synonyms"]]
+        while compact and not compact[-1]:
+            compact.pop()
+        def_offsets.append(len(defs))
+        defs += json.dumps(compact, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    def_offsets.append(len(defs))
+
+    blocks_pos = HEADER.size
+    words_pos = blocks_pos + 4 * len(blocks)
+    index_pos = words_pos + len(words)
+    defs_pos = index_pos + 4 * len(def_offsets)
+    output = Path(output)
+    tmp = output.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, BLOCK, len(keys), blocks_pos, words_pos, index_pos, defs_pos))
+        f.write(struct.pack(f"<{len(blocks)}I", *blocks))
+        f.write(words)
+        f.write(struct.pack(f"<{len(def_offsets)}I", *def_offsets))
+        f.write(defs)
+    os.replace(tmp, output)
+    return len(keys)
+
+
+# ---- READ ----
+def _successor(prefix):
+    """Smallest byte string greater than every string starting with prefix."""
+    prefix = prefix.rstrip(b"\xff")
+    return prefix[:-1] + bytes([prefix[-1] + 1]) if prefix else None
+
+
+class Dictionary:
+    """Read-only, memory-mapped dictionary; cheap to share across sessions."""
+
+    def __init__(self, path=DICT_PATH):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._block, self._count, blocks_pos, self._words_pos,
+         self._index_pos, self._defs_pos) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} dictionary")
+        self._nblocks = -(-self._count // self._block)
+        self._blocks = memoryview(self._mm)[blocks_pos:blocks_pos + 4 * self._nblocks].cast("I")
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        self._blocks.release()
+        self._mm.close()
+
+    def _block_words(self, block):
+        """Yield (index, headword bytes) for every word in one block."""
+        mm = self._mm
+        pos = self._words_pos + self._blocks[block]
+        first = block * self._block
+        word = b""
+        for i in range(first, min(first + self._block, self._count)):
+            shared, length = mm[pos], mm[pos + 1]
+            word = word[:shared] + mm[pos + 2:pos + 2 + length]
+            pos += 2 + length
+            yield i, word
+
+    def _block_head(self, block):
+        pos = self._words_pos + self._blocks[block]
+        return self._mm[pos + 2:pos + 2 + self._mm[pos + 1]]
+
+    def _find_block(self, key):
+        """Last block whose first headword is <= key (0 if none)."""
+        lo, hi = 0, self._nblocks
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._block_head(mid) <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return max(lo - 1, 0)
+
+    def _lower_bound(self, key):
+        """Index of the first headword >= key (bytes)."""
+        block = self._find_block(key)
+        for i, word in self._block_words(block):
+            if word >= key:
+                return i
+        return min((block + 1) * self._block, self._count)
+
+    def _iter_from(self, index):
+        block = index // self._block
+        while block < self._nblocks:
+            for i, word in self._block_words(block):
+                if i >= index:
+                    yield i, word
+            block += 1
+
+    def headword(self, index):
+        for i, word in self._block_words(index // self._block):
+            if i == index:
+                return word.decode("utf-8")
+        raise IndexError(index)
+
+    def entry(self, index):
+        start, end = struct.unpack_from("<2I", self._mm, self._index_pos + 4 * index)
+        fields = json.loads(self._mm[self._defs_pos + start:self._defs_pos + end])
+        word, senses, synonyms = fields + ["", [], []][len(fields):]
+        return {
+            "word": word or self.headword(index),
+            "senses": [dict(zip(("part_of_speech", "definition", "example"), s)) for s in senses],
+            "synonyms": synonyms,
+        }
+
+    def find(self, word):
+        """Index of word, or -1."""
+        key = normalize(word).encode("utf-8")
+        if not key or not self._count:
+            return -1
+        i = self._lower_bound(key)
+        if i < self._count and self.headword(i).encode("utf-8") == key:
+            return i
+        return -1
+
+    def get(self, word):
+        i = self.find(word)
+        return self.entry(i) if i >= 0 else None
+
+    def __contains__(self, word):
+        return self.find(word) >= 0
+
+    def complete(self, prefix, limit=10):
+        """Headwords starting with prefix, alphabetical."""
+        key = normalize(prefix).encode("utf-8")
+        if not key:
+            return []
+        results = []
+        for _, word in self._iter_from(self._lower_bound(key)):
+            if not word.startswith(key) or len(results) >= limit:
+                break
+            results.append(word.decode("utf-8"))
+        return results
+
+    def fuzzy(self, word, max_distance=None, limit=10):
+        """[(headword, edit distance)] closest first.
+
+        By default one edit is tried first and, for words longer than four
+        letters, two edits only when nothing is one edit away.
+        """
+        query = normalize(word).encode("utf-8")
+        if not query or not self._count:
+            return []
+        if max_distance is not None:
+            distances = [max_distance]
+        else:
+            distances = [1] if len(query) <= 4 else [1, 2]
+        matches = []
+        for distance in distances:
+            matches = self._scan(query, distance)
+            if matches:
+                break
+        matches.sort()
+        return [(w.decode("utf-8"), d) for d, _, w in matches[:limit]]
+
+    def _scan(self, query, max_distance):
+        """Banded Levenshtein over the sorted headwords, walked like a trie."""
+        m = len(query)
+        out = max_distance + 1
+        rows = [[j if j <= max_distance else out for j in range(m + 1)]]
+        previous = b""
+        skip = None
+        matches = []
+        block = 0
+        while block < self._nblocks:
+            for _, headword in self._block_words(block):
+                if skip is not None:
+                    if headword.startswith(skip):
+                        continue
+                    skip = None
+                common = 0
+                limit_common = min(len(previous), len(headword), len(rows) - 1)
+                while common < limit_common and previous[common] == headword[common]:
+                    common += 1
+                del rows[common + 1:]
+                for depth in range(common, len(headword)):
+                    above = rows[depth]
+                    byte = headword[depth]
+                    lo = max(1, depth + 1 - max_distance)
+                    hi = min(m, depth + 1 + max_distance)
+                    row = [out] * (m + 1)
+                    if depth + 1 <= max_distance:
+                        row[0] = depth + 1
+                    best = row[0]
+                    for j in range(lo, hi + 1):
+                        value = min(row[j - 1] + 1, above[j] + 1, above[j - 1] + (query[j - 1] != byte))
+                        row[j] = value if value < out else out
+                        if value < best:
+                            best = value
+                    rows.append(row)
+                    if best > max_distance:
+                        # Nothing under this prefix can come back in range
+                        skip = headword[:depth + 1]
+                        break
+                if skip is not None:
+                    previous = skip
+                    if block + 1 < self._nblocks and self._block_head(block + 1).startswith(skip):
+                        break  # the subtree runs past this block: jump instead of scanning
+                    continue
+                distance = rows[len(headword)][m]
+                if distance <= max_distance:
+                    matches.append((distance, abs(len(headword) - m), headword))
+                previous = headword
+            block += 1
+            # Jump over whole blocks that sit inside a skipped subtree
+            if skip is not None and block < self._nblocks and self._block_head(block).startswith(skip):
+                target = _successor(skip)
+                if target is None:
+                    break
+                block = self._find_block(target)
+        return matches
+
+    def word_of_the_day(self, day=None):
+        """Same word for everyone on a given date; only words with definitions qualify."""
+        if not self._count:
+            return None
+        day = day or datetime.date.today()
+        seed = int(hashlib.sha1(day.isoformat().encode()).hexdigest()[:12], 16)
+        for step in range(self._count):
+            entry = self.entry((seed + step * 7919) % self._count)
+            if entry["senses"]:
+                return entry
+        return None
+
+
+_open = {}
+
+
+def open_dictionary(path=DICT_PATH):
+    """Shared Dictionary per process, reopened when the file is rebuilt; None if absent."""
+    path = Path(path)
+    try:
+        stamp = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _open.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    try:
+        dictionary = Dictionary(path)
+    except (ValueError, struct.error):
+        return None
+    _open[path] = (stamp, dictionary)
+    return dictionary
+
+
+def ensure_built():
+    """Compile data/dictionary.json when no dictionary has been built or imported yet.
+
+    Later edits to dictionary.json are not picked up here: rebuilding from
+    it alone would drop word lists added with import. Run import again
+    (with those lists) to apply them.
+    """
+    if not DICT_PATH.exists() and SOURCE_PATH.exists():
+        try:
+            build()
+        except OSError:
+            return None
+    return open_dictionary()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "info"
+    if command == "import":
+        count = build(argv[1:])
+        print(f"wrote {DICT_PATH} ({count:,} headwords, {DICT_PATH.stat().st_size:,} bytes)")
+    elif command == "lookup" and len(argv) > 1:
+        dictionary = ensure_built()
+        if dictionary is None:
+            print("no dictionary; run: python dictionary_engine.py import")
+            return 1
+        word = " ".join(argv[1:])
+        entry = dictionary.get(word)
+        if entry:
+            print(json.dumps(entry, indent=2, ensure_ascii=False))
+        else:
+            print("not found; did you mean:", ", ".join(w for w, _ in dictionary.fuzzy(word)) or "-")
+    elif command == "info":
+        dictionary = ensure_built()
+        if dictionary is None:
+            print("no dictionary; run: python dictionary_engine.py import")
+            return 1
+        print(f"{dictionary.path}: {len(dictionary):,} headwords, {dictionary.path.stat().st_size:,} bytes")
+    else:
+        print(__doc__)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
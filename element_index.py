@@ -0,0 +1,143 @@
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+from search_index import PrefixIndex, TrigramIndex, normalize
+
+Element = namedtuple("Element", "number symbol name mass category group period")
+
+CATEGORY_COLORS = {
+    "Alkali Metal": "#ff6b6b",
+    "Alkaline Earth Metal": "#ffa94d",
+    "Transition Metal": "#ffd43b",
+    "Post-transition Metal": "#a9e34b",
+    "Metalloid": "#69db7c",
+    "Nonmetal": "#4dabf7",
+    "Halogen": "#38d9a9",
+    "Noble Gas": "#b197fc",
+    "Lanthanide": "#f783ac",
+    "Actinide": "#e599f7",
+}
+
+# Lanthanides and actinides sit in two rows under the main table
+F_BLOCK = {"Lanthanide": (7, 57), "Actinide": (8, 89)}
+
+
+def _mass(text):
+    try:
+        return float(str(text).strip("[]() "))
+    except ValueError:
+        return float("nan")
+
+
+class ElementIndex:
+    """Lookups over the periodic table, built once and shared by every session.
+
+    Exact keys: name, symbol, atomic number and category, all case-insensitive.
+    Also prefix and trigram (typo-tolerant) search, and range queries by group,
+    period and atomic mass.
+    """
+
+    def __init__(self, records):
+        self.elements = sorted(
+            (Element(int(r["number"]), r["symbol"], r["name"], _mass(r["mass"]),
+                     r["category"], int(r.get("group", 0)), int(r.get("period", 0)))
+             for r in records),
+            key=lambda e: e.number,
+        )
+        self.by_number = {e.number: e for e in self.elements}
+        self.by_symbol = {normalize(e.symbol): e for e in self.elements}
+        self.by_name = {normalize(e.name): e for e in self.elements}
+        self.by_category = {}
+        self.by_group = {}
+        self.by_period = {}
+        for e in self.elements:
+            self.by_category.setdefault(normalize(e.category), []).append(e)
+            self.by_group.setdefault(e.group, []).append(e)
+            self.by_period.setdefault(e.period, []).append(e)
+        self.categories = sorted({e.category for e in self.elements})
+        self._cells = {self.grid_position(e): e for e in self.elements}
+
+        self._by_mass = sorted((e.mass, e.number) for e in self.elements if e.mass == e.mass)
+        self._masses = [m for m, _ in self._by_mass]
+        self._prefix = PrefixIndex([(e.name, e) for e in self.elements] +
+                                   [(e.symbol, e) for e in self.elements])
+        self._fuzzy = TrigramIndex((e.name, e) for e in self.elements)
+
+    def get(self, query):
+        """Exact match on atomic number, symbol or name; None if nothing matches."""
+        key = normalize(query)
+        if key.isdigit():
+            return self.by_number.get(int(key))
+        return self.by_symbol.get(key) or self.by_name.get(key)
+
+    def search(self, query, limit=10):
+        """[(element, how)] with how in exact, category, prefix, fuzzy; best first."""
+        key = normalize(query)
+        if not key:
+            return []
+        exact = self.get(key)
+        if exact:
+            return [(exact, "exact")]
+        if key in self.by_category:
+            return [(e, "category") for e in self.by_category[key]]
+
+        results = []
+        seen = set()
+        for e in self._prefix.search(key, limit):
+            if e.number not in seen:
+                seen.add(e.number)
+                results.append((e, "prefix"))
+        for e, _ in self._fuzzy.search(key, limit):
+            if len(results) >= limit:
+                break
+            if e.number not in seen:
+                seen.add(e.number)
+                results.append((e, "fuzzy"))
+        return results[:limit]
+
+    def mass_range(self, low, high):
+        """Elements with low <= atomic mass <= high, lightest first."""
+        start = bisect_left(self._masses, low)
+        stop = bisect_right(self._masses, high)
+        return [self.by_number[n] for _, n in self._by_mass[start:stop]]
+
+    def query(self, group=None, period=None, category=None, mass=None):
+        """Elements matching every given filter, by atomic number."""
+        if mass is not None:
+            candidates = sorted(self.mass_range(*mass), key=lambda e: e.number)
+        else:
+            candidates = self.elements
+        if group is not None:
+            candidates = [e for e in candidates if e.group == group]
+        if period is not None:
+            candidates = [e for e in candidates if e.period == period]
+        if category is not None:
+            candidates = [e for e in candidates if e.category == category]
+        return candidates
+
+    @staticmethod
+    def grid_position(element):
+        """(row, column) in the 18-column layout, f-block in rows 7 and 8 (0-based)."""
+        if element.category in F_BLOCK:
+            row, first = F_BLOCK[element.category]
+            return row, element.number - first + 3
+        return element.period - 1, element.group - 1
+
+    def grid(self):
+        """(symbols DataFrame, Styler coloured by category) for the table view."""
+        import pandas as pd
+
+        columns = [str(g) for g in range(1, 19)]
+        labels = [str(p) for p in range(1, 8)] + ["La", "Ac"]
+        cells = [[""] * 18 for _ in labels]
+        colors = [[""] * 18 for _ in labels]
+        for (row, col), e in self._cells.items():
+            cells[row][col] = e.symbol
+            colors[row][col] = f"background-color: {CATEGORY_COLORS.get(e.category, '#adb5bd')}; color: #111"
+        frame = pd.DataFrame(cells, index=labels, columns=columns)
+        style = pd.DataFrame(colors, index=labels, columns=columns)
+        return frame, frame.style.apply(lambda _: style, axis=None)
+
+    def at(self, row, column):
+        """Element at a grid cell (row position, column label), or None."""
+        return self._cells.get((row, int(column) - 1))
@@ -0,0 +1,312 @@
+"""Columnar expense ledger persisted as Parquet, with cached vectorized aggregates.
+
+Expenses live in one pandas DataFrame (id, date, name, amount, category,
+source) saved to expenses.parquet in the visitor's folder (see user_store),
+or kept in memory with path=None. Monthly, category and
+rolling-window totals are computed with groupby/resample over the
+columns and memoized until the ledger next changes.
+
+The ledger also answers list_view's query()/values() calls, so the
+Expense Tracker pages through it like any other list.
+"""
+import io
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from json_utils import USER_DIR
+
+LEDGER_PATH = USER_DIR / "expenses.parquet"
+
+CATEGORIES = ["Food", "Transport", "Books", "Entertainment", "Bills", "Other"]
+
+# Bank statement narration keywords → category, tried in order
+CATEGORY_KEYWORDS = {
+    "Food": r"swiggy|zomato|restaurant|cafe|canteen|mess|food|pizza|domino|mcdonald|kfc|blinkit|zepto|grocer|bigbasket",
+    "Transport": r"uber|ola\b|rapido|metro|irctc|railway|bus|fuel|petrol|diesel|parking|fastag|redbus",
+    "Books": r"book|stationery|kindle|coursera|udemy|xerox|print",
+    "Entertainment": r"netflix|spotify|prime video|hotstar|bookmyshow|pvr|inox|steam|playstation|youtube",
+    "Bills": r"electricity|recharge|airtel|jio|vodafone|\bvi\b|broadband|wifi|rent|water bill|gas bill|insurance|fee",
+}
+
+# Column names seen in bank statement exports
+DATE_COLUMNS = ["date", "txn date", "transaction date", "value date", "posting date", "value dt"]
+NAME_COLUMNS = ["description", "narration", "details", "particulars", "remarks", "transaction details", "payee", "name"]
+DEBIT_COLUMNS = ["debit", "withdrawal", "withdrawal amt.", "withdrawal amount", "debit amount", "dr"]
+AMOUNT_COLUMNS = ["amount", "amount (inr)", "transaction amount", "amt"]
+
+_EMPTY = {
+    "id": "int64",
+    "date": "datetime64[ns]",
+    "name": "object",
+    "amount": "float64",
+    "category": "object",
+    "source": "object",
+}
+
+
+def _empty_frame():
+    return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in _EMPTY.items()})
+
+
+def categorize(names):
+    """Vectorized keyword categorization of a Series of narrations."""
+    names = names.fillna("").str.lower()
+    result = pd.Series("Other", index=names.index, dtype=object)
+    unset = np.ones(len(names), dtype=bool)
+    for category, pattern in CATEGORY_KEYWORDS.items():
+        hit = names.str.contains(pattern, regex=True).to_numpy() & unset
+        result[hit] = category
+        unset &= ~hit
+    return result
+
+
+def _pick(columns, candidates):
+    lowered = {str(c).strip().lower(): c for c in columns}
+    for name in candidates:
+        if name in lowered:
+            return lowered[name]
+    return None
+
+
+def _to_number(series):
+    """'₹1,234.50', '(120.00)', '50 Dr' → floats; blanks → NaN."""
+    text = series.astype(str).str.strip()
+    negative = text.str.startswith("(") | text.str.lower().str.endswith("dr") | text.str.startswith("-")
+    values = pd.to_numeric(text.str.replace(r"[^0-9.]", "", regex=True), errors="coerce").astype("float64")
+    return values.where(~negative, -values)
+
+
+def _rewinder(source):
+    """A function handing back source from its start, for reading a CSV twice.
+
+    Paths are simply reopened; a file that cannot seek is read into memory.
+    """
+    if not hasattr(source, "read"):
+        return lambda: source
+    if not (hasattr(source, "seekable") and source.seekable()):
+        data = source.read()
+        source = io.StringIO(data) if isinstance(data, str) else io.BytesIO(data)
+    start = source.tell()
+
+    def rewind():
+        source.seek(start)
+        return source
+    return rewind
+
+
+def parse_statement(source, dayfirst=True, chunksize=50_000):
+    """Expenses from a bank statement CSV, read in chunks.
+
+    Yields DataFrames with date, name, amount, category. Only money going
+    out is kept: the debit/withdrawal column when there is one, otherwise
+    negative amounts (or every amount, if none in the file are negative).
+    That is decided for the whole file, in a first pass over the amount
+    column, so a chunk holding only credits is not mistaken for expenses.
+    """
+    rewind = _rewinder(source)
+    columns = pd.read_csv(rewind(), nrows=0, skipinitialspace=True).columns
+    date_col = _pick(columns, DATE_COLUMNS)
+    name_col = _pick(columns, NAME_COLUMNS)
+    debit_col = _pick(columns, DEBIT_COLUMNS)
+    amount_col = _pick(columns, AMOUNT_COLUMNS)
+    if date_col is None or (debit_col is None and amount_col is None):
+        raise ValueError("statement needs a date column and a debit/withdrawal or amount column")
+
+    signed = False
+    if debit_col is None:
+        with pd.read_csv(rewind(), usecols=[amount_col], chunksize=chunksize, dtype=str,
+                         skipinitialspace=True) as amounts:
+            signed = any((_to_number(chunk[amount_col]) < 0).any() for chunk in amounts)
+
+    with pd.read_csv(rewind(), chunksize=chunksize, dtype=str, skipinitialspace=True) as chunks:
+        for chunk in chunks:
+            chunk = chunk.dropna(how="all")
+            if debit_col is not None:
+                amount = _to_number(chunk[debit_col]).abs()
+            else:
+                amount = _to_number(chunk[amount_col])
+                amount = -amount if signed else amount
+            frame = pd.DataFrame({
+                "date": pd.to_datetime(chunk[date_col], dayfirst=dayfirst, errors="coerce", format="mixed"),
+                "name": chunk[name_col].fillna("").str.strip() if name_col is not None else "Bank transaction",
+                "amount": amount,
+            })
+            frame = frame[frame["date"].notna() & (frame["amount"] > 0)]
+            frame["date"] = frame["date"].dt.normalize()
+            frame["category"] = categorize(frame["name"])
+            yield frame
+
+
+class Ledger:
+    """The expense table, shared by the sessions that open the same path."""
+
+    def __init__(self, path=LEDGER_PATH):
+        self.path = path
+        self._lock = threading.RLock()
+        self._cache = {}
+        if path is not None and path.exists():
+            self.frame = pd.read_parquet(path)
+        else:
+            self.frame = _empty_frame()
+
+    def __len__(self):
+        return len(self.frame)
+
+    # ---- changes ----
+    def _changed(self):
+        self._cache.clear()
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        self.frame.to_parquet(tmp, index=False)
+        tmp.replace(self.path)
+
+    def _append(self, rows, source):
+        rows = rows.assign(source=source)
+        next_id = int(self.frame["id"].max()) + 1 if len(self.frame) else 0
+        rows.insert(0, "id", np.arange(next_id, next_id + len(rows), dtype="int64"))
+        frames = [f for f in (self.frame, rows[list(_EMPTY)]) if len(f)]
+        self.frame = pd.concat(frames, ignore_index=True) if frames else _empty_frame()
+
+    def add(self, name, amount, category, date):
+        with self._lock:
+            self._append(pd.DataFrame({"date": [pd.Timestamp(date)], "name": [name],
+                                       "amount": [float(amount)], "category": [category]}), "manual")
+            self._changed()
+
+    def add_records(self, records, source="manual"):
+        """Plain expense dicts (as older sessions kept them)."""
+        rows = pd.DataFrame(list(records), columns=["date", "name", "amount", "category"])
+        if len(rows):
+            rows["date"] = pd.to_datetime(rows["date"])
+            rows["amount"] = rows["amount"].astype(float)
+            with self._lock:
+                self._append(rows, source)
+                self._changed()
+        return len(rows)
+
+    def import_statement(self, source, dayfirst=True):
+        """Append a bank statement; rows already in the ledger are skipped.
+
+        A row is a duplicate when date, amount and narration all match, so
+        re-importing an overlapping statement is harmless. Returns
+        (added, duplicates).
+        """
+        added = duplicates = 0
+        with self._lock:
+            for rows in parse_statement(source, dayfirst):
+                keys = ["date", "amount", "name"]
+                known = rows.merge(self.frame[keys].drop_duplicates(), on=keys, how="left", indicator=True)
+                fresh = rows[(known["_merge"] == "left_only").to_numpy()]
+                duplicates += len(rows) - len(fresh)
+                added += len(fresh)
+                if len(fresh):
+                    self._append(fresh, "import")
+            if added:
+                self._changed()
+        return added, duplicates
+
+    def remove(self, *ids):
+        with self._lock:
+            self.frame = self.frame[~self.frame["id"].isin(ids)].reset_index(drop=True)
+            self._changed()
+
+    # ---- aggregates (memoized until the next change) ----
+    def _cached(self, key, compute):
+        with self._lock:
+            if key not in self._cache:
+                if len(self._cache) > 256:  # many distinct searches between changes
+                    self._cache.clear()
+                self._cache[key] = compute()
+            return self._cache[key]
+
+    def _periods(self):
+        return self._cached("periods", lambda: self.frame["date"].dt.to_period("M"))
+
+    def month(self, month):
+        """Rows of one calendar month (a pandas Period)."""
+        return self._cached(("month", month), lambda: self.frame[(self._periods() == month).to_numpy()])
+
+    def month_total(self, month):
+        return self._cached(("month_total", month), lambda: float(self.month(month)["amount"].sum()))
+
+    def by_category(self, month=None):
+        frame = self.frame if month is None else self.month(month)
+        return self._cached(("by_category", month), lambda: (
+            frame.groupby("category")["amount"].sum().sort_values(ascending=False)))
+
+    def monthly(self, months=12):
+        """Total per calendar month, last `months` months with spending."""
+        def compute():
+            totals = self.frame.groupby(self._periods())["amount"].sum()
+            return totals.tail(months)
+        return self._cached(("monthly", months), compute)
+
+    def daily(self):
+        def compute():
+            if not len(self.frame):
+                return pd.Series(dtype="float64")
+            return self.frame.set_index("date")["amount"].resample("D").sum()
+        return self._cached("daily", compute)
+
+    def rolling(self, days):
+        """Trailing `days`-day spending for every calendar day."""
+        return self._cached(("rolling", days), lambda: self.daily().rolling(days, min_periods=1).sum())
+
+    def alerts(self, budget, today=None):
+        """(level, message) pairs for the month containing today."""
+        today = pd.Timestamp(today or pd.Timestamp.today()).normalize()
+        month = today.to_period("M")
+        spent = self.month_total(month)
+        if budget <= 0:
+            return []
+        alerts = []
+        if spent > budget:
+            alerts.append(("error", f"Over budget by ₹{spent - budget:,.0f} this month"))
+        elif spent >= 0.8 * budget:
+            alerts.append(("warning", f"{spent / budget:.0%} of this month's budget used"))
+        days_in_month = month.days_in_month
+        projected = spent / today.day * days_in_month
+        if spent <= budget < projected:
+            alerts.append(("warning", f"At this pace you'll spend ₹{projected:,.0f} by month end"))
+        usual = self.usual_by_category(month)
+        if len(usual):
+            categories = self.by_category(month)
+            spikes = categories[categories > 1.5 * usual.reindex(categories.index).fillna(np.inf)]
+            for category, amount in spikes.items():
+                alerts.append(("info", f"{category}: ₹{amount:,.0f} so far, above your usual ₹{usual[category]:,.0f}/month"))
+        return alerts
+
+    def usual_by_category(self, month, months=6):
+        """Average monthly spend per category over up to `months` earlier months (needs two)."""
+        def compute():
+            history = self.monthly(months + 1)
+            history = history[history.index < month].tail(months)
+            if len(history) < 2:
+                return pd.Series(dtype="float64")
+            earlier = self.frame[self._periods().isin(history.index).to_numpy()]
+            return earlier.groupby("category")["amount"].sum() / len(history)
+        return self._cached(("usual", month, months), compute)
+
+    # ---- list_view interface ----
+    def values(self, field):
+        return sorted(self.frame[field].dropna().unique().tolist())
+
+    def query(self, sort=None, descending=False, filters=None, search="", offset=0, limit=20):
+        def compute():
+            frame = self.frame
+            mask = np.ones(len(frame), dtype=bool)
+            for field, value in (filters or {}).items():
+                mask &= (frame[field] == value).to_numpy()
+            for word in search.split():
+                mask &= frame["name"].str.contains(re.escape(word), case=False, regex=True).to_numpy()
+            matches = frame[mask]
+            return matches.sort_values([sort or "id", "id"], ascending=not descending, kind="stable")
+        matches = self._cached(("query", sort, descending, tuple(sorted((filters or {}).items())), search), compute)
+        page = matches.iloc[offset:offset + limit]
+        records = page.assign(date=page["date"].dt.strftime("%Y-%m-%d")).to_dict("records")
+        return [(record["id"], record) for record in records], len(matches)
@@ -0,0 +1,235 @@
+"""Streaming flashcard import and export: CSV, Anki-style TSV and JSON.
+
+Readers consume a text stream record by record, so a large deck is never
+held in memory; validated cards are handed to Deck.add_many in batches,
+which skips questions the deck already has.
+
+    CSV   header row naming the columns (question/front, answer/back,
+          category/deck/tags); without a recognised header the columns
+          are taken as question, answer, category
+    TSV   Anki "Notes in Plain Text": front, back, tags, with optional
+          "#separator:tab", "#html:true", "#tags column:N" header lines
+    JSON  an array of {"question", "answer", "category"} objects, or one
+          object per line (JSON Lines)
+"""
+import csv
+import html
+import io
+import json
+import re
+import sys
+
+FORMATS = {
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".txt": "tsv",
+    ".json": "json",
+    ".jsonl": "json",
+    ".ndjson": "json",
+}
+MIME_TYPES = {"csv": "text/csv", "tsv": "text/tab-separated-values", "json": "application/json"}
+
+FIELD_ALIASES = {
+    "question": ("question", "front", "q", "term", "prompt"),
+    "answer": ("answer", "back", "a", "definition", "response"),
+    "category": ("category", "deck", "subject", "tags", "tag"),
+}
+_FIELDS = {alias: field for field, aliases in FIELD_ALIASES.items() for alias in aliases}
+
+MAX_TEXT = 5000
+MAX_CATEGORY = 40
+MAX_ERRORS = 20
+
+_BREAK = re.compile(r"<br\s*/?>|</div>|</p>", re.IGNORECASE)
+_TAG = re.compile(r"<[^>]+>")
+
+csv.field_size_limit(min(sys.maxsize, 2**31 - 1))
+
+
+class ImportReport:
+    """Counts for one import, plus the first few rejected records."""
+
+    def __init__(self):
+        self.added = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.errors = []
+
+    def reject(self, where, reason):
+        self.invalid += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(f"{where}: {reason}")
+
+    def __str__(self):
+        return f"{self.added} added, {self.duplicates} duplicates skipped, {self.invalid} invalid"
+
+
+def detect_format(filename):
+    suffix = "." + filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+    return FORMATS.get(suffix)
+
+
+def text_stream(binary):
+    """Decode an uploaded (binary) file lazily; a UTF-8 BOM is dropped."""
+    return io.TextIOWrapper(binary, encoding="utf-8-sig", errors="replace", newline="")
+
+
+# ---- READERS ----
+# Each yields (location, record dict) with question/answer/category keys
+def read_csv(f, delimiter=","):
+    reader = csv.reader(f, delimiter=delimiter)
+    columns = None
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        if columns is None:
+            names = [_FIELDS.get(cell.strip().casefold()) for cell in row]
+            columns = names if "question" in names else ["question", "answer", "category"]
+            if "question" in names:
+                continue
+        yield f"line {reader.line_num}", {name: cell for name, cell in zip(columns, row) if name}
+
+
+def read_anki(f):
+    """Anki plain-text notes; '#key:value' lines before the notes set options."""
+    options = {}
+    reader = csv.reader(f, delimiter="\t")
+    for row in reader:
+        if row and row[0].startswith("#") and len(row) == 1 and ":" in row[0]:
+            key, _, value = row[0][1:].partition(":")
+            options[key.strip().lower()] = value.strip()
+            if options.get("separator", "tab").lower() not in ("tab", "\t"):
+                raise ValueError("only tab-separated Anki exports are supported")
+            continue
+        if not any(cell.strip() for cell in row):
+            continue
+        tags_column = int(options.get("tags column", 3)) - 1
+        record = {"question": row[0], "answer": row[1] if len(row) > 1 else ""}
+        if 0 <= tags_column < len(row) and row[tags_column].strip():
+            record["category"] = row[tags_column].split()[0].replace("_", " ")
+        if options.get("html", "").lower() == "true":
+            record = {k: _from_html(v) for k, v in record.items()}
+        yield f"line {reader.line_num}", record
+
+
+def read_json(f, chunk_size=1 << 16):
+    """Objects from a JSON array or JSON Lines, decoded one at a time."""
+    decoder = json.JSONDecoder()
+    buf, pos, eof, count = "", 0, False, 0
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,[]":
+            pos += 1
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+            # A value running to the end of the buffer may be cut off mid-chunk
+            complete = end < len(buf) or eof
+        except json.JSONDecodeError:
+            if eof:
+                if pos < len(buf):
+                    raise ValueError(f"invalid JSON after record {count}") from None
+                return
+            complete = False
+        if not complete:
+            chunk = f.read(chunk_size)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+            continue
+        pos = end
+        if isinstance(value, dict) and isinstance(value.get("cards"), list):
+            for item in value["cards"]:  # {"cards": [...]} wrapper: already parsed
+                count += 1
+                yield f"record {count}", _json_record(item)
+            continue
+        count += 1
+        yield f"record {count}", _json_record(value)
+
+
+def _json_record(value):
+    if not isinstance(value, dict):
+        return {}
+    return {_FIELDS[k.casefold()]: v for k, v in value.items()
+            if isinstance(k, str) and k.casefold() in _FIELDS}
+
+
+def _from_html(text):
+    return html.unescape(_TAG.sub("", _BREAK.sub("\n", text))).strip()
+
+
+def read_records(f, fmt):
+    if fmt == "csv":
+        return read_csv(f)
+    if fmt == "tsv":
+        return read_anki(f)
+    if fmt == "json":
+        return read_json(f)
+    raise ValueError(f"unsupported format: {fmt}")
+
+
+def clean(records, report):
+    """Validated (question, answer, category) tuples; rejects go to report."""
+    for where, record in records:
+        question = str(record.get("question") or "").strip()
+        answer = str(record.get("answer") or "").strip()
+        category = record.get("category")
+        if isinstance(category, list):  # JSON tags array
+            category = category[0] if category else ""
+        category = " ".join(str(category or "").split()) or "General"
+        if not question:
+            report.reject(where, "missing question")
+        elif not answer:
+            report.reject(where, "missing answer")
+        elif len(question) > MAX_TEXT or len(answer) > MAX_TEXT:
+            report.reject(where, f"longer than {MAX_TEXT} characters")
+        else:
+            yield question, answer, category[:MAX_CATEGORY]
+
+
+def import_file(deck, binary, fmt):
+    """Stream an uploaded file into deck; returns an ImportReport."""
+    report = ImportReport()
+    records = read_records(text_stream(binary), fmt)
+    report.added, report.duplicates = deck.add_many(clean(records, report))
+    return report
+
+
+# ---- WRITERS ----
+def write_csv(cards, out):
+    writer = csv.writer(out)
+    writer.writerow(["question", "answer", "category"])
+    for card in cards:
+        writer.writerow([card["question"], card["answer"], card["category"]])
+
+
+def write_anki(cards, out):
+    """Anki plain-text notes: HTML fields, category as the note's tag."""
+    out.write("#separator:tab\n#html:true\n#tags column:3\n")
+    for card in cards:
+        fields = [html.escape(card[k], quote=False).replace("\t", "    ").replace("\n", "<br>")
+                  for k in ("question", "answer")]
+        out.write("\t".join(fields + [card["category"].replace(" ", "_")]) + "\n")
+
+
+def write_json(cards, out):
+    out.write("[")
+    for i, card in enumerate(cards):
+        out.write(",\n" if i else "\n")
+        out.write(json.dumps({k: card[k] for k in ("question", "answer", "category")}, ensure_ascii=False))
+    out.write("\n]\n")
+
+
+WRITERS = {"csv": write_csv, "tsv": write_anki, "json": write_json}
+
+
+def export_file(deck, fmt):
+    """The whole deck as a UTF-8 file object, written batch by batch.
+
+    Spills to a temporary file past a few MB instead of growing a string.
+    """
+    import tempfile
+
+    binary = tempfile.SpooledTemporaryFile(max_size=8 * 2**20)
+    out = io.TextIOWrapper(binary, encoding="utf-8", newline="")
+    WRITERS[fmt](deck.iter_cards(), out)
+    out.flush()
+    out.detach()
+    binary.seek(0)
+    return binary
@@ -0,0 +1,321 @@
+"""Persistent flashcard deck with SM-2 scheduling and a heap-backed due queue.
+
+Cards and the review log live in SQLite: flashcards.db in the visitor's
+folder (see user_store), or in memory with path=None. Only (due, id) pairs are held in memory, in
+a binary heap, so the next due card is found in O(log n) and a 50k-card
+deck never has to be loaded into session state.
+"""
+import hashlib
+import heapq
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from json_utils import USER_DIR
+
+DB_PATH = USER_DIR / "flashcards.db"
+
+DAY = 86400.0
+RELEARN_SECONDS = 600          # "Again" brings a card back after ten minutes
+MIN_EASE = 1.3
+
+# Review buttons and the SM-2 grade (0-5) each one records
+GRADES = {"Again": 1, "Hard": 3, "Good": 4, "Easy": 5}
+
+# Each entry upgrades the schema by one version (PRAGMA user_version)
+MIGRATIONS = [
+    """
+    CREATE TABLE cards (
+        id INTEGER PRIMARY KEY,
+        question TEXT NOT NULL,
+        answer TEXT NOT NULL,
+        category TEXT NOT NULL DEFAULT 'General',
+        created REAL NOT NULL,
+        due REAL NOT NULL,
+        interval REAL NOT NULL DEFAULT 0,
+        ease REAL NOT NULL DEFAULT 2.5,
+        reps INTEGER NOT NULL DEFAULT 0,
+        lapses INTEGER NOT NULL DEFAULT 0,
+        last_review REAL
+    );
+    CREATE INDEX cards_due ON cards (due);
+    CREATE TABLE reviews (
+        id INTEGER PRIMARY KEY,
+        card_id INTEGER NOT NULL REFERENCES cards (id) ON DELETE CASCADE,
+        ts REAL NOT NULL,
+        grade INTEGER NOT NULL,
+        interval REAL NOT NULL,
+        ease REAL NOT NULL
+    );
+    CREATE INDEX reviews_card ON reviews (card_id, ts);
+    """,
+    # v2: duplicate detection on import, category filter in the card list
+    """
+    ALTER TABLE cards ADD COLUMN qhash TEXT;
+    UPDATE cards SET qhash = question_hash(question);
+    CREATE INDEX cards_qhash ON cards (qhash);
+    CREATE INDEX cards_category ON cards (category);
+    """,
+]
+
+CARD_COLUMNS = "id, question, answer, category, created, due, interval, ease, reps, lapses, last_review"
+
+
+def question_hash(question):
+    """Dedupe key: the question with case and whitespace differences ignored."""
+    text = " ".join(str(question).split()).casefold()
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def _like(text):
+    return "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+# ---- SCHEDULING ----
+def sm2(interval, ease, reps, lapses, grade, now):
+    """Next (interval days, ease, reps, lapses, due timestamp) after a review graded 0-5."""
+    ease = max(MIN_EASE, ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+    if grade < 3:
+        return 0.0, ease, 0, lapses + 1, now + RELEARN_SECONDS
+    if reps == 0:
+        interval = 1.0
+    elif reps == 1:
+        interval = 6.0
+    else:
+        interval = interval * ease
+    if grade == 5:
+        interval *= 1.3
+    return interval, ease, reps + 1, lapses, now + interval * DAY
+
+
+def describe_interval(seconds):
+    if seconds < 3600:
+        return f"{max(1, round(seconds / 60))} min"
+    if seconds < DAY - 1800:
+        return f"{round(seconds / 3600)} h"
+    days = seconds / DAY
+    if days < 60:
+        return f"{round(days)} d"
+    return f"{days / 30:.1f} mo"
+
+
+class DueQueue:
+    """Min-heap of (due, card id) with lazy deletion.
+
+    Rescheduling pushes a fresh entry and records the card's current due
+    time; stale entries are discarded when they reach the top.
+    """
+
+    def __init__(self, pairs=()):
+        self._due = dict((cid, due) for due, cid in pairs)
+        self._heap = [(due, cid) for cid, due in self._due.items()]
+        heapq.heapify(self._heap)
+
+    def __len__(self):
+        return len(self._due)
+
+    def push(self, card_id, due):
+        self._due[card_id] = due
+        heapq.heappush(self._heap, (due, card_id))
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._compact()
+
+    def remove(self, card_id):
+        self._due.pop(card_id, None)
+
+    def _compact(self):
+        self._heap = [(due, cid) for cid, due in self._due.items()]
+        heapq.heapify(self._heap)
+
+    def peek(self):
+        """(due, card id) of the earliest card, or None."""
+        heap = self._heap
+        while heap and self._due.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def next_due(self, now):
+        top = self.peek()
+        return top[1] if top and top[0] <= now else None
+
+
+# ---- DECK ----
+class Deck:
+    """Thread-safe deck, shared by the sessions that open the same path."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = Path(path) if path is not None else None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(str(self.path) if self.path is not None else ":memory:", check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA foreign_keys=ON")
+        self._db.create_function("question_hash", 1, question_hash, deterministic=True)
+        self._migrate()
+        self.queue = DueQueue(self._db.execute("SELECT due, id FROM cards"))
+
+    def _migrate(self):
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        for number, script in enumerate(MIGRATIONS[version:], start=version + 1):
+            with self._db:
+                self._db.executescript(script)
+                self._db.execute(f"PRAGMA user_version = {number}")
+
+    def __len__(self):
+        return len(self.queue)
+
+    def add(self, question, answer, category="General", now=None):
+        now = now or time.time()
+        with self._lock, self._db:
+            card_id = self._insert(question, answer, category, now)
+        return card_id
+
+    def _insert(self, question, answer, category, now):
+        card_id = self._db.execute(
+            "INSERT INTO cards (question, answer, category, created, due, qhash) VALUES (?, ?, ?, ?, ?, ?)",
+            (question, answer, category, now, now, question_hash(question))).lastrowid
+        self.queue.push(card_id, now)
+        return card_id
+
+    def has_question(self, question):
+        return bool(self._query("SELECT 1 FROM cards WHERE qhash = ? LIMIT 1", (question_hash(question),)))
+
+    def add_many(self, cards, now=None, batch_size=1000):
+        """Insert (question, answer, category) tuples from any iterable.
+
+        Questions already in the deck (or earlier in cards) are skipped.
+        Each batch is its own transaction, so studying is not blocked for
+        the whole import. Returns (added, duplicates).
+        """
+        now = now or time.time()
+        added = duplicates = 0
+        batch = []
+        for card in cards:
+            batch.append(card)
+            if len(batch) >= batch_size:
+                a, d = self._add_batch(batch, now)
+                added, duplicates, batch = added + a, duplicates + d, []
+        if batch:
+            a, d = self._add_batch(batch, now)
+            added, duplicates = added + a, duplicates + d
+        return added, duplicates
+
+    def _add_batch(self, batch, now):
+        added = 0
+        with self._lock, self._db:
+            for question, answer, category in batch:
+                if self._db.execute("SELECT 1 FROM cards WHERE qhash = ? LIMIT 1",
+                                    (question_hash(question),)).fetchone():
+                    continue
+                self._insert(question, answer, category, now)
+                added += 1
+        return added, len(batch) - added
+
+    def delete(self, *card_ids):
+        with self._lock, self._db:
+            self._db.executemany("DELETE FROM cards WHERE id = ?", ((cid,) for cid in card_ids))
+            for card_id in card_ids:
+                self.queue.remove(card_id)
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def get(self, card_id):
+        rows = self._query(f"SELECT {CARD_COLUMNS} FROM cards WHERE id = ?", (card_id,))
+        return dict(rows[0]) if rows else None
+
+    def recent(self, limit=50):
+        rows = self._query(f"SELECT {CARD_COLUMNS} FROM cards ORDER BY id DESC LIMIT ?", (limit,))
+        return [dict(r) for r in rows]
+
+    @staticmethod
+    def _filter(search, category):
+        where, params = [], []
+        if search:
+            where.append("(question LIKE ? ESCAPE '\\' OR answer LIKE ? ESCAPE '\\')")
+            params += [_like(search)] * 2
+        if category:
+            where.append("category = ?")
+            params.append(category)
+        return (f" WHERE {' AND '.join(where)}" if where else ""), params
+
+    def count(self, search="", category=None):
+        clause, params = self._filter(search, category)
+        return self._query(f"SELECT COUNT(*) FROM cards{clause}", params)[0][0]
+
+    def page(self, search="", category=None, offset=0, limit=50):
+        """One page of matching cards, newest first."""
+        clause, params = self._filter(search, category)
+        rows = self._query(f"SELECT {CARD_COLUMNS} FROM cards{clause} ORDER BY id DESC LIMIT ? OFFSET ?",
+                           params + [limit, offset])
+        return [dict(r) for r in rows]
+
+    def categories(self):
+        return [r[0] for r in self._query("SELECT DISTINCT category FROM cards ORDER BY category")]
+
+    def iter_cards(self, batch_size=1000):
+        """Every card in id order, fetched a batch at a time."""
+        last = 0
+        while True:
+            rows = self._query(f"SELECT {CARD_COLUMNS} FROM cards WHERE id > ? ORDER BY id LIMIT ?",
+                               (last, batch_size))
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+            last = rows[-1]["id"]
+
+    def next_due(self, now=None):
+        """The most overdue card, or None when nothing is due."""
+        with self._lock:
+            card_id = self.queue.next_due(now or time.time())
+        return self.get(card_id) if card_id is not None else None
+
+    def due_count(self, now=None):
+        return self._query("SELECT COUNT(*) FROM cards WHERE due <= ?", (now or time.time(),))[0][0]
+
+    def next_due_time(self):
+        with self._lock:
+            top = self.queue.peek()
+        return top[0] if top else None
+
+    def preview(self, card, now=None):
+        """Button label → time until the card would be due again."""
+        now = now or time.time()
+        return {label: describe_interval(sm2(card["interval"], card["ease"], card["reps"],
+                                             card["lapses"], grade, now)[4] - now)
+                for label, grade in GRADES.items()}
+
+    def review(self, card_id, grade, now=None):
+        """Record a review, reschedule the card and return its new state."""
+        now = now or time.time()
+        with self._lock, self._db:
+            card = self.get(card_id)
+            if card is None:
+                return None
+            interval, ease, reps, lapses, due = sm2(card["interval"], card["ease"], card["reps"],
+                                                    card["lapses"], grade, now)
+            self._db.execute(
+                "UPDATE cards SET interval = ?, ease = ?, reps = ?, lapses = ?, due = ?, last_review = ? WHERE id = ?",
+                (interval, ease, reps, lapses, due, now, card_id))
+            self._db.execute(
+                "INSERT INTO reviews (card_id, ts, grade, interval, ease) VALUES (?, ?, ?, ?, ?)",
+                (card_id, now, grade, interval, ease))
+            self.queue.push(card_id, due)
+        card.update(interval=interval, ease=ease, reps=reps, lapses=lapses, due=due, last_review=now)
+        return card
+
+    def history(self, card_id):
+        rows = self._query("SELECT ts, grade, interval, ease FROM reviews WHERE card_id = ? ORDER BY ts",
+                           (card_id,))
+        return [dict(r) for r in rows]
+
+    def review_count(self, since=0.0):
+        return self._query("SELECT COUNT(*) FROM reviews WHERE ts >= ?", (since,))[0][0]
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,115 @@
+import re
+from bisect import bisect_left
+from collections import namedtuple
+
+from search_index import normalize
+
+Formula = namedtuple("Formula", "id category section name latex")
+
+CATEGORIES = ["mathematics", "physics", "chemistry"]
+
+# LaTeX commands keep their backslash (\sqrt, \frac) so they never collide
+# with plain words; everything else is split into words and numbers
+_TOKEN = re.compile(r"\\[A-Za-z]+|[A-Za-z]+|\d+")
+
+# Words in names and section titles weigh more than symbols inside the formula
+NAME_WEIGHT = 3
+SECTION_WEIGHT = 2
+LATEX_WEIGHT = 1
+
+
+def latex_tokens(latex):
+    """'\\sqrt{b^2 - 4ac}' → ['\\sqrt', 'b', '2', '4ac'...], lowercased except commands."""
+    return [t if t.startswith("\\") else t.lower() for t in _TOKEN.findall(latex)]
+
+
+def text_tokens(text):
+    return _TOKEN.findall(normalize(text).replace("_", " "))
+
+
+def section_title(category, section):
+    joiner = " " if category == "chemistry" else " & "
+    return section.replace("_", joiner).title()
+
+
+class FormulaIndex:
+    """Inverted index over formulas.json: names, sections and LaTeX tokens.
+
+    Plain terms match word prefixes ("quad" finds Quadratic), terms starting
+    with a backslash match LaTeX commands exactly (\\sqrt), and every term
+    must match (AND). Results are ranked by weighted term hits.
+    """
+
+    def __init__(self, formulas_data):
+        self.formulas = []
+        for category in CATEGORIES:
+            for section, items in (formulas_data.get(category) or {}).items():
+                for item in items:
+                    self.formulas.append(Formula(len(self.formulas), category, section,
+                                                 item["name"], item["formula"]))
+
+        postings = {}
+        for f in self.formulas:
+            weights = {}
+            for token in text_tokens(f.name):
+                weights[token] = weights.get(token, 0) + NAME_WEIGHT
+            for token in text_tokens(section_title(f.category, f.section)):
+                weights[token] = weights.get(token, 0) + SECTION_WEIGHT
+            for token in latex_tokens(f.latex):
+                weights[token] = weights.get(token, 0) + LATEX_WEIGHT
+            for token, weight in weights.items():
+                postings.setdefault(token, {})[f.id] = weight
+        self._postings = postings
+        self._vocab = sorted(postings)
+        self.commands = sorted(t for t in postings if t.startswith("\\"))
+
+    def _term_hits(self, term):
+        """formula id → weight for one query term."""
+        if term.startswith("\\"):
+            return dict(self._postings.get(term, {}))
+        hits = {}
+        for i in range(bisect_left(self._vocab, term), len(self._vocab)):
+            word = self._vocab[i]
+            if not word.startswith(term):
+                break
+            for fid, weight in self._postings[word].items():
+                hits[fid] = max(hits.get(fid, 0), weight)
+        return hits
+
+    def search(self, query, category=None):
+        """Formulas matching every term of query, best first; all of category if query is empty."""
+        terms = [t if t.startswith("\\") else t.lower() for t in _TOKEN.findall(query or "")]
+        pool = [f for f in self.formulas if category in (None, f.category)]
+        if not terms:
+            return pool
+
+        scores = None
+        for term in terms:
+            hits = self._term_hits(term)
+            if scores is None:
+                scores = hits
+            else:
+                scores = {fid: scores[fid] + w for fid, w in hits.items() if fid in scores}
+            if not scores:
+                return []
+        allowed = {f.id for f in pool}
+        ranked = sorted((fid for fid in scores if fid in allowed), key=lambda fid: (-scores[fid], fid))
+        return [self.formulas[fid] for fid in ranked]
+
+
+def page_count(total, per_page):
+    return max(1, -(-total // per_page))
+
+
+def render_markdown(formulas, group_sections=True):
+    """One markdown string for a page of formulas ($$ blocks, rendered by KaTeX in the browser)."""
+    parts = []
+    current = None
+    for f in formulas:
+        heading = (f.category, f.section)
+        if group_sections and heading != current:
+            current = heading
+            parts.append(f"#### {f.category.title()} · {section_title(f.category, f.section)}")
+        parts.append(f"$$\n{f.latex}\n$$")
+        parts.append(f"_{f.name}_")
+    return "\n\n".join(parts)
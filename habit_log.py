@@ -0,0 +1,147 @@
+"""Habit completion logs as day bitsets with incrementally maintained streaks.
+
+Bit i of a HabitLog is set when the habit was done on start + i days
+(start is the earliest marked day). Marking a day is O(1) apart from the
+length of the run it joins, and the statistics the Habit Tracker shows
+(current and longest streak, total, recent completion rate) are kept up
+to date on every mark instead of re-sorting a list of date strings.
+"""
+import datetime
+
+import numpy as np
+
+
+def _ordinal(day):
+    if isinstance(day, int):
+        return day
+    if isinstance(day, str):
+        day = datetime.date.fromisoformat(day)
+    return day.toordinal()
+
+
+def _ones_above(bits, i):
+    """Length of the run of set bits starting at bit i."""
+    x = bits >> i
+    return (x ^ (x + 1)).bit_length() - 1
+
+
+def _ones_below(bits, i):
+    """Length of the run of set bits ending at bit i - 1."""
+    zeros = ~bits & ((1 << i) - 1)
+    return i - zeros.bit_length()
+
+
+class HabitLog:
+    def __init__(self, days=()):
+        self.start = None          # ordinal of bit 0
+        self.bits = 0
+        self.total = 0
+        self.longest = 0
+        self.run_end = None        # last day (ordinal) of the latest run
+        self.run_length = 0
+        for day in sorted({_ordinal(day) for day in days}):  # oldest first: no shifting
+            self.mark(day)
+
+    def __contains__(self, day):
+        i = _ordinal(day) - (self.start or 0)
+        return self.start is not None and i >= 0 and bool(self.bits >> i & 1)
+
+    def __len__(self):
+        return self.total
+
+    def mark(self, day):
+        """Record the habit as done on day; returns False if it already was."""
+        d = _ordinal(day)
+        if self.start is None:
+            self.start = d
+        elif d < self.start:
+            self.bits <<= self.start - d
+            self.start = d
+        i = d - self.start
+        if self.bits >> i & 1:
+            return False
+        self.bits |= 1 << i
+        self.total += 1
+
+        # The new day joins the runs on either side of it
+        before = _ones_below(self.bits, i)
+        after = _ones_above(self.bits, i + 1)
+        self.longest = max(self.longest, before + 1 + after)
+        if self.run_end is None or d + after >= self.run_end:
+            self.run_end = d + after
+            self.run_length = before + 1 + after
+        return True
+
+    def unmark(self, day):
+        if day not in self:
+            return False
+        d = _ordinal(day)
+        self.bits &= ~(1 << (d - self.start))
+        self.total -= 1
+        self._recount()
+        return True
+
+    def _recount(self):
+        """Streak fields from scratch (only needed after an unmark)."""
+        runs = run_lengths(self.to_array())
+        self.longest = int(runs.max()) if runs.size else 0
+        if self.bits:
+            last = self.bits.bit_length() - 1
+            self.run_end = self.start + last
+            self.run_length = _ones_below(self.bits, last + 1)
+        else:
+            self.start, self.run_end, self.run_length = None, None, 0
+
+    def streak(self, today=None):
+        """Current streak: the latest run, if it ends today or yesterday."""
+        if self.run_end is None:
+            return 0
+        today = _ordinal(today or datetime.date.today())
+        return self.run_length if today - self.run_end <= 1 else 0
+
+    def rate(self, days=30, today=None):
+        """Share of the last `days` days (including today) the habit was done."""
+        if self.start is None:
+            return 0.0
+        first = _ordinal(today or datetime.date.today()) - days + 1
+        shift = first - self.start
+        window = self.bits >> shift if shift >= 0 else self.bits << -shift
+        return (window & ((1 << days) - 1)).bit_count() / days
+
+    def to_array(self):
+        """One bool per day from start, via the bitset's bytes."""
+        if not self.bits:
+            return np.zeros(0, dtype=bool)
+        raw = self.bits.to_bytes((self.bits.bit_length() + 7) // 8, "little")
+        return np.unpackbits(np.frombuffer(raw, dtype=np.uint8), bitorder="little").astype(bool)
+
+    def days(self):
+        return [datetime.date.fromordinal(self.start + int(i)) for i in np.flatnonzero(self.to_array())]
+
+
+def run_lengths(done):
+    """Lengths of the runs of True in a bool array."""
+    edges = np.diff(np.concatenate(([0], done.astype(np.int8), [0])))
+    return np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+
+
+def heatmap(logs, weeks=26, today=None):
+    """Weekday x week grid of completions summed over logs.
+
+    Returns (counts, week start dates): counts has shape (7, weeks) with
+    Monday in row 0; days after today are NaN.
+    """
+    today = today or datetime.date.today()
+    last = today.toordinal()
+    first = last - today.weekday() - 7 * (weeks - 1)  # a Monday
+    counts = np.zeros(7 * weeks)
+    for log in logs:
+        if log.start is None:
+            continue
+        done = log.to_array()
+        lo, hi = max(first, log.start), min(last, log.start + len(done) - 1)
+        if lo <= hi:
+            counts[lo - first:hi - first + 1] += done[lo - log.start:hi - log.start + 1]
+    counts[last - first + 1:] = np.nan
+    week_starts = [datetime.date.fromordinal(first + 7 * w) for w in range(weeks)]
+    return counts.reshape(weeks, 7).T, week_starts
@@ -0,0 +1,265 @@
+"""Persistent daily journal with an incremental inverted index.
+
+Entries (one per day) are stored in SQLite, in the visitor's folder (see
+user_store) or, with path None, in memory for one session.
+The index is built once when the journal is opened and, after that, only
+the entry being saved or deleted is re-indexed:
+
+    words   word → dates, for AND-ed prefix words and "exact phrases"
+    text    date → normalized words joined by spaces, to confirm phrase candidates
+    tags    tag → dates;  moods  mood → dates
+    dates   sorted ISO dates, for date-range filters with bisect
+    trend   (period, key) → [mood score sum, count], weekly and monthly
+
+so searches and mood trends never scan the entries themselves.
+"""
+import bisect
+import datetime
+import json
+import re
+import sqlite3
+import threading
+import time
+
+from json_utils import USER_DIR
+from search_index import normalize
+
+DB_PATH = USER_DIR / "journal.db"
+
+MOODS = ["😞 Terrible", "😕 Bad", "😐 Okay", "🙂 Good", "😄 Great"]
+MOOD_SCORES = {mood: score for score, mood in enumerate(MOODS, start=1)}
+TAGS = ["Personal", "Academic", "Goals", "Challenges", "Achievements", "Reflection"]
+
+MIGRATIONS = [
+    """
+    CREATE TABLE entries (
+        date TEXT PRIMARY KEY,
+        entry TEXT NOT NULL,
+        mood TEXT NOT NULL,
+        tags TEXT NOT NULL DEFAULT '[]',
+        updated REAL NOT NULL
+    );
+    """,
+]
+
+_WORD = re.compile(r"\w+")
+_PHRASE = re.compile(r'"([^"]*)"')
+
+
+def tokenize(text):
+    return _WORD.findall(normalize(text))
+
+
+def _periods(date):
+    day = datetime.date.fromisoformat(date)
+    year, week, _ = day.isocalendar()
+    return [("M", date[:7]), ("W", f"{year}-W{week:02d}")]
+
+
+class Journal:
+    """Thread-safe journal, shared by the sessions of one user."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        if path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(str(path) if path is not None else ":memory:", check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+
+        self.entries = {}
+        self._words = {}
+        self._text = {}
+        self._vocab = []
+        self._tags = {}
+        self._moods = {}
+        self._dates = []
+        self._trend = {}
+        for row in self._db.execute("SELECT date, entry, mood, tags FROM entries ORDER BY date"):
+            self._index(row["date"], {"date": row["date"], "entry": row["entry"], "mood": row["mood"],
+                                      "tags": json.loads(row["tags"])})
+
+    def _migrate(self):
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        for number, script in enumerate(MIGRATIONS[version:], start=version + 1):
+            with self._db:
+                self._db.executescript(script)
+                self._db.execute(f"PRAGMA user_version = {number}")
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, date):
+        return self.entries.get(str(date))
+
+    # ---- changes ----
+    def save(self, date, entry, mood, tags=()):
+        date = str(date)
+        data = {"date": date, "entry": entry, "mood": mood, "tags": list(tags)}
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (date, entry, mood, tags, updated) VALUES (?, ?, ?, ?, ?)",
+                (date, entry, mood, json.dumps(data["tags"], ensure_ascii=False), time.time()))
+            self._unindex(date)
+            self._index(date, data)
+
+    def delete(self, date):
+        date = str(date)
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries WHERE date = ?", (date,))
+            self._unindex(date)
+
+    # ---- index maintenance ----
+    def _index(self, date, data):
+        self.entries[date] = data
+        words = tokenize(data["entry"])
+        self._text[date] = f" {' '.join(words)} "
+        for word in set(words):
+            postings = self._words.get(word)
+            if postings is None:
+                postings = self._words[word] = set()
+                bisect.insort(self._vocab, word)
+            postings.add(date)
+        for tag in data["tags"]:
+            self._tags.setdefault(tag, set()).add(date)
+        self._moods.setdefault(data["mood"], set()).add(date)
+        i = bisect.bisect_left(self._dates, date)
+        if i == len(self._dates) or self._dates[i] != date:
+            self._dates.insert(i, date)
+        score = MOOD_SCORES.get(data["mood"])
+        if score:
+            for key in _periods(date):
+                totals = self._trend.setdefault(key, [0, 0])
+                totals[0] += score
+                totals[1] += 1
+
+    def _unindex(self, date):
+        data = self.entries.pop(date, None)
+        if data is None:
+            return
+        del self._text[date]
+        for word in set(tokenize(data["entry"])):
+            postings = self._words[word]
+            postings.discard(date)
+            if not postings:
+                del self._words[word]
+                del self._vocab[bisect.bisect_left(self._vocab, word)]
+        for tag in data["tags"]:
+            self._tags[tag].discard(date)
+            if not self._tags[tag]:
+                del self._tags[tag]
+        self._moods[data["mood"]].discard(date)
+        if not self._moods[data["mood"]]:
+            del self._moods[data["mood"]]
+        del self._dates[bisect.bisect_left(self._dates, date)]
+        score = MOOD_SCORES.get(data["mood"])
+        if score:
+            for key in _periods(date):
+                totals = self._trend[key]
+                totals[0] -= score
+                totals[1] -= 1
+                if not totals[1]:
+                    del self._trend[key]
+
+    # ---- search ----
+    def _prefix(self, word):
+        dates = set()
+        for i in range(bisect.bisect_left(self._vocab, word), len(self._vocab)):
+            if not self._vocab[i].startswith(word):
+                break
+            dates.update(self._words[self._vocab[i]])
+        return dates
+
+    def _phrase(self, words, candidates=None):
+        """Dates whose entry has words consecutively; only candidates are checked."""
+        postings = [self._words.get(word) for word in words]
+        if not all(postings):
+            return set()
+        postings.sort(key=len)
+        dates = set(candidates) if candidates is not None else set(postings[0])
+        dates = dates.intersection(*postings)
+        if len(words) == 1:
+            return dates
+        phrase = f" {' '.join(words)} "
+        return {date for date in dates if phrase in self._text[date]}
+
+    def search(self, text="", mood=None, tags=(), after=None, before=None):
+        """Matching dates, newest first.
+
+        text: words (prefix match, all required) and "quoted phrases"
+        (consecutive words, exact); after/before bound the date, inclusive.
+        """
+        sets = []
+        for word in tokenize(_PHRASE.sub(" ", text or "")):
+            sets.append(self._prefix(word))
+        if mood:
+            sets.append(self._moods.get(mood, set()))
+        for tag in tags:
+            sets.append(self._tags.get(tag, set()))
+        phrases = [words for words in map(tokenize, _PHRASE.findall(text or "")) if words]
+
+        lo = bisect.bisect_left(self._dates, str(after)) if after else 0
+        hi = bisect.bisect_right(self._dates, str(before)) if before else len(self._dates)
+        if not sets and not phrases:
+            return self._dates[lo:hi][::-1]
+        if after or before:
+            sets.append(self._dates[lo:hi])
+        dates = None
+        if sets:
+            sets.sort(key=len)
+            dates = set(sets[0]).intersection(*sets[1:])
+        # Phrases last: only dates that survived the rest are checked
+        for words in phrases:
+            dates = self._phrase(words, dates)
+        return sorted(dates, reverse=True)
+
+    def snippet(self, date, text, width=80):
+        """The entry around the first query word, with query words in bold."""
+        words = tokenize(text or "")
+        entry = self.entries[date]["entry"]
+        if not words:
+            return entry[:2 * width] + ("…" if len(entry) > 2 * width else "")
+        pattern = re.compile(r"\b(" + "|".join(re.escape(w) for w in words) + r")\w*", re.IGNORECASE)
+        first = pattern.search(entry)
+        start = max(0, first.start() - width) if first else 0
+        clip = entry[start:start + 2 * width]
+        clip = pattern.sub(lambda m: f"**{m.group(0)}**", clip)
+        return ("…" if start else "") + clip + ("…" if start + 2 * width < len(entry) else "")
+
+    # ---- trends ----
+    def mood_trend(self, period="W", after=None, before=None):
+        """[(period key, average mood score, entries)] in date order; period "W" or "M"."""
+        first = _periods(str(after))[0 if period == "M" else 1][1] if after else ""
+        last = _periods(str(before))[0 if period == "M" else 1][1] if before else "~"
+        return sorted((key, total / count, count) for (kind, key), (total, count) in self._trend.items()
+                      if kind == period and first <= key <= last)
+
+    def streak(self, today=None):
+        """Consecutive days with an entry, ending today or yesterday."""
+        day = today or datetime.date.today()
+        if str(day) not in self.entries:
+            day -= datetime.timedelta(days=1)
+        count = 0
+        while str(day) in self.entries:
+            count += 1
+            day -= datetime.timedelta(days=1)
+        return count
+
+    # ---- list_view interface ----
+    def values(self, field):
+        source = self._moods if field == "mood" else self._tags
+        order = MOODS if field == "mood" else TAGS
+        return [v for v in order if v in source] + sorted(v for v in source if v not in order)
+
+    def query(self, sort=None, descending=True, filters=None, search="", offset=0, limit=20):
+        filters = dict(filters or {})
+        tags = [filters.pop("tags")] if "tags" in filters else []
+        dates = self.search(search, filters.get("mood"), tags, filters.get("after"), filters.get("before"))
+        if not descending:
+            dates.reverse()
+        return [(date, self.entries[date]) for date in dates[offset:offset + limit]], len(dates)
+
+    def close(self):
+        self._db.close()
@@ -2,6 +2,11 @@ import json
 import os
 from pathlib import Path
 
+import data_store
+
+# Data the user creates (flashcard deck, expense ledger); SUH_USER_DATA moves it
+USER_DIR = Path(os.environ.get("SUH_USER_DATA") or Path(__file__).parent / "data" / "user")
+
 def load_json_data(filename):
     """Load JSON data from the data directory"""
     try:
@@ -13,6 +18,24 @@ def load_json_data(filename):
     except Exception as e:
         return {}
 
+def data_stamp(filename):
+    """mtime of a data file, for cache keys that must change when the file does"""
+    try:
+        return os.stat(Path(__file__).parent / 'data' / filename).st_mtime_ns
+    except OSError:
+        return 0
+
+def load_reference_data(filename):
+    """Read-only reference data, served from the shared memory-mapped store.
+
+    Falls back to the JSON file when the store is missing or older than it.
+    The result is a read-only Mapping; use load_json_data to get a copy to edit.
+    """
+    store = data_store.open_store()
+    if store is not None and store.is_fresh(filename):
+        return store.document(filename)
+    return load_json_data(filename)
+
 def save_json_data(filename, data):
     """Save JSON data to the data directory"""
     try:
@@ -20,6 +43,8 @@ def save_json_data(filename, data):
         os.makedirs(os.path.dirname(data_path), exist_ok=True)
         with open(data_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
+        if filename in data_store.REFERENCE_FILES and data_store.STORE_PATH.exists():
+            data_store.build()
         return True
     except Exception as e:
         return False
@@ -0,0 +1,101 @@
+import os
+import time
+
+import streamlit as st
+from streamlit.runtime.uploaded_file_manager import UploadedFile
+
+import perf_monitor
+
+# SUH_EAGER_TABS=1 restores the old behaviour (every body runs on every
+# rerun); used by benchmarks/bench_reruns.py for before/after numbers
+EAGER = os.environ.get("SUH_EAGER_TABS", "").lower() not in ("", "0", "false", "no")
+
+_KEYS = "_lazy_tab_keys"
+
+
+class LazyTab:
+    """One tab of lazy_tabs.tabs(); only the open tab's body should run.
+
+        if tabs[0].open:
+            with tabs[0]:
+                ...
+    """
+
+    def __init__(self, container, scope, label, is_open):
+        self._container = container
+        self._scope = scope
+        self._label = label
+        self.open = is_open
+        self._before = None
+        self._start = None
+
+    def __enter__(self):
+        self._container.__enter__()
+        self._before = set(st.session_state.keys())
+        self._start = time.perf_counter()
+        return self._container
+
+    def __exit__(self, *exc):
+        if perf_monitor.ENABLED:
+            perf_monitor.record(f"tab.{self._scope}.{self._label}", time.perf_counter() - self._start)
+        # Remember which session keys this body owns so they survive while hidden
+        created = set(st.session_state.keys()) - self._before
+        if created:
+            owned = st.session_state[_KEYS].setdefault((self._scope, self._label), set())
+            owned.update(created)
+        return self._container.__exit__(*exc)
+
+    def __getattr__(self, attr):
+        return getattr(self._container, attr)
+
+
+def _keep_alive(keys):
+    """Re-assign widget values so Streamlit does not drop them while their widget is not drawn."""
+    for key in keys:
+        if key not in st.session_state:
+            continue
+        value = st.session_state[key]
+        if isinstance(value, UploadedFile) or (
+                isinstance(value, list) and value and isinstance(value[0], UploadedFile)):
+            continue
+        try:
+            st.session_state[key] = value
+        except st.errors.StreamlitAPIException:
+            pass
+
+
+def _native_tabs(labels, key):
+    try:
+        containers = st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        return None
+    return [(c, c.open) for c in containers]
+
+
+def _radio_tabs(labels, key):
+    # Older Streamlit without tab state: a horizontal radio picks the tab
+    active = st.radio("Section", labels, horizontal=True, key=key, label_visibility="collapsed")
+    body = st.container()
+    return [(body if label == active else st.empty(), label == active) for label in labels]
+
+
+def tabs(scope, labels):
+    """st.tabs replacement that runs only the selected tab's body.
+
+    Keyed widget values in hidden tabs are preserved, tab bodies are timed
+    through perf_monitor, and the selected tab is stored under
+    st.session_state[f"tabs_{scope}"].
+    """
+    registry = st.session_state.setdefault(_KEYS, {})
+    key = f"tabs_{scope}"
+
+    if EAGER:
+        return [LazyTab(c, scope, label, True) for c, label in zip(st.tabs(labels), labels)]
+
+    entries = _native_tabs(labels, key) or _radio_tabs(labels, key)
+    result = []
+    for (container, is_open), label in zip(entries, labels):
+        if not is_open:
+            _keep_alive(registry.get((scope, label), ()))
+        result.append(LazyTab(container, scope, label, is_open))
+    return result
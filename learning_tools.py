@@ -3,346 +3,418 @@ import datetime
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 import io
-import random
+import time
+from pathlib import Path
 import json_utils
+import lazy_tabs
+import list_view
+import formula_index
+import flashcard_store
+import flashcard_io
+import user_store
+
+FORMULAS_PER_PAGE = 10
+CARDS_PER_PAGE = 100
+
+@st.cache_resource
+def _deck_at(folder):
+    """A persistent deck, opened once per user folder."""
+    return flashcard_store.Deck(Path(folder) / "flashcards.db")
+
+def get_deck():
+    """This visitor's own flashcard deck (see user_store)."""
+    return user_store.get("flashcards", _deck_at, lambda: flashcard_store.Deck(None))
+
+def _add_flashcard():
+    """Add button callback: runs before the rerun, so the inputs can be cleared."""
+    question = st.session_state.fc_question.strip()
+    answer = st.session_state.fc_answer.strip()
+    if not (question and answer):
+        return
+    deck = get_deck()
+    if deck.has_question(question):
+        st.session_state.fc_message = ("warning", "A card with this question already exists.")
+        return
+    deck.add(question, answer, st.session_state.fc_category)
+    st.session_state.fc_question = st.session_state.fc_answer = ""
+    st.session_state.fc_message = ("success", "Flashcard added!")
+
+@st.cache_resource
+def _formula_index(stamp):
+    return formula_index.FormulaIndex(json_utils.load_reference_data('formulas.json'))
+
+def get_formula_index():
+    """Shared formula search index, rebuilt only when formulas.json changes."""
+    return _formula_index(json_utils.data_stamp('formulas.json'))
+
+@st.cache_data(max_entries=256)
+def formula_page(stamp, query, category, page, per_page):
+    """(markdown for one page of results, total matches); the browser renders the math."""
+    results = _formula_index(stamp).search(query, category)
+    start = (page - 1) * per_page
+    return formula_index.render_markdown(results[start:start + per_page]), len(results)
 
 def show():
     st.markdown("## 📚 Learning & Academic Tools")
     
-    tabs = st.tabs(["Flashcard Maker", "Assignment Tracker", "Lecture Notes", "Citation Generator", "Formula Sheet"])
+    tabs = lazy_tabs.tabs("learning_tools", ["Flashcard Maker", "Assignment Tracker", "Lecture Notes", "Citation Generator", "Formula Sheet"])
     
     # Flashcard Maker
-    with tabs[0]:
-        st.markdown("### 🃏 Flashcard Maker")
+    if tabs[0].open:
+        with tabs[0]:
+            st.markdown("### 🃏 Flashcard Maker")
         
-        if 'flashcards' not in st.session_state:
-            st.session_state.flashcards = []
-        if 'study_mode' not in st.session_state:
-            st.session_state.study_mode = False
-        if 'current_card' not in st.session_state:
-            st.session_state.current_card = 0
-        if 'show_answer' not in st.session_state:
-            st.session_state.show_answer = False
+            deck = get_deck()
+            if 'study_mode' not in st.session_state:
+                st.session_state.study_mode = False
+            if 'show_answer' not in st.session_state:
+                st.session_state.show_answer = False
         
-        if not st.session_state.study_mode:
-            st.markdown("#### Create Flashcards")
+            if not st.session_state.study_mode:
+                st.markdown("#### Create Flashcards")
             
-            col1, col2 = st.columns(2)
-            with col1:
-                question = st.text_area("Question/Front", height=100, key="fc_question")
-            with col2:
-                answer = st.text_area("Answer/Back", height=100, key="fc_answer")
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.text_area("Question/Front", height=100, key="fc_question")
+                with col2:
+                    st.text_area("Answer/Back", height=100, key="fc_answer")
             
-            category = st.selectbox("Category", ["General", "Math", "Science", "History", "Language", "Other"])
+                st.selectbox("Category", ["General", "Math", "Science", "History", "Language", "Other"], key="fc_category")
             
-            if st.button("➕ Add Flashcard"):
-                if question and answer:
-                    st.session_state.flashcards.append({
-                        "question": question,
-                        "answer": answer,
-                        "category": category,
-                        "created": datetime.datetime.now().strftime("%Y-%m-%d")
-                    })
-                    st.success("Flashcard added!")
-                    st.rerun()
+                st.button("➕ Add Flashcard", on_click=_add_flashcard)
+                if 'fc_message' in st.session_state:
+                    kind, message = st.session_state.pop('fc_message')
+                    getattr(st, kind)(message)
             
-            if st.session_state.flashcards:
-                st.markdown(f"### 📚 Your Flashcards ({len(st.session_state.flashcards)})")
+                with st.expander("📥 Import / 📤 Export"):
+                    st.caption("CSV with question, answer, category columns · Anki plain-text notes (.txt/.tsv) · "
+                               "JSON array or JSON Lines. Questions already in the deck are skipped.")
+                    upload = st.file_uploader("Import cards", type=["csv", "tsv", "txt", "json", "jsonl", "ndjson"],
+                                              key="fc_import")
+                    if upload is not None and st.button("📥 Import"):
+                        try:
+                            with st.spinner("Importing..."):
+                                report = flashcard_io.import_file(deck, upload, flashcard_io.detect_format(upload.name))
+                        except (ValueError, UnicodeError) as e:
+                            st.error(f"Import stopped: {e}")
+                        else:
+                            st.success(f"Imported: {report}")
+                            for error in report.errors:
+                                st.caption(error)
                 
-                for idx, card in enumerate(st.session_state.flashcards):
-                    with st.expander(f"🃏 {card['category']} - {card['question'][:50]}..."):
-                        st.markdown(f"**Q:** {card['question']}")
-                        st.markdown(f"**A:** {card['answer']}")
-                        st.text(f"Created: {card['created']}")
-                        
-                        if st.button("🗑️ Delete", key=f"del_fc_{idx}"):
-                            st.session_state.flashcards.pop(idx)
-                            st.rerun()
+                    if len(deck):
+                        fmt = st.radio("Export as", ["csv", "tsv", "json"], horizontal=True, key="fc_export_format",
+                                       format_func={"csv": "CSV", "tsv": "Anki (TSV)", "json": "JSON"}.get)
+                        # Written only when the button is clicked, on a separate thread
+                        st.download_button("📤 Export deck", lambda: flashcard_io.export_file(deck, fmt),
+                                           file_name=f"flashcards.{'txt' if fmt == 'tsv' else fmt}",
+                                           mime=flashcard_io.MIME_TYPES[fmt])
+            
+                if len(deck):
+                    due = deck.due_count()
+                    st.markdown(f"### 📚 Your Flashcards ({len(deck)})")
+                    st.caption(f"{due} due now · {deck.review_count(time.time() - flashcard_store.DAY)} reviews in the last 24 h")
                 
-                if st.button("🎓 Start Study Mode", type="primary"):
-                    random.shuffle(st.session_state.flashcards)
-                    st.session_state.study_mode = True
-                    st.session_state.current_card = 0
-                    st.session_state.show_answer = False
-                    st.rerun()
-        else:
-            # Study Mode
-            if st.session_state.flashcards:
-                card = st.session_state.flashcards[st.session_state.current_card]
+                    col1, col2 = st.columns([3, 1])
+                    with col1:
+                        search = st.text_input("🔍 Search cards", key="fc_search")
+                    with col2:
+                        category_filter = st.selectbox("Category filter", ["All"] + deck.categories(), key="fc_filter")
+                    category_filter = None if category_filter == "All" else category_filter
                 
-                st.markdown(f"### Card {st.session_state.current_card + 1} of {len(st.session_state.flashcards)}")
-                st.progress((st.session_state.current_card + 1) / len(st.session_state.flashcards))
+                    # Only the visible page is fetched; the table itself scrolls virtually
+                    total = deck.count(search, category_filter)
+                    pages = formula_index.page_count(total, CARDS_PER_PAGE)
+                    if st.session_state.get("fc_page", 1) > pages:
+                        st.session_state["fc_page"] = 1
+                    page = st.number_input("Page", 1, pages, 1, key="fc_page") if pages > 1 else 1
+                    cards = deck.page(search, category_filter, (page - 1) * CARDS_PER_PAGE, CARDS_PER_PAGE)
+                    st.caption(f"{total} matching cards")
                 
-                st.markdown(f"**Category:** {card['category']}")
+                    rows = [{
+                        "Question": card['question'],
+                        "Answer": card['answer'],
+                        "Category": card['category'],
+                        "Reviews": card['reps'] + card['lapses'],
+                        "Next review": datetime.datetime.fromtimestamp(card['due']),
+                        "Created": datetime.datetime.fromtimestamp(card['created']),
+                    } for card in cards]
+                    table = st.dataframe(rows, hide_index=True, use_container_width=True, key="fc_table",
+                                         on_select="rerun", selection_mode="multi-row")
+                    selected = [cards[i]['id'] for i in table.selection.rows if i < len(cards)]
+                    if selected and st.button(f"🗑️ Delete {len(selected)} selected"):
+                        deck.delete(*selected)
+                        st.rerun()
                 
-                if not st.session_state.show_answer:
-                    st.markdown("### 🃏 Question:")
-                    st.info(card['question'])
-                    
-                    if st.button("🔍 Show Answer", type="primary"):
-                        st.session_state.show_answer = True
+                    if st.button("🎓 Start Study Mode", type="primary", disabled=not due):
+                        st.session_state.study_mode = True
+                        st.session_state.show_answer = False
+                        st.rerun()
+            else:
+                # Study Mode: always the most overdue card, straight from the due queue
+                card = deck.next_due()
+                if card is None:
+                    next_time = deck.next_due_time()
+                    st.success("🎉 All caught up!")
+                    if next_time:
+                        st.caption(f"Next card due in {flashcard_store.describe_interval(next_time - time.time())}")
+                    if st.button("Exit Study Mode"):
+                        st.session_state.study_mode = False
                         st.rerun()
                 else:
+                    st.markdown(f"### {deck.due_count()} cards due")
+                    st.markdown(f"**Category:** {card['category']}")
+                
                     st.markdown("### 🃏 Question:")
                     st.info(card['question'])
-                    st.markdown("### ✅ Answer:")
-                    st.success(card['answer'])
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        if st.button("← Previous"):
-                            if st.session_state.current_card > 0:
-                                st.session_state.current_card -= 1
-                                st.session_state.show_answer = False
-                                st.rerun()
-                    with col2:
-                        if st.button("Next →"):
-                            if st.session_state.current_card < len(st.session_state.flashcards) - 1:
-                                st.session_state.current_card += 1
-                                st.session_state.show_answer = False
-                                st.rerun()
-                    with col3:
-                        if st.button("Exit Study Mode"):
-                            st.session_state.study_mode = False
+                
+                    if not st.session_state.show_answer:
+                        if st.button("🔍 Show Answer", type="primary"):
+                            st.session_state.show_answer = True
                             st.rerun()
+                    else:
+                        st.markdown("### ✅ Answer:")
+                        st.success(card['answer'])
+                    
+                        preview = deck.preview(card)
+                        cols = st.columns(len(flashcard_store.GRADES))
+                        for col, (label, grade) in zip(cols, flashcard_store.GRADES.items()):
+                            with col:
+                                if st.button(f"{label} · {preview[label]}", key=f"fc_grade_{label}",
+                                             use_container_width=True):
+                                    deck.review(card['id'], grade)
+                                    st.session_state.show_answer = False
+                                    st.rerun()
+                
+                    if st.button("Exit Study Mode"):
+                        st.session_state.study_mode = False
+                        st.rerun()
     
     # Assignment Tracker
-    with tabs[1]:
-        st.markdown("### 📝 Assignment Tracker")
+    if tabs[1].open:
+        with tabs[1]:
+            st.markdown("### 📝 Assignment Tracker")
         
-        if 'assignments' not in st.session_state:
-            st.session_state.assignments = []
+            assignments = list_view.item_list('assignments', sort=["due_date", "priority", "name"],
+                                              index=["subject", "priority", "status"], text=["name", "subject"])
         
-        # Load categories from JSON
-        settings_data = json_utils.load_json_data('custom_settings.json')
-        assignment_cats = settings_data.get('assignment_categories', ["Homework", "Project", "Essay"])
-        priority_levels = settings_data.get('priority_levels', ["🔴 High", "🟡 Medium", "🟢 Low"])
+            # Load categories from JSON
+            settings_data = json_utils.load_json_data('custom_settings.json')
+            assignment_cats = settings_data.get('assignment_categories', ["Homework", "Project", "Essay"])
+            priority_levels = settings_data.get('priority_levels', ["🔴 High", "🟡 Medium", "🟢 Low"])
         
-        col1, col2, col3 = st.columns([2, 1, 1])
-        with col1:
-            assignment_name = st.text_input("Assignment Name", key="assign_name")
-        with col2:
-            subject = st.text_input("Subject", key="assign_subject")
-        with col3:
-            due_date = st.date_input("Due Date", key="assign_due")
+            col1, col2, col3 = st.columns([2, 1, 1])
+            with col1:
+                assignment_name = st.text_input("Assignment Name", key="assign_name")
+            with col2:
+                subject = st.text_input("Subject", key="assign_subject")
+            with col3:
+                due_date = st.date_input("Due Date", key="assign_due")
         
-        col_a, col_b, col_c = st.columns(3)
-        with col_a:
-            category = st.selectbox("Category", assignment_cats, key="assign_cat")
-        with col_b:
-            priority = st.selectbox("Priority", priority_levels, key="assign_priority")
-        with col_c:
-            status = st.selectbox("Status", ["Not Started", "In Progress", "Submitted", "Graded"], key="assign_status")
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                category = st.selectbox("Category", assignment_cats, key="assign_cat")
+            with col_b:
+                priority = st.selectbox("Priority", priority_levels, key="assign_priority")
+            with col_c:
+                status = st.selectbox("Status", ["Not Started", "In Progress", "Submitted", "Graded"], key="assign_status")
         
-        grade = st.text_input("Grade (optional)", key="assign_grade")
+            grade = st.text_input("Grade (optional)", key="assign_grade")
         
-        if st.button("➕ Add Assignment"):
-            if assignment_name:
-                st.session_state.assignments.append({
-                    "name": assignment_name,
-                    "subject": subject,
-                    "due_date": str(due_date),
-                    "priority": priority,
-                    "status": status,
-                    "grade": grade,
-                    "created": datetime.datetime.now().strftime("%Y-%m-%d")
-                })
-                st.success("Assignment added!")
-                st.rerun()
+            if st.button("➕ Add Assignment"):
+                if assignment_name:
+                    assignments.add({
+                        "name": assignment_name,
+                        "subject": subject,
+                        "due_date": str(due_date),
+                        "priority": priority,
+                        "status": status,
+                        "grade": grade,
+                        "created": datetime.datetime.now().strftime("%Y-%m-%d")
+                    })
+                    st.success("Assignment added!")
+                    st.rerun()
         
-        if st.session_state.assignments:
-            st.markdown("---")
-            st.markdown("### 📋 Your Assignments")
-            
-            # Sort by due date
-            sorted_assignments = sorted(st.session_state.assignments, key=lambda x: x['due_date'])
+            if len(assignments):
+                st.markdown("---")
+                st.markdown("### 📋 Your Assignments")
             
-            for idx, assign in enumerate(sorted_assignments):
-                days_left = (datetime.datetime.strptime(assign['due_date'], "%Y-%m-%d").date() - datetime.date.today()).days
+                def show_assignment(assign_id, assign):
+                    days_left = (datetime.datetime.strptime(assign['due_date'], "%Y-%m-%d").date() - datetime.date.today()).days
                 
-                with st.expander(f"{assign['priority']} {assign['name']} - Due: {assign['due_date']} ({days_left} days)"):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.write(f"**Subject:** {assign['subject']}")
-                        st.write(f"**Status:** {assign['status']}")
-                    with col2:
-                        st.write(f"**Priority:** {assign['priority']}")
-                        if assign['grade']:
-                            st.write(f"**Grade:** {assign['grade']}")
+                    with st.expander(f"{assign['priority']} {assign['name']} - Due: {assign['due_date']} ({days_left} days)"):
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.write(f"**Subject:** {assign['subject']}")
+                            st.write(f"**Status:** {assign['status']}")
+                        with col2:
+                            st.write(f"**Priority:** {assign['priority']}")
+                            if assign['grade']:
+                                st.write(f"**Grade:** {assign['grade']}")
                     
-                    if st.button("🗑️ Delete", key=f"del_assign_{idx}"):
-                        st.session_state.assignments.remove(assign)
-                        st.rerun()
+                        if st.button("🗑️ Delete", key=f"del_assign_{assign_id}"):
+                            assignments.remove(assign_id)
+                            st.rerun()
             
-            # Statistics
-            total = len(st.session_state.assignments)
-            submitted = sum(1 for a in st.session_state.assignments if a['status'] == 'Submitted')
-            graded = sum(1 for a in st.session_state.assignments if a['status'] == 'Graded')
+                list_view.render(assignments, "assign", show_assignment,
+                                 sort_options={"Due date": ("due_date", False), "Priority": ("priority", False),
+                                               "Name": ("name", False)},
+                                 filters={"Status": "status", "Priority": "priority"})
             
-            st.markdown("---")
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total", total)
-            with col2:
-                st.metric("Submitted", submitted)
-            with col3:
-                st.metric("Graded", graded)
+                # Statistics
+                total = len(assignments)
+                submitted = assignments.count(status='Submitted')
+                graded = assignments.count(status='Graded')
+            
+                st.markdown("---")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Total", total)
+                with col2:
+                    st.metric("Submitted", submitted)
+                with col3:
+                    st.metric("Graded", graded)
     
     # Lecture Notes to PDF
-    with tabs[2]:
-        st.markdown("### 📓 Lecture Notes Editor")
+    if tabs[2].open:
+        with tabs[2]:
+            st.markdown("### 📓 Lecture Notes Editor")
         
-        st.info("Write your notes and export them as PDF!")
+            st.info("Write your notes and export them as PDF!")
         
-        note_title = st.text_input("Note Title", "My Lecture Notes")
-        subject = st.text_input("Subject/Course", "General")
-        date = st.date_input("Date", datetime.date.today())
+            note_title = st.text_input("Note Title", "My Lecture Notes")
+            subject = st.text_input("Subject/Course", "General")
+            date = st.date_input("Date", datetime.date.today())
         
-        notes_content = st.text_area("Write your notes here...", height=400, 
-                                     placeholder="Type your lecture notes, summaries, or study materials here...")
+            notes_content = st.text_area("Write your notes here...", height=400, 
+                                         placeholder="Type your lecture notes, summaries, or study materials here...")
         
-        if st.button("📥 Export to PDF"):
-            if notes_content:
-                buffer = io.BytesIO()
-                c = canvas.Canvas(buffer, pagesize=letter)
+            if st.button("📥 Export to PDF"):
+                if notes_content:
+                    buffer = io.BytesIO()
+                    c = canvas.Canvas(buffer, pagesize=letter)
                 
-                # Title
-                c.setFont("Helvetica-Bold", 18)
-                c.drawString(50, 750, note_title)
+                    # Title
+                    c.setFont("Helvetica-Bold", 18)
+                    c.drawString(50, 750, note_title)
                 
-                # Metadata
-                c.setFont("Helvetica", 12)
-                c.drawString(50, 730, f"Subject: {subject}")
-                c.drawString(50, 710, f"Date: {date}")
+                    # Metadata
+                    c.setFont("Helvetica", 12)
+                    c.drawString(50, 730, f"Subject: {subject}")
+                    c.drawString(50, 710, f"Date: {date}")
                 
-                # Content
-                c.setFont("Helvetica", 11)
-                y = 680
-                for line in notes_content.split('\n'):
-                    if y < 50:
-                        c.showPage()
-                        y = 750
-                    c.drawString(50, y, line[:80])
-                    y -= 20
+                    # Content
+                    c.setFont("Helvetica", 11)
+                    y = 680
+                    for line in notes_content.split('\n'):
+                        if y < 50:
+                            c.showPage()
+                            y = 750
+                        c.drawString(50, y, line[:80])
+                        y -= 20
                 
-                c.save()
-                buffer.seek(0)
+                    c.save()
+                    buffer.seek(0)
                 
-                st.download_button("📄 Download PDF", buffer, f"{note_title}.pdf", "application/pdf")
-                st.success("PDF ready to download!")
+                    st.download_button("📄 Download PDF", buffer, f"{note_title}.pdf", "application/pdf")
+                    st.success("PDF ready to download!")
     
     # Citation Generator
-    with tabs[3]:
-        st.markdown("### 📖 Citation Generator")
+    if tabs[3].open:
+        with tabs[3]:
+            st.markdown("### 📖 Citation Generator")
         
-        citation_style = st.selectbox("Citation Style", ["APA 7th", "MLA 9th", "Chicago"])
-        source_type = st.selectbox("Source Type", ["Book", "Journal Article", "Website", "Magazine"])
+            citation_style = st.selectbox("Citation Style", ["APA 7th", "MLA 9th", "Chicago"])
+            source_type = st.selectbox("Source Type", ["Book", "Journal Article", "Website", "Magazine"])
         
-        if source_type == "Book":
-            author = st.text_input("Author (Last, First)")
-            year = st.text_input("Year")
-            title = st.text_input("Book Title")
-            publisher = st.text_input("Publisher")
+            if source_type == "Book":
+                author = st.text_input("Author (Last, First)")
+                year = st.text_input("Year")
+                title = st.text_input("Book Title")
+                publisher = st.text_input("Publisher")
             
-            if st.button("Generate Citation"):
-                if citation_style == "APA 7th":
-                    citation = f"{author} ({year}). *{title}*. {publisher}."
-                elif citation_style == "MLA 9th":
-                    citation = f"{author}. *{title}*. {publisher}, {year}."
-                else:  # Chicago
-                    citation = f"{author}. *{title}*. {publisher}, {year}."
+                if st.button("Generate Citation"):
+                    if citation_style == "APA 7th":
+                        citation = f"{author} ({year}). *{title}*. {publisher}."
+                    elif citation_style == "MLA 9th":
+                        citation = f"{author}. *{title}*. {publisher}, {year}."
+                    else:  # Chicago
+                        citation = f"{author}. *{title}*. {publisher}, {year}."
                 
-                st.success("Citation Generated:")
-                st.code(citation)
-                st.button("📋 Copy Citation")
+                    st.success("Citation Generated:")
+                    st.code(citation)
+                    st.button("📋 Copy Citation")
         
-        elif source_type == "Journal Article":
-            author = st.text_input("Author (Last, First)")
-            year = st.text_input("Year")
-            article_title = st.text_input("Article Title")
-            journal = st.text_input("Journal Name")
-            volume = st.text_input("Volume")
-            pages = st.text_input("Pages")
+            elif source_type == "Journal Article":
+                author = st.text_input("Author (Last, First)")
+                year = st.text_input("Year")
+                article_title = st.text_input("Article Title")
+                journal = st.text_input("Journal Name")
+                volume = st.text_input("Volume")
+                pages = st.text_input("Pages")
             
-            if st.button("Generate Citation"):
-                if citation_style == "APA 7th":
-                    citation = f"{author} ({year}). {article_title}. *{journal}, {volume}*, {pages}."
-                elif citation_style == "MLA 9th":
-                    citation = f"{author}. \"{article_title}.\" *{journal}*, vol. {volume}, {year}, pp. {pages}."
-                else:
-                    citation = f"{author}. \"{article_title}.\" *{journal}* {volume} ({year}): {pages}."
+                if st.button("Generate Citation"):
+                    if citation_style == "APA 7th":
+                        citation = f"{author} ({year}). {article_title}. *{journal}, {volume}*, {pages}."
+                    elif citation_style == "MLA 9th":
+                        citation = f"{author}. \"{article_title}.\" *{journal}*, vol. {volume}, {year}, pp. {pages}."
+                    else:
+                        citation = f"{author}. \"{article_title}.\" *{journal}* {volume} ({year}): {pages}."
                 
-                st.success("Citation Generated:")
-                st.code(citation)
+                    st.success("Citation Generated:")
+                    st.code(citation)
         
-        elif source_type == "Website":
-            author = st.text_input("Author/Organization")
-            year = st.text_input("Year")
-            title = st.text_input("Page Title")
-            url = st.text_input("URL")
-            access_date = st.date_input("Access Date")
+            elif source_type == "Website":
+                author = st.text_input("Author/Organization")
+                year = st.text_input("Year")
+                title = st.text_input("Page Title")
+                url = st.text_input("URL")
+                access_date = st.date_input("Access Date")
             
-            if st.button("Generate Citation"):
-                if citation_style == "APA 7th":
-                    citation = f"{author} ({year}). *{title}*. Retrieved {access_date}, from {url}"
-                elif citation_style == "MLA 9th":
-                    citation = f"{author}. \"{title}.\" {year}. {url}. Accessed {access_date}."
-                else:
-                    citation = f"{author}. \"{title}.\" Accessed {access_date}. {url}."
+                if st.button("Generate Citation"):
+                    if citation_style == "APA 7th":
+                        citation = f"{author} ({year}). *{title}*. Retrieved {access_date}, from {url}"
+                    elif citation_style == "MLA 9th":
+                        citation = f"{author}. \"{title}.\" {year}. {url}. Accessed {access_date}."
+                    else:
+                        citation = f"{author}. \"{title}.\" Accessed {access_date}. {url}."
                 
-                st.success("Citation Generated:")
-                st.code(citation)
+                    st.success("Citation Generated:")
+                    st.code(citation)
     
     # Formula Sheet
-    with tabs[4]:
-        st.markdown("### 📐 Formula Sheet Library")
+    if tabs[4].open:
+        with tabs[4]:
+            st.markdown("### 📐 Formula Sheet Library")
         
-        # Load formulas from JSON
-        formulas_data = json_utils.load_json_data('formulas.json')
+            index = get_formula_index()
         
-        if not formulas_data:
-            st.error("Unable to load formulas. Please check formulas.json file.")
-            return
+            if not index.formulas:
+                st.error("Unable to load formulas. Please check formulas.json file.")
+                return
         
-        category = st.selectbox("Select Category", ["Mathematics", "Physics", "Chemistry"])
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                query = st.text_input("Search formulas", key="formula_query",
+                                      placeholder="e.g. quadratic, sine rule, \\sqrt, \\frac kinetic")
+            with col2:
+                category = st.selectbox("Category", ["All", "Mathematics", "Physics", "Chemistry"],
+                                        key="formula_category")
+            category_key = None if category == "All" else category.lower()
         
-        if category == "Mathematics":
-            st.markdown("### 🧮 Mathematics Formulas")
-            
-            math_data = formulas_data.get('mathematics', {})
-            
-            for section_name, formulas in math_data.items():
-                section_title = section_name.replace('_', ' & ').title()
-                with st.expander(section_title):
-                    for formula_item in formulas:
-                        st.latex(rf"{formula_item['formula']}")
-                        st.caption(formula_item['name'])
+            stamp = json_utils.data_stamp('formulas.json')
+            _, total = formula_page(stamp, query, category_key, 1, FORMULAS_PER_PAGE)
+            pages = formula_index.page_count(total, FORMULAS_PER_PAGE)
         
-        elif category == "Physics":
-            st.markdown("### ⚡ Physics Formulas")
-            
-            physics_data = formulas_data.get('physics', {})
-            
-            for section_name, formulas in physics_data.items():
-                section_title = section_name.replace('_', ' & ').title()
-                with st.expander(section_title):
-                    for formula_item in formulas:
-                        st.latex(rf"{formula_item['formula']}")
-                        st.caption(formula_item['name'])
+            if total == 0:
+                st.warning("No formulas match your search")
+            else:
+                if st.session_state.get("formula_page", 1) > pages:
+                    st.session_state["formula_page"] = 1  # a narrower search has fewer pages
+                page = st.number_input("Page", 1, pages, 1, key="formula_page") if pages > 1 else 1
+                body, _ = formula_page(stamp, query, category_key, page, FORMULAS_PER_PAGE)
+                st.caption(f"{total} formulas · page {page} of {pages}")
+                st.markdown(body)
         
-        else:  # Chemistry
-            st.markdown("### ⚗️ Chemistry Formulas")
-            
-            chem_data = formulas_data.get('chemistry', {})
-            
-            for section_name, formulas in chem_data.items():
-                section_title = section_name.replace('_', ' ').title()
-                with st.expander(section_title):
-                    if section_name == "basic":
-                        for formula_item in formulas:
-                            st.latex(rf"{formula_item['formula']}")
-                            st.caption(formula_item['name'])
-                    else:
-                        for formula_item in formulas:
-                            st.latex(rf"{formula_item['formula']}")
-                            st.caption(formula_item['name'])
+            with st.expander("LaTeX commands you can search"):
+                st.write(" ".join(f"`{c}`" for c in index.commands))
@@ -0,0 +1,268 @@
+"""Paginated, sorted and filtered rendering for the session lists.
+
+To-dos, assignments, notes and snippets are ItemLists kept in
+st.session_state. Alongside the items each one maintains secondary
+indexes, updated on every add/update/remove:
+
+    sorted  (key, id) pairs per sortable field, kept in order with bisect
+    exact   field value → ids, for filters (tag fields split on commas)
+    words   word → ids over the text fields, for prefix search
+
+so a rerun fetches just the visible page instead of sorting, filtering
+and rendering the whole list.
+
+    todos = list_view.item_list("todo_list", sort=["created", "priority"],
+                                index=["priority", "completed"], text=["task"])
+    list_view.render(todos, "todo", show_todo, sort_options={...})
+"""
+import bisect
+import re
+from itertools import islice
+
+import streamlit as st
+
+from search_index import normalize
+
+_WORD = re.compile(r"\w+")
+
+# Below this share of the list, matches are sorted directly rather than
+# found by walking the sort index
+SPARSE = 0.125
+
+
+def page_count(total, per_page):
+    return max(1, -(-total // per_page))
+
+
+def _sort_key(value):
+    if isinstance(value, str):
+        return (1, value.casefold())
+    if value is None:
+        return (2, "")
+    return (0, value)
+
+
+class ItemList:
+    """Items (dicts) with stable ids and incrementally maintained indexes.
+
+    Iterating yields the items in insertion order, so code that only
+    counts or sums over the old plain lists keeps working.
+    """
+
+    def __init__(self, sort=(), index=(), tags=(), text=()):
+        self.sort_fields = tuple(sort)
+        self.index_fields = tuple(index)
+        self.tag_fields = tuple(tags)
+        self.text_fields = tuple(text)
+        self._items = {}
+        self._next_id = 0
+        self._sorted = {field: [] for field in self.sort_fields}
+        self._exact = {field: {} for field in self.index_fields + self.tag_fields}
+        self._words = {}
+        self._vocab = []           # sorted keys of _words, for prefix ranges
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __getitem__(self, item_id):
+        return self._items[item_id]
+
+    def __contains__(self, item_id):
+        return item_id in self._items
+
+    def items(self):
+        return list(self._items.items())
+
+    # ---- index maintenance ----
+    def _keys(self, field, item):
+        value = item.get(field)
+        if field in self.tag_fields:
+            return {t.strip() for t in str(value or "").split(",") if t.strip()}
+        return {value}
+
+    def _text_words(self, item):
+        return {w for field in self.text_fields for w in _WORD.findall(normalize(item.get(field) or ""))}
+
+    def _index(self, item_id, item):
+        for field, entries in self._sorted.items():
+            bisect.insort(entries, (_sort_key(item.get(field)), item_id))
+        for field, buckets in self._exact.items():
+            for value in self._keys(field, item):
+                buckets.setdefault(value, set()).add(item_id)
+        for word in self._text_words(item):
+            ids = self._words.get(word)
+            if ids is None:
+                ids = self._words[word] = set()
+                bisect.insort(self._vocab, word)
+            ids.add(item_id)
+
+    def _unindex(self, item_id, item):
+        for field, entries in self._sorted.items():
+            entry = (_sort_key(item.get(field)), item_id)
+            i = bisect.bisect_left(entries, entry)
+            if i < len(entries) and entries[i] == entry:
+                del entries[i]
+        for field, buckets in self._exact.items():
+            for value in self._keys(field, item):
+                ids = buckets.get(value)
+                if ids is not None:
+                    ids.discard(item_id)
+                    if not ids:
+                        del buckets[value]
+        for word in self._text_words(item):
+            ids = self._words.get(word)
+            if ids is not None:
+                ids.discard(item_id)
+                if not ids:
+                    del self._words[word]
+                    del self._vocab[bisect.bisect_left(self._vocab, word)]
+
+    # ---- mutation ----
+    def add(self, item):
+        item_id = self._next_id
+        self._next_id += 1
+        self._items[item_id] = item
+        self._index(item_id, item)
+        return item_id
+
+    def update(self, item_id, **changes):
+        item = self._items[item_id]
+        if all(item.get(k) == v for k, v in changes.items()):
+            return
+        self._unindex(item_id, item)
+        item.update(changes)
+        self._index(item_id, item)
+
+    def remove(self, item_id):
+        item = self._items.pop(item_id, None)
+        if item is not None:
+            self._unindex(item_id, item)
+
+    def remove_where(self, **filters):
+        ids = self._match(filters)
+        for item_id in list(self._items if ids is None else ids):
+            self.remove(item_id)
+
+    # ---- queries ----
+    def values(self, field):
+        """Distinct values of an indexed field, for filter options."""
+        return sorted(self._exact[field], key=_sort_key)
+
+    def count(self, **filters):
+        ids = self._match(filters)
+        return len(self._items) if ids is None else len(ids)
+
+    def find(self, **filters):
+        ids = self._match(filters)
+        return sorted(self._items if ids is None else ids)
+
+    def _search(self, text):
+        result = None
+        for word in _WORD.findall(normalize(text)):
+            matched = set()
+            for i in range(bisect.bisect_left(self._vocab, word), len(self._vocab)):
+                if not self._vocab[i].startswith(word):
+                    break
+                matched |= self._words[self._vocab[i]]
+            result = matched if result is None else result & matched
+            if not result:
+                break
+        return result
+
+    def _match(self, filters, search=""):
+        """Ids matching every filter and search word; None means all items."""
+        sets = []
+        for field, value in filters.items():
+            sets.append(self._exact[field].get(value, set()))
+        if search and _WORD.search(search):
+            sets.append(self._search(search) or set())
+        if not sets:
+            return None
+        sets.sort(key=len)
+        return set(sets[0]).intersection(*sets[1:])
+
+    def query(self, sort=None, descending=False, filters=None, search="", offset=0, limit=20):
+        """(page of (id, item) pairs, number of matches)."""
+        ids = self._match(filters or {}, search)
+        total = len(self._items) if ids is None else len(ids)
+        if ids is not None and len(ids) < SPARSE * len(self._items):
+            if sort is None:
+                ordered = sorted(ids, reverse=descending)
+            else:
+                ordered = sorted(ids, key=lambda i: (_sort_key(self._items[i].get(sort)), i), reverse=descending)
+            page = ordered[offset:offset + limit]
+        else:
+            if sort is None:
+                order = reversed(self._items) if descending else iter(self._items)
+            else:
+                entries = self._sorted[sort]
+                order = (entry[1] for entry in (reversed(entries) if descending else entries))
+            if ids is not None:
+                order = (i for i in order if i in ids)
+            page = list(islice(order, offset, offset + limit))
+        return [(i, self._items[i]) for i in page], total
+
+
+def item_list(name, **spec):
+    """The ItemList at st.session_state[name], created on first use.
+
+    A plain list left there by an older session (or seeded by a
+    benchmark) is converted in place.
+    """
+    current = st.session_state.get(name)
+    if not isinstance(current, ItemList):
+        items = ItemList(**spec)
+        for item in current or []:
+            items.add(item)
+        st.session_state[name] = items
+    return st.session_state[name]
+
+
+def render(items, key, render_item, sort_options=None, filters=None, where=None, search=True, page_size=20):
+    """Search, filter, sort and page controls, then render_item(id, item) per visible item.
+
+    items:        an ItemList, or anything with the same len()/values()/query()
+                  (the expense ledger)
+    sort_options: {label: (field or None, descending)}; the first is the default
+    filters:      {label: indexed field} shown as selectboxes
+    where:        fixed {field: value} filters set by the caller
+    Returns the number of matching items.
+    """
+    sort_options = sort_options or {"Newest": (None, True)}
+    filters = filters or {}
+    columns = iter(st.columns([2] * bool(search) + [1] * (len(filters) + 1)))
+    query = ""
+    if search:
+        with next(columns):
+            query = st.text_input("🔍 Search", key=f"{key}_search")
+    chosen = dict(where or {})
+    for label, field in filters.items():
+        with next(columns):
+            value = st.selectbox(label, ["All"] + items.values(field), key=f"{key}_filter_{field}")
+        if value != "All":
+            chosen[field] = value
+    with next(columns):
+        sort_label = st.selectbox("Sort by", list(sort_options), key=f"{key}_sort")
+    field, descending = sort_options[sort_label]
+
+    page_key = f"{key}_page"
+    page = st.session_state.get(page_key, 1)
+    visible, total = items.query(field, descending, chosen, query, (page - 1) * page_size, page_size)
+    pages = page_count(total, page_size)
+    if page > pages:
+        page = st.session_state[page_key] = 1  # a narrower filter has fewer pages
+        visible, total = items.query(field, descending, chosen, query, 0, page_size)
+    if pages > 1:
+        st.number_input("Page", 1, pages, key=page_key)
+
+    for item_id, item in visible:
+        render_item(item_id, item)
+    if total > page_size:
+        start = (page - 1) * page_size
+        st.caption(f"Showing {start + 1}–{start + len(visible)} of {total}")
+    elif not total and len(items):
+        st.caption("No matches")
+    return total
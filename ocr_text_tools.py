@@ -5,6 +5,8 @@ import numpy as np
 import io
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
+import perf_monitor
+import lazy_tabs
 
 # ---- SAFE OCR IMPORTS ----
 OCR_AVAILABLE = True
@@ -52,6 +54,195 @@ def preprocess_image(image, preprocessing_type):
 
     return Image.fromarray(processed)
 
+# ---- LAYOUT ANALYSIS ----
+LAYOUT_MAX_SIDE = 1600
+
+
+def _to_gray(image):
+    img_array = np.array(image)
+    if len(img_array.shape) == 3:
+        if img_array.shape[2] == 4:
+            return cv2.cvtColor(img_array, cv2.COLOR_RGBA2GRAY)
+        return cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+    return img_array
+
+
+def _split_lines(binary, box, line_height):
+    """Split a merged block into text lines at empty rows."""
+    x0, y0, x1, y1 = box
+    if y1 - y0 < 2 * line_height:
+        return [box]
+
+    rows = binary[y0:y1, x0:x1].any(axis=1)
+    lines = []
+    start = None
+    for i, ink in enumerate(rows):
+        if ink and start is None:
+            start = i
+        elif not ink and start is not None:
+            lines.append((x0, y0 + start, x1, y0 + i))
+            start = None
+    if start is not None:
+        lines.append((x0, y0 + start, x1, y1))
+
+    return lines if len(lines) > 1 else [box]
+
+
+@perf_monitor.timed("ocr.detect_blocks")
+def detect_text_blocks(image, pad=4):
+    """Locate text lines with connected components instead of a full-page detector.
+
+    Returns (x0, y0, x1, y1) boxes in original image coordinates.
+    """
+    gray = _to_gray(image)
+    h, w = gray.shape[:2]
+
+    scale = min(1.0, LAYOUT_MAX_SIDE / max(h, w))
+    small = cv2.resize(gray, (int(w * scale), int(h * scale)),
+                       interpolation=cv2.INTER_AREA) if scale < 1.0 else gray
+    sh, sw = small.shape[:2]
+
+    binary = cv2.threshold(
+        cv2.GaussianBlur(small, (3, 3), 0), 0, 255,
+        cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU
+    )[1]
+
+    # Smear characters horizontally into words/lines, but not across lines
+    kx = max(9, sw // 80)
+    mask = cv2.dilate(binary, cv2.getStructuringElement(cv2.MORPH_RECT, (kx, 3)))
+
+    count, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+
+    boxes = []
+    for x, y, bw, bh, area in stats[1:count]:
+        # Specks, rules and page borders are not text
+        if bh < 6 or bw < 6 or bh > sh * 0.5:
+            continue
+        if bw > sw * 0.95 and bh > sh * 0.9:
+            continue
+        boxes.append((x, y, x + bw, y + bh))
+
+    if not boxes:
+        return []
+
+    line_height = int(np.median([b[3] - b[1] for b in boxes]))
+    split = []
+    for box in boxes:
+        split.extend(_split_lines(binary, box, max(line_height, 6)))
+
+    result = []
+    for x0, y0, x1, y1 in split:
+        result.append((
+            max(0, int(x0 / scale) - pad),
+            max(0, int(y0 / scale) - pad),
+            min(w, int(x1 / scale) + pad),
+            min(h, int(y1 / scale) + pad),
+        ))
+    return result
+
+
+def _find_column_edges(boxes, page_width, min_gutter):
+    # Coverage profile of normal-width boxes. Gutters are runs that only the
+    # occasional heading crosses, so tolerate a small fraction of the peak.
+    coverage = np.zeros(page_width + 1, dtype=np.int32)
+    for x0, _, x1, _ in boxes:
+        if x1 - x0 < page_width * 0.6:
+            coverage[x0:x1] += 1
+
+    covered = np.flatnonzero(coverage)
+    if len(covered) == 0:
+        return []
+    threshold = int(coverage.max() * 0.2)
+
+    edges = []
+    gap_start = None
+    for x in range(covered[0], covered[-1] + 1):
+        if coverage[x] <= threshold:
+            if gap_start is None:
+                gap_start = x
+        elif gap_start is not None:
+            if x - gap_start >= min_gutter:
+                edges.append((gap_start + x) // 2)
+            gap_start = None
+    return edges
+
+
+def order_blocks(boxes, page_width, min_gutter=None):
+    """Sort boxes into reading order: column by column, top to bottom.
+
+    Boxes that span a gutter (titles, full-width paragraphs) close the
+    current band, so two-column sections above and below a heading are
+    read independently.
+    """
+    if not boxes:
+        return []
+    if min_gutter is None:
+        min_gutter = max(12, page_width // 50)
+
+    edges = _find_column_edges(boxes, page_width, min_gutter)
+
+    def column_of(box):
+        center = (box[0] + box[2]) / 2
+        return sum(1 for e in edges if center > e)
+
+    def spans_gutter(box):
+        return any(box[0] < e < box[2] for e in edges)
+
+    spanning = sorted((b for b in boxes if spans_gutter(b)), key=lambda b: b[1])
+    columned = sorted((b for b in boxes if not spans_gutter(b)), key=lambda b: b[1])
+
+    ordered = []
+    for limit in spanning + [None]:
+        cutoff = limit[1] if limit else float("inf")
+        band = [b for b in columned if (b[1] + b[3]) / 2 < cutoff]
+        columned = [b for b in columned if (b[1] + b[3]) / 2 >= cutoff]
+        ordered.extend(sorted(band, key=lambda b: (column_of(b), b[1], b[0])))
+        if limit:
+            ordered.append(limit)
+    return ordered
+
+
+def recognize_blocks(reader, image, boxes, batch_size=16):
+    """Recognize only the given line boxes, in the order they are passed."""
+    if not boxes:
+        return []
+
+    gray = _to_gray(image)
+
+    if reader:
+        # EasyOCR format is [x_min, x_max, y_min, y_max]; skips its own detector
+        horizontal = [[x0, x1, y0, y1] for x0, y0, x1, y1 in boxes]
+        results = reader.recognize(
+            gray,
+            horizontal_list=horizontal,
+            free_list=[],
+            batch_size=batch_size
+        )
+        by_origin = {}
+        for coords, text, _ in results:
+            by_origin[(int(coords[0][0]), int(coords[0][1]))] = text
+        return [by_origin.get((x0, y0), "") for x0, y0, _, _ in boxes]
+
+    texts = []
+    for x0, y0, x1, y1 in boxes:
+        crop = Image.fromarray(gray[y0:y1, x0:x1])
+        texts.append(pytesseract.image_to_string(crop, config="--psm 7").strip())
+    return texts
+
+
+@perf_monitor.timed("ocr.extract_text")
+def extract_text(reader, image, layout="Full page", paragraph=False):
+    """Run OCR on a whole page or only on detected text regions."""
+    if layout == "Text regions":
+        boxes = order_blocks(detect_text_blocks(image), image.width)
+        lines = recognize_blocks(reader, image, boxes)
+        return "\n".join(line for line in lines if line)
+
+    if reader:
+        results = reader.readtext(np.array(image), paragraph=paragraph)
+        return "\n".join([r[1] for r in results])
+    return pytesseract.image_to_string(image)
+
 # ---- MAIN UI ----
 def show():
     st.markdown("## 🔍 OCR & Text Tools")
@@ -64,7 +255,7 @@ def show():
         )
         return
 
-    tabs = st.tabs([
+    tabs = lazy_tabs.tabs("ocr_text", [
         "Image OCR",
         "Batch OCR",
         "Handwriting OCR",
@@ -72,100 +263,114 @@ def show():
     ])
 
     # ---------- IMAGE OCR ----------
-    with tabs[0]:
-        uploaded = st.file_uploader(
-            "Upload Image",
-            type=['png', 'jpg', 'jpeg']
-        )
+    if tabs[0].open:
+        with tabs[0]:
+            uploaded = st.file_uploader(
+                "Upload Image",
+                type=['png', 'jpg', 'jpeg']
+            )
 
-        if uploaded:
-            image = Image.open(uploaded)
-            col1, col2 = st.columns(2)
+            if uploaded:
+                image = Image.open(uploaded)
+                col1, col2 = st.columns(2)
 
-            with col1:
-                st.image(image, use_container_width=True)
+                with col1:
+                    st.image(image, use_container_width=True)
 
-            with col2:
-                preprocess = st.selectbox(
-                    "Preprocessing",
-                    ["None", "Threshold", "Adaptive Threshold", "Noise Removal"]
-                )
+                with col2:
+                    preprocess = st.selectbox(
+                        "Preprocessing",
+                        ["None", "Threshold", "Adaptive Threshold", "Noise Removal"]
+                    )
 
-                processed = (
-                    preprocess_image(image, preprocess)
-                    if preprocess != "None"
-                    else image
-                )
+                    processed = (
+                        preprocess_image(image, preprocess)
+                        if preprocess != "None"
+                        else image
+                    )
 
-                st.image(processed, use_container_width=True)
+                    st.image(processed, use_container_width=True)
 
-            if st.button("Extract Text"):
-                reader = get_ocr_reader()
-                with st.spinner("Processing..."):
-                    if reader:
-                        results = reader.readtext(np.array(processed))
-                        text = "\n".join([r[1] for r in results])
-                    else:
-                        text = pytesseract.image_to_string(processed)
-
-                st.text_area("Extracted Text", text, height=300)
-                st.download_button(
-                    "Download Text",
-                    text,
-                    "ocr_output.txt",
-                    "text/plain"
+                layout = st.radio(
+                    "Layout",
+                    ["Full page", "Text regions"],
+                    horizontal=True,
+                    help="Text regions skips margins and blank areas and reads multi-column pages in order"
                 )
 
+                if st.button("Extract Text"):
+                    reader = get_ocr_reader()
+                    with st.spinner("Processing..."):
+                        text = extract_text(reader, processed, layout)
+
+                    st.text_area("Extracted Text", text, height=300)
+                    st.download_button(
+                        "Download Text",
+                        text,
+                        "ocr_output.txt",
+                        "text/plain"
+                    )
+
     # ---------- BATCH OCR ----------
-    with tabs[1]:
-        uploaded_files = st.file_uploader(
-            "Upload Images",
-            type=['png', 'jpg', 'jpeg'],
-            accept_multiple_files=True
-        )
+    if tabs[1].open:
+        with tabs[1]:
+            uploaded_files = st.file_uploader(
+                "Upload Images",
+                type=['png', 'jpg', 'jpeg'],
+                accept_multiple_files=True
+            )
 
-        if uploaded_files and st.button("Process All"):
-            reader = get_ocr_reader()
-            all_text = []
-
-            for file in uploaded_files:
-                image = Image.open(file)
-                results = reader.readtext(np.array(image))
-                text = "\n".join([r[1] for r in results])
-                all_text.append(f"=== {file.name} ===\n{text}\n\n")
-
-            combined = "".join(all_text)
-            st.download_button(
-                "Download All",
-                combined,
-                "batch_ocr.txt",
-                "text/plain"
+            batch_layout = st.radio(
+                "Layout",
+                ["Full page", "Text regions"],
+                index=1,
+                horizontal=True,
+                key="batch_layout"
             )
 
-    # ---------- HANDWRITING ----------
-    with tabs[2]:
-        uploaded = st.file_uploader(
-            "Upload Handwritten Image",
-            type=['png', 'jpg', 'jpeg']
-        )
+            if uploaded_files and st.button("Process All"):
+                reader = get_ocr_reader()
+                all_text = []
 
-        if uploaded:
-            image = Image.open(uploaded)
-            st.image(image, use_container_width=True)
+                for file in uploaded_files:
+                    image = Image.open(file)
+                    text = extract_text(reader, image, batch_layout)
+                    all_text.append(f"=== {file.name} ===\n{text}\n\n")
 
-            if st.button("Recognize"):
-                processed = preprocess_image(image, "Threshold")
-                reader = get_ocr_reader()
-                results = reader.readtext(
-                    np.array(processed),
-                    paragraph=True
+                combined = "".join(all_text)
+                st.download_button(
+                    "Download All",
+                    combined,
+                    "batch_ocr.txt",
+                    "text/plain"
                 )
-                text = "\n".join([r[1] for r in results])
-                st.text_area("Recognized Text", text, height=300)
+
+    # ---------- HANDWRITING ----------
+    if tabs[2].open:
+        with tabs[2]:
+            uploaded = st.file_uploader(
+                "Upload Handwritten Image",
+                type=['png', 'jpg', 'jpeg']
+            )
+
+            if uploaded:
+                image = Image.open(uploaded)
+                st.image(image, use_container_width=True)
+
+                if st.button("Recognize"):
+                    processed = preprocess_image(image, "Threshold")
+                    reader = get_ocr_reader()
+                    results = reader.readtext(
+                        np.array(processed),
+                        paragraph=True
+                    )
+                    text = "\n".join([r[1] for r in results])
+                    st.text_area("Recognized Text", text, height=300)
 
     # ---------- PDF OCR ----------
-    with tabs[3]:
-        st.info(
-            "PDF OCR is disabled on cloud.\n\n"
-            "Use local deployment or OCR API."
-        )
+    if tabs[3].open:
+        with tabs[3]:
+            st.info(
+                "PDF OCR is disabled on cloud.\n\n"
+                "Use local deployment or OCR API."
+            )
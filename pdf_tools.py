@@ -7,11 +7,142 @@ from reportlab.lib.utils import ImageReader
 from PIL import Image
 import io
 import os
+import perf_monitor
+import lazy_tabs
+
+# ---- PROCESSING (no Streamlit; shared with batch_cli) ----
+@perf_monitor.timed("pdf.parse")
+def parse_pdf(source):
+    return PdfReader(source)
+
+
+def _write_pdf(writer, output=None):
+    output = output or io.BytesIO()
+    writer.write(output)
+    if hasattr(output, "seek"):
+        output.seek(0)
+    return output
+
+
+@perf_monitor.timed("pdf.merge")
+def merge_pdfs(sources, output=None):
+    merger = PdfMerger()
+    for pdf in sources:
+        merger.append(pdf)
+    output = output or io.BytesIO()
+    merger.write(output)
+    merger.close()
+    if hasattr(output, "seek"):
+        output.seek(0)
+    return output
+
+
+def extract_pages(source, pages, output=None):
+    """Copy the given 0-based page indexes into a new PDF."""
+    reader = source if isinstance(source, PdfReader) else PdfReader(source)
+    writer = PdfWriter()
+    for i in pages:
+        writer.add_page(reader.pages[i])
+    return _write_pdf(writer, output)
+
+
+def split_every(source, n):
+    """Yield (part_number, BytesIO) chunks of n pages each."""
+    reader = source if isinstance(source, PdfReader) else PdfReader(source)
+    total = len(reader.pages)
+    for i in range(0, total, n):
+        yield i // n + 1, extract_pages(reader, range(i, min(i + n, total)))
+
+
+@perf_monitor.timed("pdf.compress")
+def compress_pdf(source, output=None):
+    reader = PdfReader(source)
+    writer = PdfWriter()
+    for page in reader.pages:
+        page.compress_content_streams()
+        writer.add_page(page)
+    return _write_pdf(writer, output)
+
+
+def rotate_pdf(source, rotation, pages=None, output=None):
+    """Rotate every page, or only the 0-based indexes in pages."""
+    reader = PdfReader(source)
+    writer = PdfWriter()
+    for i, page in enumerate(reader.pages):
+        if pages is None or i in pages:
+            page.rotate(rotation)
+        writer.add_page(page)
+    return _write_pdf(writer, output)
+
+
+def make_watermark(text):
+    packet = io.BytesIO()
+    can = canvas.Canvas(packet, pagesize=letter)
+    can.setFont("Helvetica", 40)
+    can.setFillColorRGB(0.5, 0.5, 0.5, alpha=0.3)
+    can.saveState()
+    can.translate(300, 400)
+    can.rotate(45)
+    can.drawCentredString(0, 0, text)
+    can.restoreState()
+    can.save()
+    packet.seek(0)
+    return PdfReader(packet).pages[0]
+
+
+@perf_monitor.timed("pdf.watermark")
+def watermark_pdf(source, text, output=None):
+    stamp = make_watermark(text)
+    reader = PdfReader(source)
+    writer = PdfWriter()
+    for page in reader.pages:
+        page.merge_page(stamp)
+        writer.add_page(page)
+    return _write_pdf(writer, output)
+
+
+def protect_pdf(source, password, output=None):
+    reader = PdfReader(source)
+    writer = PdfWriter()
+    for page in reader.pages:
+        writer.add_page(page)
+    writer.encrypt(password)
+    return _write_pdf(writer, output)
+
+
+@perf_monitor.timed("pdf.from_images")
+def images_to_pdf(sources, output=None):
+    images = []
+    for file in sources:
+        img = Image.open(file)
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        images.append(img)
+    output = output or io.BytesIO()
+    images[0].save(output, format='PDF', save_all=True, append_images=images[1:])
+    if hasattr(output, "seek"):
+        output.seek(0)
+    return output
+
+
+@perf_monitor.timed("pdf.extract_text")
+def extract_text(source):
+    reader = PdfReader(source)
+    return "".join((page.extract_text() or "") + "\n\n" for page in reader.pages)
+
+
+def render_pages(data, dpi=200):
+    """Yield (page_number, png_bytes); requires PyMuPDF."""
+    import fitz  # PyMuPDF
+    doc = fitz.open(stream=data, filetype="pdf")
+    for page_num in range(len(doc)):
+        yield page_num + 1, doc[page_num].get_pixmap(dpi=dpi).tobytes("png")
+
 
 def show():
     st.markdown("## 📄 PDF Tools")
     
-    tabs = st.tabs([
+    tabs = lazy_tabs.tabs("pdf_tools", [
         "Merge PDFs",
         "Split PDF",
         "Compress PDF",
@@ -25,311 +156,227 @@ def show():
     ])
     
     # Merge PDFs
-    with tabs[0]:
-        st.markdown("### 🔗 Merge PDFs")
-        uploaded_files = st.file_uploader("Upload PDFs", type=['pdf'], 
-                                         accept_multiple_files=True, key="merge")
+    if tabs[0].open:
+        with tabs[0]:
+            st.markdown("### 🔗 Merge PDFs")
+            uploaded_files = st.file_uploader("Upload PDFs", type=['pdf'], 
+                                             accept_multiple_files=True, key="merge")
         
-        if uploaded_files and len(uploaded_files) > 1:
-            st.success(f"📁 {len(uploaded_files)} PDFs uploaded")
+            if uploaded_files and len(uploaded_files) > 1:
+                st.success(f"📁 {len(uploaded_files)} PDFs uploaded")
             
-            for i, file in enumerate(uploaded_files):
-                st.text(f"{i+1}. {file.name}")
+                for i, file in enumerate(uploaded_files):
+                    st.text(f"{i+1}. {file.name}")
             
-            if st.button("Merge PDFs"):
-                merger = PdfMerger()
-                
-                for pdf in uploaded_files:
-                    merger.append(pdf)
+                if st.button("Merge PDFs"):
+                    output = merge_pdfs(uploaded_files)
                 
-                output = io.BytesIO()
-                merger.write(output)
-                merger.close()
-                output.seek(0)
-                
-                st.success("✅ PDFs merged successfully!")
-                st.download_button("Download Merged PDF", output, "merged.pdf", "application/pdf")
+                    st.success("✅ PDFs merged successfully!")
+                    st.download_button("Download Merged PDF", output, "merged.pdf", "application/pdf")
     
     # Split PDF
-    with tabs[1]:
-        st.markdown("### ✂️ Split PDF")
-        uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="split")
+    if tabs[1].open:
+        with tabs[1]:
+            st.markdown("### ✂️ Split PDF")
+            uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="split")
         
-        if uploaded:
-            reader = PdfReader(uploaded)
-            total_pages = len(reader.pages)
+            if uploaded:
+                reader = parse_pdf(uploaded)
+                total_pages = len(reader.pages)
             
-            st.info(f"📄 Total Pages: {total_pages}")
+                st.info(f"📄 Total Pages: {total_pages}")
             
-            split_mode = st.radio("Split Mode", ["Range", "Individual Pages", "Every N Pages"])
+                split_mode = st.radio("Split Mode", ["Range", "Individual Pages", "Every N Pages"])
             
-            if split_mode == "Range":
-                col1, col2 = st.columns(2)
-                with col1:
-                    start = st.number_input("Start Page", 1, total_pages, 1)
-                with col2:
-                    end = st.number_input("End Page", 1, total_pages, total_pages)
+                if split_mode == "Range":
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        start = st.number_input("Start Page", 1, total_pages, 1)
+                    with col2:
+                        end = st.number_input("End Page", 1, total_pages, total_pages)
                 
-                if st.button("Extract Range"):
-                    writer = PdfWriter()
-                    for i in range(start-1, end):
-                        writer.add_page(reader.pages[i])
+                    if st.button("Extract Range"):
+                        output = extract_pages(reader, range(start-1, end))
                     
-                    output = io.BytesIO()
-                    writer.write(output)
-                    output.seek(0)
-                    
-                    st.download_button("Download", output, f"pages_{start}-{end}.pdf", "application/pdf")
+                        st.download_button("Download", output, f"pages_{start}-{end}.pdf", "application/pdf")
             
-            elif split_mode == "Individual Pages":
-                page_num = st.number_input("Page Number", 1, total_pages, 1)
+                elif split_mode == "Individual Pages":
+                    page_num = st.number_input("Page Number", 1, total_pages, 1)
                 
-                if st.button("Extract Page"):
-                    writer = PdfWriter()
-                    writer.add_page(reader.pages[page_num-1])
-                    
-                    output = io.BytesIO()
-                    writer.write(output)
-                    output.seek(0)
+                    if st.button("Extract Page"):
+                        output = extract_pages(reader, [page_num-1])
                     
-                    st.download_button("Download", output, f"page_{page_num}.pdf", "application/pdf")
+                        st.download_button("Download", output, f"page_{page_num}.pdf", "application/pdf")
             
-            else:  # Every N Pages
-                n = st.number_input("Split Every N Pages", 1, total_pages, 5)
+                else:  # Every N Pages
+                    n = st.number_input("Split Every N Pages", 1, total_pages, 5)
                 
-                if st.button("Split PDF"):
-                    for i in range(0, total_pages, n):
-                        writer = PdfWriter()
-                        for j in range(i, min(i+n, total_pages)):
-                            writer.add_page(reader.pages[j])
-                        
-                        output = io.BytesIO()
-                        writer.write(output)
-                        output.seek(0)
-                        
-                        st.download_button(f"Download Part {i//n + 1}", output, 
-                                         f"split_part_{i//n + 1}.pdf", "application/pdf")
+                    if st.button("Split PDF"):
+                        for part, output in split_every(reader, n):
+                            st.download_button(f"Download Part {part}", output, 
+                                             f"split_part_{part}.pdf", "application/pdf")
     
     # Compress PDF
-    with tabs[2]:
-        st.markdown("### 📦 Compress PDF")
-        uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="compress")
+    if tabs[2].open:
+        with tabs[2]:
+            st.markdown("### 📦 Compress PDF")
+            uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="compress")
         
-        if uploaded:
-            original_size = len(uploaded.getvalue())
-            st.metric("Original Size", f"{original_size/1024:.2f} KB")
+            if uploaded:
+                original_size = len(uploaded.getvalue())
+                st.metric("Original Size", f"{original_size/1024:.2f} KB")
             
-            if st.button("Compress PDF"):
-                reader = PdfReader(uploaded)
-                writer = PdfWriter()
-                
-                for page in reader.pages:
-                    page.compress_content_streams()
-                    writer.add_page(page)
+                if st.button("Compress PDF"):
+                    output = compress_pdf(uploaded)
                 
-                output = io.BytesIO()
-                writer.write(output)
-                output.seek(0)
+                    compressed_size = len(output.getvalue())
+                    reduction = ((original_size - compressed_size) / original_size) * 100
                 
-                compressed_size = len(output.getvalue())
-                reduction = ((original_size - compressed_size) / original_size) * 100
+                    st.success(f"✅ Compressed by {reduction:.1f}%")
+                    st.metric("Compressed Size", f"{compressed_size/1024:.2f} KB")
                 
-                st.success(f"✅ Compressed by {reduction:.1f}%")
-                st.metric("Compressed Size", f"{compressed_size/1024:.2f} KB")
-                
-                st.download_button("Download Compressed", output, "compressed.pdf", "application/pdf")
+                    st.download_button("Download Compressed", output, "compressed.pdf", "application/pdf")
     
     # PDF to Images
-    with tabs[3]:
-        st.markdown("### 🖼️ PDF to Images")
-        uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="pdf2img")
+    if tabs[3].open:
+        with tabs[3]:
+            st.markdown("### 🖼️ PDF to Images")
+            uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="pdf2img")
         
-        if uploaded:
-            st.info("Note: This feature requires pdf2image library with poppler")
-            st.warning("Converting pages to images using PyMuPDF alternative...")
+            if uploaded:
+                st.info("Note: This feature requires pdf2image library with poppler")
+                st.warning("Converting pages to images using PyMuPDF alternative...")
             
-            if st.button("Convert to Images"):
-                try:
-                    import fitz  # PyMuPDF
-                    doc = fitz.open(stream=uploaded.read(), filetype="pdf")
-                    
-                    for page_num in range(len(doc)):
-                        page = doc[page_num]
-                        pix = page.get_pixmap(dpi=200)
-                        img_data = pix.tobytes("png")
-                        
-                        st.image(img_data, caption=f"Page {page_num + 1}")
-                        st.download_button(f"Download Page {page_num + 1}", 
-                                         img_data, f"page_{page_num + 1}.png", "image/png")
-                except:
-                    st.error("PyMuPDF not available. Please install: pip install PyMuPDF")
+                if st.button("Convert to Images"):
+                    try:
+                        for page_num, img_data in render_pages(uploaded.read()):
+                            st.image(img_data, caption=f"Page {page_num}")
+                            st.download_button(f"Download Page {page_num}", 
+                                             img_data, f"page_{page_num}.png", "image/png")
+                    except:
+                        st.error("PyMuPDF not available. Please install: pip install PyMuPDF")
     
     # Images to PDF
-    with tabs[4]:
-        st.markdown("### 📄 Images to PDF")
-        uploaded_files = st.file_uploader("Upload Images", type=['png', 'jpg', 'jpeg'], 
-                                         accept_multiple_files=True, key="img2pdf")
+    if tabs[4].open:
+        with tabs[4]:
+            st.markdown("### 📄 Images to PDF")
+            uploaded_files = st.file_uploader("Upload Images", type=['png', 'jpg', 'jpeg'], 
+                                             accept_multiple_files=True, key="img2pdf")
         
-        if uploaded_files:
-            st.success(f"📁 {len(uploaded_files)} images uploaded")
+            if uploaded_files:
+                st.success(f"📁 {len(uploaded_files)} images uploaded")
             
-            for img in uploaded_files:
-                st.image(img, width=150)
+                for img in uploaded_files:
+                    st.image(img, width=150)
             
-            if st.button("Create PDF"):
-                images = []
-                for file in uploaded_files:
-                    img = Image.open(file)
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    images.append(img)
+                if st.button("Create PDF"):
+                    output = images_to_pdf(uploaded_files)
                 
-                output = io.BytesIO()
-                images[0].save(output, format='PDF', save_all=True, append_images=images[1:])
-                output.seek(0)
-                
-                st.success("✅ PDF created successfully!")
-                st.download_button("Download PDF", output, "images.pdf", "application/pdf")
+                    st.success("✅ PDF created successfully!")
+                    st.download_button("Download PDF", output, "images.pdf", "application/pdf")
     
     # Extract Text
-    with tabs[5]:
-        st.markdown("### 📝 Extract Text from PDF")
-        uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="extract")
+    if tabs[5].open:
+        with tabs[5]:
+            st.markdown("### 📝 Extract Text from PDF")
+            uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="extract")
         
-        if uploaded:
-            reader = PdfReader(uploaded)
+            if uploaded:
+                reader = parse_pdf(uploaded)
             
-            st.info(f"📄 Total Pages: {len(reader.pages)}")
+                st.info(f"📄 Total Pages: {len(reader.pages)}")
             
-            extract_all = st.checkbox("Extract from all pages", True)
+                extract_all = st.checkbox("Extract from all pages", True)
             
-            if extract_all:
-                if st.button("Extract Text"):
-                    full_text = ""
-                    for page in reader.pages:
-                        full_text += page.extract_text() + "\n\n"
+                if extract_all:
+                    if st.button("Extract Text"):
+                        full_text = ""
+                        for page in reader.pages:
+                            full_text += page.extract_text() + "\n\n"
                     
-                    st.text_area("Extracted Text", full_text, height=300)
-                    st.download_button("Download Text", full_text, "extracted.txt", "text/plain")
-            else:
-                page_num = st.number_input("Page Number", 1, len(reader.pages), 1)
-                if st.button("Extract Text"):
-                    text = reader.pages[page_num-1].extract_text()
-                    st.text_area("Extracted Text", text, height=300)
+                        st.text_area("Extracted Text", full_text, height=300)
+                        st.download_button("Download Text", full_text, "extracted.txt", "text/plain")
+                else:
+                    page_num = st.number_input("Page Number", 1, len(reader.pages), 1)
+                    if st.button("Extract Text"):
+                        text = reader.pages[page_num-1].extract_text()
+                        st.text_area("Extracted Text", text, height=300)
     
     # Rotate Pages
-    with tabs[6]:
-        st.markdown("### 🔄 Rotate PDF Pages")
-        uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="rotate")
+    if tabs[6].open:
+        with tabs[6]:
+            st.markdown("### 🔄 Rotate PDF Pages")
+            uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="rotate")
         
-        if uploaded:
-            reader = PdfReader(uploaded)
-            st.info(f"📄 Total Pages: {len(reader.pages)}")
+            if uploaded:
+                reader = parse_pdf(uploaded)
+                st.info(f"📄 Total Pages: {len(reader.pages)}")
             
-            rotation = st.selectbox("Rotation", [90, 180, 270])
-            rotate_all = st.checkbox("Rotate all pages", True)
+                rotation = st.selectbox("Rotation", [90, 180, 270])
+                rotate_all = st.checkbox("Rotate all pages", True)
             
-            if not rotate_all:
-                page_num = st.number_input("Page Number", 1, len(reader.pages), 1)
+                if not rotate_all:
+                    page_num = st.number_input("Page Number", 1, len(reader.pages), 1)
             
-            if st.button("Rotate PDF"):
-                writer = PdfWriter()
-                
-                for i, page in enumerate(reader.pages):
-                    if rotate_all or (i == page_num - 1):
-                        page.rotate(rotation)
-                    writer.add_page(page)
+                if st.button("Rotate PDF"):
+                    output = rotate_pdf(uploaded, rotation, None if rotate_all else {page_num - 1})
                 
-                output = io.BytesIO()
-                writer.write(output)
-                output.seek(0)
-                
-                st.success("✅ PDF rotated successfully!")
-                st.download_button("Download Rotated PDF", output, "rotated.pdf", "application/pdf")
+                    st.success("✅ PDF rotated successfully!")
+                    st.download_button("Download Rotated PDF", output, "rotated.pdf", "application/pdf")
     
     # Watermark
-    with tabs[7]:
-        st.markdown("### 💧 Add Watermark to PDF")
+    if tabs[7].open:
+        with tabs[7]:
+            st.markdown("### 💧 Add Watermark to PDF")
         
-        col1, col2 = st.columns(2)
-        with col1:
-            pdf_file = st.file_uploader("Upload PDF", type=['pdf'], key="watermark_pdf")
-        with col2:
-            watermark_text = st.text_input("Watermark Text", "CONFIDENTIAL")
+            col1, col2 = st.columns(2)
+            with col1:
+                pdf_file = st.file_uploader("Upload PDF", type=['pdf'], key="watermark_pdf")
+            with col2:
+                watermark_text = st.text_input("Watermark Text", "CONFIDENTIAL")
         
-        if pdf_file:
-            if st.button("Add Watermark"):
-                # Create watermark
-                packet = io.BytesIO()
-                can = canvas.Canvas(packet, pagesize=letter)
-                can.setFont("Helvetica", 40)
-                can.setFillColorRGB(0.5, 0.5, 0.5, alpha=0.3)
-                can.saveState()
-                can.translate(300, 400)
-                can.rotate(45)
-                can.drawCentredString(0, 0, watermark_text)
-                can.restoreState()
-                can.save()
-                packet.seek(0)
-                
-                watermark_pdf = PdfReader(packet)
-                reader = PdfReader(pdf_file)
-                writer = PdfWriter()
-                
-                for page in reader.pages:
-                    page.merge_page(watermark_pdf.pages[0])
-                    writer.add_page(page)
-                
-                output = io.BytesIO()
-                writer.write(output)
-                output.seek(0)
+            if pdf_file:
+                if st.button("Add Watermark"):
+                    output = watermark_pdf(pdf_file, watermark_text)
                 
-                st.success("✅ Watermark added!")
-                st.download_button("Download", output, "watermarked.pdf", "application/pdf")
+                    st.success("✅ Watermark added!")
+                    st.download_button("Download", output, "watermarked.pdf", "application/pdf")
     
     # Password Protect
-    with tabs[8]:
-        st.markdown("### 🔐 Password Protect PDF")
-        uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="password")
+    if tabs[8].open:
+        with tabs[8]:
+            st.markdown("### 🔐 Password Protect PDF")
+            uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="password")
         
-        if uploaded:
-            password = st.text_input("Set Password", type="password")
+            if uploaded:
+                password = st.text_input("Set Password", type="password")
             
-            if password and st.button("Protect PDF"):
-                reader = PdfReader(uploaded)
-                writer = PdfWriter()
-                
-                for page in reader.pages:
-                    writer.add_page(page)
-                
-                writer.encrypt(password)
-                
-                output = io.BytesIO()
-                writer.write(output)
-                output.seek(0)
+                if password and st.button("Protect PDF"):
+                    output = protect_pdf(uploaded, password)
                 
-                st.success("✅ PDF protected!")
-                st.download_button("Download Protected PDF", output, "protected.pdf", "application/pdf")
+                    st.success("✅ PDF protected!")
+                    st.download_button("Download Protected PDF", output, "protected.pdf", "application/pdf")
     
     # Metadata Viewer
-    with tabs[9]:
-        st.markdown("### 📋 PDF Metadata Viewer")
-        uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="metadata")
+    if tabs[9].open:
+        with tabs[9]:
+            st.markdown("### 📋 PDF Metadata Viewer")
+            uploaded = st.file_uploader("Upload PDF", type=['pdf'], key="metadata")
         
-        if uploaded:
-            reader = PdfReader(uploaded)
+            if uploaded:
+                reader = parse_pdf(uploaded)
             
-            st.markdown("#### 📊 Document Info")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("Pages", len(reader.pages))
-            with col2:
-                st.metric("Size", f"{len(uploaded.getvalue())/1024:.2f} KB")
+                st.markdown("#### 📊 Document Info")
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Pages", len(reader.pages))
+                with col2:
+                    st.metric("Size", f"{len(uploaded.getvalue())/1024:.2f} KB")
             
-            st.markdown("#### 🏷️ Metadata")
-            metadata = reader.metadata
-            if metadata:
-                for key, value in metadata.items():
-                    st.text(f"{key}: {value}")
-            else:
-                st.warning("No metadata found")
+                st.markdown("#### 🏷️ Metadata")
+                metadata = reader.metadata
+                if metadata:
+                    for key, value in metadata.items():
+                        st.text(f"{key}: {value}")
+                else:
+                    st.warning("No metadata found")
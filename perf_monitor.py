@@ -0,0 +1,235 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+
+import streamlit as st
+
+# Off unless SUH_PROFILE is set, so normal sessions pay nothing
+ENABLED = os.environ.get("SUH_PROFILE", "").lower() not in ("", "0", "false", "no")
+LOG_PATH = os.environ.get("SUH_PROFILE_LOG")            # JSON line per rerun
+METRICS_PORT = os.environ.get("SUH_PROFILE_PORT")      # Prometheus /metrics
+
+WINDOW = 500                  # samples kept per metric for percentiles
+QUANTILES = (0.5, 0.9, 0.99)
+
+_NULL = nullcontext()
+_log_lock = threading.Lock()
+
+
+# ---- METRIC STORE (process-wide, shared by all sessions) ----
+class _Store:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {}
+        self.counts = {}
+        self.totals = {}
+
+    def add(self, name, seconds):
+        with self.lock:
+            window = self.samples.get(name)
+            if window is None:
+                window = self.samples[name] = deque(maxlen=WINDOW)
+            window.append(seconds)
+            self.counts[name] = self.counts.get(name, 0) + 1
+            self.totals[name] = self.totals.get(name, 0.0) + seconds
+
+    def reset(self):
+        with self.lock:
+            self.samples.clear()
+            self.counts.clear()
+            self.totals.clear()
+
+
+STORE = _Store()
+
+
+def record(name, seconds):
+    STORE.add(name, seconds)
+
+
+def _quantile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def snapshot():
+    """name → {count, total, mean, max, p50, p90, p99} over the rolling window."""
+    with STORE.lock:
+        items = [(name, sorted(window), STORE.counts[name], STORE.totals[name])
+                 for name, window in STORE.samples.items()]
+    stats = {}
+    for name, ordered, count, total in items:
+        row = {"count": count, "total": total,
+               "mean": sum(ordered) / len(ordered), "max": ordered[-1]}
+        for q in QUANTILES:
+            row[f"p{int(q * 100)}"] = _quantile(ordered, q)
+        stats[name] = row
+    return stats
+
+
+# ---- INSTRUMENTATION ----
+@contextmanager
+def _timer(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STORE.add(name, time.perf_counter() - start)
+
+
+def timer(name):
+    """Context manager timing a block under name; a shared no-op when disabled."""
+    return _timer(name) if ENABLED else _NULL
+
+
+def timed(name):
+    """Decorator form of timer() for heavy calls (PDF parse, OCR, figure builds)."""
+    def decorator(func):
+        if not ENABLED:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def log_rerun(page, seconds):
+    if not (ENABLED and LOG_PATH):
+        return
+    entry = {"ts": time.time(), "page": page, "seconds": round(seconds, 6)}
+    with _log_lock, open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+@contextmanager
+def _rerun():
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STORE.add("rerun", elapsed)
+        log_rerun(st.session_state.get("current_page"), elapsed)
+
+
+def rerun_timer():
+    """Times a whole script run, including ones cut short by st.rerun()."""
+    return _rerun() if ENABLED else _NULL
+
+
+# ---- EXPORT ----
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def to_prometheus():
+    """Prometheus text exposition: one summary family over every timed name."""
+    lines = [
+        "# HELP suh_duration_seconds Time spent in reruns, pages, tabs and heavy calls.",
+        "# TYPE suh_duration_seconds summary",
+    ]
+    for name, row in sorted(snapshot().items()):
+        label = _label(name)
+        for q in QUANTILES:
+            lines.append(f'suh_duration_seconds{{name="{label}",quantile="{q}"}} {row[f"p{int(q * 100)}"]:.6f}')
+        lines.append(f'suh_duration_seconds_sum{{name="{label}"}} {row["total"]:.6f}')
+        lines.append(f'suh_duration_seconds_count{{name="{label}"}} {row["count"]}')
+    return "\n".join(lines) + "\n"
+
+
+def to_json():
+    return json.dumps({"generated": time.time(), "metrics": snapshot()}, indent=2)
+
+
+_server_started = False
+
+
+def start_metrics_server(port=None):
+    """Serve /metrics (Prometheus) and /metrics.json on localhost, once per process."""
+    global _server_started
+    port = port or METRICS_PORT
+    if not (ENABLED and port) or _server_started:
+        return
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/metrics":
+                body, kind = to_prometheus(), "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body, kind = to_json(), "application/json"
+            else:
+                self.send_error(404)
+                return
+            data = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", kind)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    with _log_lock:
+        if _server_started:
+            return
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", int(port)), Handler)
+        except OSError:
+            # Another Streamlit process already owns the port
+            _server_started = True
+            return
+        threading.Thread(target=server.serve_forever, daemon=True, name="suh-metrics").start()
+        _server_started = True
+
+
+# ---- ADMIN PAGE ----
+def show_admin():
+    """Hidden page (?admin=perf) with the rolling timings of this server process."""
+    import pandas as pd
+
+    st.markdown("## ⏱️ Performance Monitor")
+
+    if not ENABLED:
+        st.info("Profiling is off. Start the app with SUH_PROFILE=1 to collect timings.")
+        return
+
+    stats = snapshot()
+    if not stats:
+        st.info("No samples yet. Use the app, then come back.")
+        return
+
+    df = pd.DataFrame.from_dict(stats, orient="index")
+    df.index.name = "name"
+    df = df.reset_index()
+    df.insert(0, "kind", df["name"].str.split(".").str[0])
+    for col in ["total", "mean", "max", "p50", "p90", "p99"]:
+        df[col] = (df[col] * 1000).round(2)
+    df = df.rename(columns={c: f"{c} (ms)" for c in ["total", "mean", "max", "p50", "p90", "p99"]})
+
+    kinds = sorted(df["kind"].unique())
+    selected = st.multiselect("Show", kinds, default=kinds, key="perf_kinds")
+    view = df[df["kind"].isin(selected)].sort_values("p90 (ms)", ascending=False)
+    st.dataframe(view, use_container_width=True, hide_index=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.download_button("Download JSON", to_json(), "perf.json", "application/json")
+    with col2:
+        st.download_button("Download Prometheus", to_prometheus(), "metrics.prom", "text/plain")
+    with col3:
+        if st.button("Reset", key="perf_reset"):
+            STORE.reset()
+            st.rerun()
+
+    if METRICS_PORT:
+        st.caption(f"Scrape http://127.0.0.1:{METRICS_PORT}/metrics")
+    if LOG_PATH:
+        st.caption(f"Rerun log: {LOG_PATH}")
@@ -1,289 +1,403 @@
 import streamlit as st
 import datetime
 import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 import io
 import random
 import json_utils
+import lazy_tabs
+import habit_log
+import expense_ledger
+import journal_store
+import list_view
+import timers
+import user_store
+from pathlib import Path
+
+@st.cache_resource
+def _journal_at(folder):
+    """A persistent journal and its search index, opened once per user folder."""
+    return journal_store.Journal(Path(folder) / "journal.db")
+
+def get_journal():
+    """This visitor's own journal (see user_store)."""
+    return user_store.get("journal", _journal_at, lambda: journal_store.Journal(None))
+
+@st.cache_resource
+def _ledger_at(folder):
+    """A persistent expense ledger, loaded once per user folder."""
+    return expense_ledger.Ledger(Path(folder) / "expenses.parquet")
+
+def get_ledger():
+    """This visitor's own expense ledger (see user_store)."""
+    return user_store.get("expenses", _ledger_at, lambda: expense_ledger.Ledger(None))
 
 def show():
     st.markdown("## 🎯 Productivity Boosters")
     
-    tabs = st.tabs(["Habit Tracker", "Goal Setter", "Focus Mode", "Daily Journal", "Expense Tracker"])
+    tabs = lazy_tabs.tabs("productivity_tools", ["Habit Tracker", "Goal Setter", "Focus Mode", "Daily Journal", "Expense Tracker"])
     
     # Habit Tracker
-    with tabs[0]:
-        st.markdown("### ✅ Habit Tracker")
-        
-        if 'habits' not in st.session_state:
-            st.session_state.habits = []
-        if 'habit_logs' not in st.session_state:
-            st.session_state.habit_logs = {}
-        
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            new_habit = st.text_input("New Habit", placeholder="e.g., Read for 30 minutes")
-        with col2:
-            if st.button("➕ Add Habit", use_container_width=True):
-                if new_habit and new_habit not in st.session_state.habits:
-                    st.session_state.habits.append(new_habit)
-                    st.session_state.habit_logs[new_habit] = []
-                    st.success("Habit added!")
-                    st.rerun()
+    if tabs[0].open:
+        with tabs[0]:
+            st.markdown("### ✅ Habit Tracker")
+        
+            if 'habits' not in st.session_state:
+                st.session_state.habits = []
+            if 'habit_logs' not in st.session_state:
+                st.session_state.habit_logs = {}
+            logs = st.session_state.habit_logs
+            for habit, log in logs.items():
+                if not isinstance(log, habit_log.HabitLog):  # older sessions: list of ISO dates
+                    logs[habit] = habit_log.HabitLog(log)
+        
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                new_habit = st.text_input("New Habit", placeholder="e.g., Read for 30 minutes")
+            with col2:
+                if st.button("➕ Add Habit", use_container_width=True):
+                    if new_habit and new_habit not in st.session_state.habits:
+                        st.session_state.habits.append(new_habit)
+                        logs[new_habit] = habit_log.HabitLog()
+                        st.success("Habit added!")
+                        st.rerun()
         
-        if st.session_state.habits:
-            st.markdown("### 📅 Today's Habits")
-            today = datetime.date.today().isoformat()
+            if st.session_state.habits:
+                st.markdown("### 📅 Today's Habits")
+                today = datetime.date.today()
             
-            for habit in st.session_state.habits:
-                col_a, col_b, col_c = st.columns([3, 1, 1])
+                for habit in st.session_state.habits:
+                    log = logs.setdefault(habit, habit_log.HabitLog())
+                    col_a, col_b, col_c = st.columns([3, 1, 1])
                 
-                with col_a:
-                    st.write(f"**{habit}**")
+                    with col_a:
+                        st.write(f"**{habit}**")
                 
-                with col_b:
-                    if today in st.session_state.habit_logs.get(habit, []):
-                        st.success("✅ Done")
-                    else:
-                        if st.button("✓ Mark Done", key=f"hab_{habit}"):
-                            if habit not in st.session_state.habit_logs:
-                                st.session_state.habit_logs[habit] = []
-                            st.session_state.habit_logs[habit].append(today)
-                            st.rerun()
+                    with col_b:
+                        if today in log:
+                            st.success("✅ Done")
+                            if st.button("↩️ Undo", key=f"hab_undo_{habit}"):
+                                log.unmark(today)
+                                st.rerun()
+                        else:
+                            if st.button("✓ Mark Done", key=f"hab_{habit}"):
+                                log.mark(today)
+                                st.rerun()
                 
-                with col_c:
-                    streak = 0
-                    if habit in st.session_state.habit_logs:
-                        logs = sorted(st.session_state.habit_logs[habit], reverse=True)
-                        for i, log_date in enumerate(logs):
-                            expected_date = (datetime.date.today() - datetime.timedelta(days=i)).isoformat()
-                            if log_date == expected_date:
-                                streak += 1
-                            else:
-                                break
-                    st.metric("🔥 Streak", f"{streak} days")
+                    with col_c:
+                        st.metric("🔥 Streak", f"{log.streak(today)} days")
             
-            st.markdown("---")
-            st.markdown("### 📊 Habit Statistics")
-            for habit in st.session_state.habits:
-                total_days = len(st.session_state.habit_logs.get(habit, []))
-                st.write(f"**{habit}**: {total_days} days completed")
+                st.markdown("---")
+                st.markdown("### 📊 Habit Statistics")
+                st.dataframe([{
+                    "Habit": habit,
+                    "Days completed": len(logs[habit]),
+                    "Current streak": logs[habit].streak(today),
+                    "Longest streak": logs[habit].longest,
+                    "Last 7 days": f"{logs[habit].rate(7, today):.0%}",
+                    "Last 30 days": f"{logs[habit].rate(30, today):.0%}",
+                } for habit in st.session_state.habits], hide_index=True, use_container_width=True)
+            
+                st.markdown("### 🗓️ Activity Heatmap")
+                shown = st.selectbox("Habit", ["All habits"] + st.session_state.habits, key="habit_heatmap")
+                selected = st.session_state.habits if shown == "All habits" else [shown]
+                counts, week_starts = habit_log.heatmap([logs[h] for h in selected], weeks=26, today=today)
+                fig = go.Figure(go.Heatmap(
+                    z=counts, x=week_starts, y=["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"],
+                    colorscale="Greens", zmin=0, zmax=max(len(selected), 1), xgap=3, ygap=3,
+                    hovertemplate="Week of %{x|%d %b}, %{y}: %{z} done<extra></extra>", showscale=False))
+                fig.update_layout(height=230, margin=dict(l=10, r=10, t=10, b=10),
+                                  yaxis=dict(autorange="reversed"), plot_bgcolor="rgba(0,0,0,0)")
+                st.plotly_chart(fig, use_container_width=True)
     
     # Goal Setter
-    with tabs[1]:
-        st.markdown("### 🎯 Goal Setter")
-        
-        if 'goals' not in st.session_state:
-            st.session_state.goals = []
-        
-        goal_type = st.radio("Goal Type", ["Short-term (1-3 months)", "Long-term (6+ months)"], horizontal=True)
-        
-        col1, col2 = st.columns([2, 1])
-        with col1:
-            goal_title = st.text_input("Goal Title")
-            goal_desc = st.text_area("Description", height=100)
-        with col2:
-            target_date = st.date_input("Target Date")
-            category = st.selectbox("Category", ["Academic", "Personal", "Career", "Health", "Other"])
-        
-        if st.button("➕ Add Goal"):
-            if goal_title:
-                st.session_state.goals.append({
-                    "title": goal_title,
-                    "description": goal_desc,
-                    "type": goal_type,
-                    "category": category,
-                    "target_date": str(target_date),
-                    "progress": 0,
-                    "created": datetime.date.today().isoformat()
-                })
-                st.success("Goal added!")
-                st.rerun()
-        
-        if st.session_state.goals:
-            st.markdown("---")
-            st.markdown("### 🎯 Your Goals")
+    if tabs[1].open:
+        with tabs[1]:
+            st.markdown("### 🎯 Goal Setter")
+        
+            if 'goals' not in st.session_state:
+                st.session_state.goals = []
+        
+            goal_type = st.radio("Goal Type", ["Short-term (1-3 months)", "Long-term (6+ months)"], horizontal=True)
+        
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                goal_title = st.text_input("Goal Title")
+                goal_desc = st.text_area("Description", height=100)
+            with col2:
+                target_date = st.date_input("Target Date")
+                category = st.selectbox("Category", ["Academic", "Personal", "Career", "Health", "Other"])
+        
+            if st.button("➕ Add Goal"):
+                if goal_title:
+                    st.session_state.goals.append({
+                        "title": goal_title,
+                        "description": goal_desc,
+                        "type": goal_type,
+                        "category": category,
+                        "target_date": str(target_date),
+                        "progress": 0,
+                        "created": datetime.date.today().isoformat()
+                    })
+                    st.success("Goal added!")
+                    st.rerun()
+        
+            if st.session_state.goals:
+                st.markdown("---")
+                st.markdown("### 🎯 Your Goals")
             
-            for idx, goal in enumerate(st.session_state.goals):
-                days_left = (datetime.datetime.strptime(goal['target_date'], "%Y-%m-%d").date() - datetime.date.today()).days
+                for idx, goal in enumerate(st.session_state.goals):
+                    days_left = (datetime.datetime.strptime(goal['target_date'], "%Y-%m-%d").date() - datetime.date.today()).days
                 
-                with st.expander(f"{goal['category']} - {goal['title']} ({days_left} days left)"):
-                    st.write(f"**Description:** {goal['description']}")
-                    st.write(f"**Type:** {goal['type']}")
-                    st.write(f"**Target:** {goal['target_date']}")
+                    with st.expander(f"{goal['category']} - {goal['title']} ({days_left} days left)"):
+                        st.write(f"**Description:** {goal['description']}")
+                        st.write(f"**Type:** {goal['type']}")
+                        st.write(f"**Target:** {goal['target_date']}")
                     
-                    progress = st.slider("Progress", 0, 100, goal['progress'], key=f"goal_{idx}")
-                    if progress != goal['progress']:
-                        st.session_state.goals[idx]['progress'] = progress
+                        progress = st.slider("Progress", 0, 100, goal['progress'], key=f"goal_{idx}")
+                        if progress != goal['progress']:
+                            st.session_state.goals[idx]['progress'] = progress
                     
-                    st.progress(progress / 100)
+                        st.progress(progress / 100)
                     
-                    if st.button("🗑️ Delete Goal", key=f"del_goal_{idx}"):
-                        st.session_state.goals.pop(idx)
-                        st.rerun()
+                        if st.button("🗑️ Delete Goal", key=f"del_goal_{idx}"):
+                            st.session_state.goals.pop(idx)
+                            st.rerun()
     
     # Focus Mode
-    with tabs[2]:
-        st.markdown("### 🎯 Focus Mode")
-        
-        st.info("Block distractions and stay focused with motivational quotes!")
-        
-        # Load quotes from JSON
-        quotes_data = json_utils.load_json_data('quotes.json')
-        quotes = quotes_data.get('quotes', [
-            "The secret of getting ahead is getting started. - Mark Twain",
-            "Success is not final, failure is not fatal. - Winston Churchill"
-        ])
-        
-        st.markdown(f"### 💡 *\"{random.choice(quotes)}\"*")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            focus_duration = st.number_input("Focus Duration (minutes)", 15, 180, 25)
-        with col2:
-            task_name = st.text_input("What are you working on?", "Study Session")
-        
-        if 'focus_active' not in st.session_state:
-            st.session_state.focus_active = False
-        if 'focus_remaining' not in st.session_state:
-            st.session_state.focus_remaining = 0
-        
-        col_a, col_b = st.columns(2)
-        with col_a:
-            if st.button("🎯 Start Focus", use_container_width=True, key="focus_start"):
-                st.session_state.focus_active = True
-                st.session_state.focus_remaining = focus_duration * 60
-                st.success(f"Focus mode started for {focus_duration} minutes!")
-        
-        with col_b:
-            if st.button("🛑 Stop Focus", use_container_width=True, key="focus_stop"):
-                st.session_state.focus_active = False
-                st.warning("Focus mode stopped")
-        
-        if st.session_state.focus_remaining > 0:
-            mins = st.session_state.focus_remaining // 60
-            secs = st.session_state.focus_remaining % 60
-            
-            st.markdown(f"### ⏱️ {mins:02d}:{secs:02d}")
-            st.progress(1 - (st.session_state.focus_remaining / (focus_duration * 60)))
-            
-            if st.session_state.focus_remaining == 0:
+    if tabs[2].open:
+        with tabs[2]:
+            st.markdown("### 🎯 Focus Mode")
+        
+            st.info("Block distractions and stay focused with motivational quotes!")
+        
+            # Load quotes from JSON
+            quotes_data = json_utils.load_reference_data('quotes.json')
+            quotes = quotes_data.get('quotes', [
+                "The secret of getting ahead is getting started. - Mark Twain",
+                "Success is not final, failure is not fatal. - Winston Churchill"
+            ])
+        
+            st.markdown(f"### 💡 *\"{random.choice(quotes)}\"*")
+        
+            col1, col2 = st.columns(2)
+            with col1:
+                focus_duration = st.number_input("Focus Duration (minutes)", 15, 180, 25)
+            with col2:
+                task_name = st.text_input("What are you working on?", "Study Session")
+        
+            # Completed focus sessions are logged to Study Analytics under the task name
+            timer = timers.get("focus", focus_duration * 60, task_name.strip() or "Focus Session")
+            if timers.check(timer):
                 st.success("🎉 Focus session complete! Great work!")
                 st.balloons()
+        
+            col_a, col_b = st.columns(2)
+            with col_a:
+                st.button("🎯 Start Focus", use_container_width=True, key="focus_start", on_click=timer.start)
+        
+            with col_b:
+                st.button("🛑 Stop Focus", use_container_width=True, key="focus_stop", on_click=timer.reset)
+        
+            if timer.running or timer.done:
+                timers.display(timer, "focus")
     
     # Daily Journal
-    with tabs[3]:
-        st.markdown("### 📔 Daily Journal")
+    if tabs[3].open:
+        with tabs[3]:
+            st.markdown("### 📔 Daily Journal")
         
-        if 'journal_entries' not in st.session_state:
-            st.session_state.journal_entries = {}
+            journal = get_journal()
+            if 'journal_entries' in st.session_state:  # older sessions kept entries in session state
+                for date, data in st.session_state.pop('journal_entries').items():
+                    if journal.get(date) is None:
+                        journal.save(date, data['entry'], data['mood'], data.get('tags', []))
         
-        today = datetime.date.today().isoformat()
+            col1, col2, col3 = st.columns([2, 1, 1])
+            with col1:
+                entry_date = st.date_input("Entry date", datetime.date.today(), max_value=datetime.date.today(),
+                                           key="journal_date")
+            with col2:
+                st.metric("📚 Entries", len(journal))
+            with col3:
+                st.metric("🔥 Writing streak", f"{journal.streak()} days")
+            existing = journal.get(entry_date) or {}
         
-        st.markdown(f"### 📅 {datetime.date.today().strftime('%A, %B %d, %Y')}")
+            st.markdown(f"### 📅 {entry_date.strftime('%A, %B %d, %Y')}")
         
-        mood = st.select_slider("How are you feeling?", 
-                               options=["😞 Terrible", "😕 Bad", "😐 Okay", "🙂 Good", "😄 Great"],
-                               value="😐 Okay")
+            mood = st.select_slider("How are you feeling?", 
+                                   options=journal_store.MOODS,
+                                   value=existing.get('mood', "😐 Okay"))
         
-        entry = st.text_area("Write your thoughts...", height=300, 
-                           value=st.session_state.journal_entries.get(today, {}).get('entry', ''),
-                           placeholder="What happened today? How do you feel? What are you grateful for?")
+            entry = st.text_area("Write your thoughts...", height=300, 
+                               value=existing.get('entry', ''),
+                               placeholder="What happened today? How do you feel? What are you grateful for?")
         
-        tags = st.multiselect("Tags", ["Personal", "Academic", "Goals", "Challenges", "Achievements", "Reflection"])
+            tags = st.multiselect("Tags", journal_store.TAGS, default=existing.get('tags', []))
         
-        if st.button("💾 Save Entry"):
-            st.session_state.journal_entries[today] = {
-                "entry": entry,
-                "mood": mood,
-                "tags": tags,
-                "date": today
-            }
-            st.success("Journal entry saved!")
+            col1, col2 = st.columns([1, 4])
+            with col1:
+                if st.button("💾 Save Entry"):
+                    journal.save(entry_date, entry, mood, tags)
+                    st.success("Journal entry saved!")
+            with col2:
+                if existing and st.button("🗑️ Delete Entry"):
+                    journal.delete(entry_date)
+                    st.rerun()
         
-        if st.session_state.journal_entries:
-            st.markdown("---")
-            st.markdown("### 📚 Past Entries")
+            if len(journal):
+                st.markdown("---")
+                st.markdown("### 📚 Past Entries")
+                st.caption('Search matches word beginnings; put "exact phrases" in quotes.')
             
-            for date, data in sorted(st.session_state.journal_entries.items(), reverse=True)[:5]:
-                with st.expander(f"{data['mood']} {date}"):
-                    st.write(data['entry'])
-                    if data.get('tags'):
-                        st.write(f"Tags: {', '.join(data['tags'])}")
+                col1, col2 = st.columns(2)
+                with col1:
+                    after = st.date_input("From", value=None, key="journal_after")
+                with col2:
+                    before = st.date_input("To", value=None, key="journal_before")
+                where = {k: v for k, v in (("after", after), ("before", before)) if v}
+            
+                def show_entry(date, data):
+                    with st.expander(f"{data['mood']} {date}"):
+                        query = st.session_state.get("journal_search", "")
+                        st.markdown(journal.snippet(date, query) if query else data['entry'])
+                        if data.get('tags'):
+                            st.write(f"Tags: {', '.join(data['tags'])}")
+            
+                list_view.render(journal, "journal", show_entry, page_size=10, where=where,
+                                 sort_options={"Newest": ("date", True), "Oldest": ("date", False)},
+                                 filters={"Mood": "mood", "Tag": "tags"})
+            
+                st.markdown("### 📈 Mood Trend")
+                period = st.radio("Group by", ["W", "M"], horizontal=True, key="journal_period",
+                                  format_func={"W": "Week", "M": "Month"}.get)
+                trend = journal.mood_trend(period, after, before)
+                if trend:
+                    keys, averages, counts = zip(*trend)
+                    fig = go.Figure(go.Scatter(x=list(keys), y=list(averages), mode="lines+markers",
+                                               customdata=list(counts),
+                                               hovertemplate="%{x}: %{y:.1f} (%{customdata} entries)<extra></extra>"))
+                    fig.update_layout(height=280, margin=dict(l=10, r=10, t=10, b=10), xaxis_type="category",
+                                      yaxis=dict(range=[0.5, 5.5], tickvals=list(range(1, 6)),
+                                                 ticktext=journal_store.MOODS))
+                    st.plotly_chart(fig, use_container_width=True)
     
     # Expense Tracker
-    with tabs[4]:
-        st.markdown("### 💰 Student Expense Tracker")
-        
-        if 'expenses' not in st.session_state:
-            st.session_state.expenses = []
-        if 'budget' not in st.session_state:
-            st.session_state.budget = 10000
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            monthly_budget = st.number_input("Monthly Budget (₹)", 0, 100000, st.session_state.budget)
-            if monthly_budget != st.session_state.budget:
-                st.session_state.budget = monthly_budget
-        
-        st.markdown("---")
-        st.markdown("### ➕ Add Expense")
-        
-        col_a, col_b, col_c = st.columns(3)
-        with col_a:
-            expense_name = st.text_input("Expense", key="exp_name")
-        with col_b:
-            amount = st.number_input("Amount (₹)", 0, 50000, 0, key="exp_amount")
-        with col_c:
-            category = st.selectbox("Category", 
-                                   ["Food", "Transport", "Books", "Entertainment", "Bills", "Other"],
-                                   key="exp_category")
-        
-        expense_date = st.date_input("Date", datetime.date.today(), key="exp_date")
-        
-        if st.button("➕ Add Expense"):
-            if expense_name and amount > 0:
-                st.session_state.expenses.append({
-                    "name": expense_name,
-                    "amount": amount,
-                    "category": category,
-                    "date": str(expense_date)
-                })
-                st.success("Expense added!")
-                st.rerun()
-        
-        if st.session_state.expenses:
+    if tabs[4].open:
+        with tabs[4]:
+            st.markdown("### 💰 Student Expense Tracker")
+        
+            ledger = get_ledger()
+            if 'expenses' in st.session_state:  # older sessions kept expenses in session state
+                ledger.add_records(st.session_state.pop('expenses'))
+            if 'budget' not in st.session_state:
+                st.session_state.budget = 10000
+        
+            col1, col2 = st.columns(2)
+            with col1:
+                monthly_budget = st.number_input("Monthly Budget (₹)", 0, 100000, st.session_state.budget)
+                if monthly_budget != st.session_state.budget:
+                    st.session_state.budget = monthly_budget
+        
             st.markdown("---")
-            st.markdown("### 📊 Expense Summary")
+            st.markdown("### ➕ Add Expense")
+        
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                expense_name = st.text_input("Expense", key="exp_name")
+            with col_b:
+                amount = st.number_input("Amount (₹)", 0, 50000, 0, key="exp_amount")
+            with col_c:
+                category = st.selectbox("Category", expense_ledger.CATEGORIES, key="exp_category")
+        
+            expense_date = st.date_input("Date", datetime.date.today(), key="exp_date")
+        
+            if st.button("➕ Add Expense"):
+                if expense_name and amount > 0:
+                    ledger.add(expense_name, amount, category, expense_date)
+                    st.success("Expense added!")
+        
+            with st.expander("🏦 Import bank statement (CSV)"):
+                st.caption("Needs a date column and a debit/withdrawal (or signed amount) column; "
+                           "only money going out is imported and categories are guessed from the narration.")
+                statement = st.file_uploader("Statement", type=["csv"], key="exp_statement")
+                dayfirst = st.checkbox("Dates are day first (31/01/2026)", value=True, key="exp_dayfirst")
+                if statement is not None and st.button("📥 Import"):
+                    try:
+                        added, duplicates = ledger.import_statement(statement, dayfirst)
+                    except (ValueError, UnicodeDecodeError, pd.errors.ParserError) as e:
+                        st.error(f"Could not read statement: {e}")
+                    else:
+                        st.success(f"Imported {added} expenses ({duplicates} already in the ledger)")
+        
+            if len(ledger):
+                st.markdown("---")
+                st.markdown("### 📊 Expense Summary")
             
-            total_spent = sum(exp['amount'] for exp in st.session_state.expenses)
-            remaining = st.session_state.budget - total_spent
+                today = datetime.date.today()
+                this_month = pd.Period(today, "M")
+                total_spent = ledger.month_total(this_month)
+                remaining = st.session_state.budget - total_spent
             
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Budget", f"₹{st.session_state.budget:,.0f}")
-            with col2:
-                st.metric("Spent", f"₹{total_spent:,.0f}")
-            with col3:
-                st.metric("Remaining", f"₹{remaining:,.0f}")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Budget", f"₹{st.session_state.budget:,.0f}")
+                with col2:
+                    st.metric(f"Spent in {today:%B}", f"₹{total_spent:,.0f}")
+                with col3:
+                    st.metric("Remaining", f"₹{remaining:,.0f}")
             
-            st.progress(min(total_spent / st.session_state.budget, 1.0))
+                st.progress(min(total_spent / st.session_state.budget, 1.0) if st.session_state.budget else 1.0)
+                for level, message in ledger.alerts(st.session_state.budget, today):
+                    getattr(st, level)(message)
             
-            # Category breakdown
-            st.markdown("### 📈 By Category")
-            category_totals = {}
-            for exp in st.session_state.expenses:
-                category_totals[exp['category']] = category_totals.get(exp['category'], 0) + exp['amount']
+                # Category breakdown
+                st.markdown("### 📈 By Category")
+                month_options = list(reversed(ledger.monthly(24).index))
+                if this_month not in month_options:
+                    month_options.insert(0, this_month)
+                shown = st.selectbox("Month", month_options, key="exp_month", format_func=lambda p: p.strftime("%B %Y"))
+                category_totals = ledger.by_category(shown)
+                col1, col2 = st.columns(2)
+                with col1:
+                    for cat, total in category_totals.items():
+                        st.write(f"**{cat}:** ₹{total:,.0f}")
+                with col2:
+                    if len(category_totals):
+                        fig = px.pie(values=category_totals.values, names=category_totals.index, hole=0.4)
+                        fig.update_layout(height=260, margin=dict(l=10, r=10, t=10, b=10), showlegend=False)
+                        st.plotly_chart(fig, use_container_width=True)
             
-            for cat, total in category_totals.items():
-                st.write(f"**{cat}:** ₹{total:,.0f}")
+                st.markdown("### 📆 Trends")
+                col1, col2 = st.columns(2)
+                with col1:
+                    monthly = ledger.monthly(12)
+                    fig = px.bar(x=monthly.index.strftime("%b %Y"), y=monthly.values,
+                                 labels={"x": "Month", "y": "Spent (₹)"}, title="Monthly spending")
+                    fig.add_hline(y=st.session_state.budget, line_dash="dot", annotation_text="Budget")
+                    st.plotly_chart(fig, use_container_width=True)
+                with col2:
+                    window = st.radio("Rolling window", [7, 30], horizontal=True, key="exp_window",
+                                      format_func=lambda d: f"{d} days")
+                    rolling = ledger.rolling(window).tail(180)
+                    fig = px.line(x=rolling.index, y=rolling.values, labels={"x": "Date", "y": "Spent (₹)"},
+                                  title=f"Trailing {window}-day spending")
+                    st.plotly_chart(fig, use_container_width=True)
             
-            # Recent expenses
-            st.markdown("### 📝 Recent Expenses")
-            for idx, exp in enumerate(sorted(st.session_state.expenses, key=lambda x: x['date'], reverse=True)[:10]):
-                with st.expander(f"₹{exp['amount']} - {exp['name']} ({exp['date']})"):
-                    st.write(f"**Category:** {exp['category']}")
-                    if st.button("🗑️ Delete", key=f"del_exp_{idx}"):
-                        st.session_state.expenses.remove(exp)
-                        st.rerun()
+                # Recent expenses
+                st.markdown("### 📝 Recent Expenses")
+            
+                def show_expense(exp_id, exp):
+                    with st.expander(f"₹{exp['amount']:,.2f} - {exp['name']} ({exp['date']})"):
+                        st.write(f"**Category:** {exp['category']}")
+                        if st.button("🗑️ Delete", key=f"del_exp_{exp_id}"):
+                            ledger.remove(exp_id)
+                            st.rerun()
+            
+                list_view.render(ledger, "exp", show_expense, page_size=10,
+                                 sort_options={"Newest": ("date", True), "Amount": ("amount", True),
+                                               "Name": ("name", False)},
+                                 filters={"Category": "category"})
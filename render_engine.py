@@ -0,0 +1,891 @@
+import codecs
+import functools
+import io
+import os
+import re
+from html import unescape
+from html.parser import HTMLParser
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import (
+    HRFlowable, Image as RLImage, PageBreak, Paragraph, Preformatted,
+    SimpleDocTemplate, Spacer, Table, TableStyle
+)
+
+PAGE_SIZE = letter
+MARGIN = 0.8 * inch
+FRAME_WIDTH = PAGE_SIZE[0] - 2 * MARGIN
+FRAME_HEIGHT = PAGE_SIZE[1] - 2 * MARGIN
+
+# Flowables held in memory ahead of the layout engine
+LOOKAHEAD = 64
+
+FONT_DIRS = [
+    "/usr/share/fonts/truetype/dejavu",
+    "/usr/share/fonts/dejavu",
+    "/Library/Fonts",
+    os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+]
+
+
+# ---- FONTS & STYLES ----
+@functools.lru_cache(maxsize=None)
+def base_fonts():
+    """Register a Unicode TTF family once per process, falling back to Helvetica."""
+    variants = {
+        "normal": "DejaVuSans.ttf",
+        "bold": "DejaVuSans-Bold.ttf",
+        "italic": "DejaVuSans-Oblique.ttf",
+        "boldItalic": "DejaVuSans-BoldOblique.ttf",
+    }
+    for folder in FONT_DIRS:
+        regular = os.path.join(folder, variants["normal"])
+        if not os.path.exists(regular):
+            continue
+        try:
+            names = {}
+            for key, filename in variants.items():
+                path = os.path.join(folder, filename)
+                name = "DejaVuSans" if key == "normal" else f"DejaVuSans-{key}"
+                pdfmetrics.registerFont(TTFont(name, path if os.path.exists(path) else regular))
+                names[key] = name
+            pdfmetrics.registerFontFamily("DejaVuSans", **names)
+            return names
+        except Exception:
+            break
+
+    return {
+        "normal": "Helvetica",
+        "bold": "Helvetica-Bold",
+        "italic": "Helvetica-Oblique",
+        "boldItalic": "Helvetica-BoldOblique",
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def get_styles():
+    """Paragraph styles shared by every renderer, built once."""
+    fonts = base_fonts()
+    sample = getSampleStyleSheet()
+
+    styles = {
+        "body": ParagraphStyle("body", parent=sample["BodyText"], fontName=fonts["normal"],
+                               fontSize=10.5, leading=14, spaceAfter=6),
+        "title": ParagraphStyle("title", parent=sample["Title"], fontName=fonts["bold"]),
+        "quote": ParagraphStyle("quote", parent=sample["BodyText"], fontName=fonts["italic"],
+                                leftIndent=18, textColor=colors.HexColor("#555555")),
+        "code": ParagraphStyle("code", parent=sample["Code"], fontSize=8.5, leading=10.5,
+                               backColor=colors.HexColor("#f4f4f4"), borderPadding=4),
+        "cell": ParagraphStyle("cell", parent=sample["BodyText"], fontName=fonts["normal"],
+                               fontSize=9, leading=11),
+        "cell_head": ParagraphStyle("cell_head", parent=sample["BodyText"], fontName=fonts["bold"],
+                                    fontSize=9, leading=11),
+    }
+    for level in range(1, 7):
+        parent = sample[f"Heading{min(level, 6)}"]
+        styles[f"h{level}"] = ParagraphStyle(f"h{level}", parent=parent, fontName=fonts["bold"],
+                                             keepWithNext=1)
+    for depth in range(1, 5):
+        styles[f"list{depth}"] = ParagraphStyle(f"list{depth}", parent=styles["body"],
+                                                leftIndent=18 * depth, bulletIndent=18 * depth - 12,
+                                                spaceAfter=2)
+    return styles
+
+
+_ALIGNED = {}
+
+
+def aligned(style, alignment):
+    """Variant of a cached style with a different alignment."""
+    if alignment in (None, style.alignment):
+        return style
+    key = (style.name, alignment)
+    if key not in _ALIGNED:
+        _ALIGNED[key] = ParagraphStyle(f"{style.name}_{alignment}", parent=style, alignment=alignment)
+    return _ALIGNED[key]
+
+
+TABLE_STYLE = TableStyle([
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#999999")),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e8e8f4")),
+    ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ("LEFTPADDING", (0, 0), (-1, -1), 4),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+])
+
+
+def make_table(rows, header=True):
+    """Table flowable from rows of markup strings, header repeated on every page."""
+    styles = get_styles()
+    width = max(len(r) for r in rows)
+    data = []
+    for i, row in enumerate(rows):
+        style = styles["cell_head"] if header and i == 0 else styles["cell"]
+        cells = [_safe_paragraph(cell, style) for cell in row]
+        cells.extend([""] * (width - len(cells)))
+        data.append(cells)
+    table = Table(data, colWidths=[FRAME_WIDTH / width] * width,
+                  repeatRows=1 if header else 0, hAlign="LEFT")
+    table.setStyle(TABLE_STYLE)
+    return table
+
+
+def fit_image(data, width=None, height=None):
+    """Image flowable scaled to fit the frame; None if the format is unsupported."""
+    try:
+        reader = ImageReader(io.BytesIO(data))
+        px_w, px_h = reader.getSize()
+    except Exception:
+        return None
+    if not width or not height:
+        width, height = px_w * 0.75, px_h * 0.75
+    scale = min(1.0, FRAME_WIDTH / width, (FRAME_HEIGHT - 24) / height)
+    return RLImage(io.BytesIO(data), width=width * scale, height=height * scale)
+
+
+# ---- STREAMING BUILD ----
+class FlowableStream(list):
+    """List that refills itself from a generator while the doc template consumes it.
+
+    SimpleDocTemplate.build checks len() before every flowable, so only a
+    small window of the document is ever materialized.
+    """
+
+    def __init__(self, source, lookahead=LOOKAHEAD):
+        super().__init__()
+        self._source = iter(source)
+        self._lookahead = lookahead
+
+    def __len__(self):
+        while self._source is not None and list.__len__(self) < self._lookahead:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+        return list.__len__(self)
+
+
+def _draw_page_number(canvas, doc):
+    canvas.saveState()
+    canvas.setFont(base_fonts()["normal"], 8)
+    canvas.setFillColor(colors.grey)
+    canvas.drawRightString(PAGE_SIZE[0] - MARGIN, MARGIN / 2, str(doc.page))
+    canvas.restoreState()
+
+
+def build_pdf(flowables, output, title=""):
+    """Lay out a flowable iterator into output (path or binary file). Returns page count."""
+    doc = SimpleDocTemplate(output, pagesize=PAGE_SIZE, title=title,
+                            leftMargin=MARGIN, rightMargin=MARGIN,
+                            topMargin=MARGIN, bottomMargin=MARGIN)
+    stream = FlowableStream(flowables)
+    doc.build(stream, onFirstPage=_draw_page_number, onLaterPages=_draw_page_number)
+    return doc.page
+
+
+# ---- DOCX ----
+HEADING_STYLES = {"Title": "title", **{f"Heading {n}": f"h{n}" for n in range(1, 7)}}
+
+DOCX_ALIGNMENT = {0: TA_LEFT, 1: TA_CENTER, 2: TA_RIGHT, 3: TA_JUSTIFY}
+
+
+def _run_markup(run):
+    text = escape(run.text).replace("\t", "&nbsp;" * 4).replace("\n", "<br/>")
+    if not text:
+        return ""
+    if run.bold:
+        text = f"<b>{text}</b>"
+    if run.italic:
+        text = f"<i>{text}</i>"
+    if run.underline:
+        text = f"<u>{text}</u>"
+    if run.font.strike:
+        text = f"<strike>{text}</strike>"
+    if run.font.superscript:
+        text = f"<super>{text}</super>"
+    elif run.font.subscript:
+        text = f"<sub>{text}</sub>"
+    return text
+
+
+def _run_images(run, part):
+    for extent, rid in zip(run.element.xpath(".//wp:extent"), run.element.xpath(".//a:blip/@r:embed")):
+        try:
+            blob = part.related_parts[rid].blob
+        except KeyError:
+            continue
+        # Extents are in EMU; 12700 EMU per point
+        image = fit_image(blob, int(extent.get("cx")) / 12700, int(extent.get("cy")) / 12700)
+        if image is not None:
+            yield image
+
+
+def _style_names(doc):
+    # paragraph.style searches the styles part on every access; resolve ids once
+    from docx.enum.style import WD_STYLE_TYPE
+
+    names = {style.style_id: style.name for style in doc.styles}
+    default = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+    names[None] = default.name if default is not None else ""
+    return names
+
+
+def _docx_paragraph(paragraph, part, style_names, list_state):
+    from docx.text.hyperlink import Hyperlink
+
+    styles = get_styles()
+    style_name = style_names.get(paragraph._p.style, style_names[None]) or ""
+
+    markup = []
+    images = []
+    page_break = False
+    for item in paragraph.iter_inner_content():
+        if isinstance(item, Hyperlink):
+            inner = "".join(_run_markup(r) for r in item.runs)
+            if item.url:
+                url = escape(item.url, {'"': "&quot;"})
+                inner = f'<a href="{url}" color="blue">{inner}</a>'
+            markup.append(inner)
+            continue
+        markup.append(_run_markup(item))
+        images.extend(_run_images(item, part))
+        if item.element.xpath('.//w:br[@w:type="page"]'):
+            page_break = True
+
+    text = "".join(markup).strip()
+    p_pr = paragraph._p.pPr
+    is_list = style_name.startswith("List") or (p_pr is not None and p_pr.numPr is not None)
+
+    if text:
+        if style_name in HEADING_STYLES:
+            list_state.clear()
+            yield _safe_paragraph(text, styles[HEADING_STYLES[style_name]])
+        elif is_list:
+            depth = 1
+            match = re.search(r"(\d)$", style_name)
+            if match:
+                depth = min(int(match.group(1)), 4)
+            if "Number" in style_name:
+                list_state[depth] = list_state.get(depth, 0) + 1
+                bullet = f"{list_state[depth]}."
+            else:
+                bullet = "•"
+            yield _safe_paragraph(text, styles[f"list{depth}"], bulletText=bullet)
+        else:
+            list_state.clear()
+            alignment = DOCX_ALIGNMENT.get(paragraph.alignment)
+            yield _safe_paragraph(text, aligned(styles["body"], alignment))
+
+    yield from images
+    if page_break:
+        yield PageBreak()
+
+
+def _docx_table(table):
+    rows = []
+    for row in table.rows:
+        rows.append([escape(cell.text).replace("\n", "<br/>") for cell in row.cells])
+    if rows:
+        yield make_table(rows)
+        yield Spacer(1, 6)
+
+
+def iter_docx_flowables(source):
+    """Yield flowables for a DOCX file in body order: paragraphs, tables and images."""
+    from docx import Document
+    from docx.table import Table as DocxTable
+
+    doc = Document(source)
+    part = doc.part
+    style_names = _style_names(doc)
+    list_state = {}
+    for block in doc.iter_inner_content():
+        if isinstance(block, DocxTable):
+            list_state.clear()
+            yield from _docx_table(block)
+        else:
+            yield from _docx_paragraph(block, part, style_names, list_state)
+
+
+def docx_to_pdf(source, output):
+    """Convert a DOCX (path or file) to PDF. Returns the number of pages written."""
+    return build_pdf(iter_docx_flowables(source), output, title="Converted document")
+
+
+# ---- PLAIN TEXT ----
+def iter_text_flowables(lines, max_lines=200):
+    """Blank-line separated paragraphs, keeping line breaks inside each one."""
+    style = get_styles()["body"]
+    paragraph = []
+    for raw in lines:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8", errors="replace")
+        line = raw.rstrip("\r\n")
+        if line.strip():
+            paragraph.append(escape(line.expandtabs(4)))
+        if paragraph and (not line.strip() or len(paragraph) >= max_lines):
+            yield Paragraph("<br/>".join(paragraph), style)
+            paragraph = []
+    if paragraph:
+        yield Paragraph("<br/>".join(paragraph), style)
+
+
+def text_to_pdf(lines, output):
+    """Convert plain text (a str, file or any line iterable) to PDF. Returns page count."""
+    if isinstance(lines, str):
+        lines = io.StringIO(lines)
+    return build_pdf(iter_text_flowables(lines), output, title="Text document")
+
+
+# ---- MARKDOWN ----
+MD_INLINE = [
+    (re.compile(r"`([^`]+)`"), r'<font face="Courier">\1</font>'),
+    (re.compile(r"\*\*(.+?)\*\*|__(.+?)__"), lambda m: f"<b>{m.group(1) or m.group(2)}</b>"),
+    (re.compile(r"(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?!\w)|(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)"),
+     lambda m: f"<i>{m.group(1) or m.group(2)}</i>"),
+    (re.compile(r"~~(.+?)~~"), r"<strike>\1</strike>"),
+    (re.compile(r"!\[([^\]]*)\]\(([^)]+)\)"), r"<i>[\1]</i>"),
+    (re.compile(r"\[([^\]]+)\]\(([^)\s]+)[^)]*\)"), r'<a href="\2" color="blue">\1</a>'),
+]
+
+MD_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+MD_BULLET = re.compile(r"^(\s*)[-*+]\s+(.*)$")
+MD_ORDERED = re.compile(r"^(\s*)(\d+)[.)]\s+(.*)$")
+MD_RULE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+MD_TABLE_SEP = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+MD_IMAGE_LINE = re.compile(r"^\s*!\[([^\]]*)\]\(([^)\s]+)[^)]*\)\s*$")
+
+
+def md_inline(text):
+    """Markdown inline syntax to reportlab paragraph markup."""
+    text = escape(text)
+    for pattern, repl in MD_INLINE:
+        text = pattern.sub(repl, text)
+    return text
+
+
+def _split_row(line):
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|"):
+        line = line[:-1]
+    return [md_inline(cell.strip()) for cell in line.split("|")]
+
+
+def iter_markdown_flowables(lines, base_dir=None):
+    """Yield flowables from an iterable of Markdown lines without reading it all first."""
+    styles = get_styles()
+    paragraph = []
+    table = []
+    code = None
+    fence = ""
+
+    def flush_paragraph():
+        if paragraph:
+            text = md_inline(" ".join(paragraph))
+            paragraph.clear()
+            return [_safe_paragraph(text, styles["body"])]
+        return []
+
+    def flush_table():
+        if table:
+            rows = [r for r in table if not MD_TABLE_SEP.match(r)]
+            header = len(table) > 1 and bool(MD_TABLE_SEP.match(table[1]))
+            table.clear()
+            return [make_table([_split_row(r) for r in rows], header=header), Spacer(1, 6)]
+        return []
+
+    for raw in lines:
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8", errors="replace")
+        line = raw.rstrip("\r\n")
+
+        if code is not None:
+            if line.strip().startswith(fence):
+                yield Preformatted("\n".join(code), styles["code"], maxLineLength=95)
+                yield Spacer(1, 6)
+                code = None
+            else:
+                code.append(line.expandtabs(4))
+            continue
+
+        stripped = line.strip()
+
+        if stripped.startswith("|") or (table and "|" in stripped):
+            yield from flush_paragraph()
+            table.append(stripped)
+            continue
+        yield from flush_table()
+
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            yield from flush_paragraph()
+            fence = stripped[:3]
+            code = []
+            continue
+
+        if not stripped:
+            yield from flush_paragraph()
+            continue
+
+        # Setext headings underline the paragraph collected so far
+        if paragraph and re.match(r"^=+\s*$", stripped):
+            text = md_inline(" ".join(paragraph))
+            paragraph.clear()
+            yield _safe_paragraph(text, styles["h1"])
+            continue
+        if paragraph and re.match(r"^-+\s*$", stripped):
+            text = md_inline(" ".join(paragraph))
+            paragraph.clear()
+            yield _safe_paragraph(text, styles["h2"])
+            continue
+
+        heading = MD_HEADING.match(stripped)
+        if heading:
+            yield from flush_paragraph()
+            yield _safe_paragraph(md_inline(heading.group(2)), styles[f"h{len(heading.group(1))}"])
+            continue
+
+        if MD_RULE.match(stripped):
+            yield from flush_paragraph()
+            yield HRFlowable(width="100%", color=colors.grey, spaceBefore=4, spaceAfter=8)
+            continue
+
+        image = MD_IMAGE_LINE.match(stripped)
+        if image and base_dir:
+            path = os.path.join(base_dir, image.group(2))
+            if os.path.isfile(path):
+                yield from flush_paragraph()
+                with open(path, "rb") as f:
+                    flowable = fit_image(f.read())
+                if flowable is not None:
+                    yield flowable
+                    continue
+
+        bullet = MD_BULLET.match(line)
+        ordered = MD_ORDERED.match(line)
+        if bullet or ordered:
+            yield from flush_paragraph()
+            indent = (bullet or ordered).group(1)
+            depth = min(len(indent.expandtabs(4)) // 2 + 1, 4)
+            if bullet:
+                yield _safe_paragraph(md_inline(bullet.group(2)), styles[f"list{depth}"], bulletText="•")
+            else:
+                yield _safe_paragraph(md_inline(ordered.group(3)), styles[f"list{depth}"],
+                                      bulletText=f"{ordered.group(2)}.")
+            continue
+
+        if stripped.startswith(">"):
+            yield from flush_paragraph()
+            yield _safe_paragraph(md_inline(stripped.lstrip("> ")), styles["quote"])
+            continue
+
+        paragraph.append(stripped)
+
+    if code is not None:
+        yield Preformatted("\n".join(code), styles["code"], maxLineLength=95)
+    yield from flush_table()
+    yield from flush_paragraph()
+
+
+def markdown_to_pdf(lines, output, base_dir=None):
+    """Convert Markdown lines (a str, file or any line iterable) to PDF. Returns page count."""
+    if isinstance(lines, str):
+        lines = io.StringIO(lines)
+    return build_pdf(iter_markdown_flowables(lines, base_dir), output, title="Markdown document")
+
+
+# ---- HTML ----
+HTML_SKIP = {"script", "style", "head", "noscript", "template", "svg", "iframe", "object", "canvas"}
+HTML_HEADINGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+HTML_BLOCKS = HTML_HEADINGS | {
+    "p", "div", "section", "article", "header", "footer", "main", "nav", "aside",
+    "blockquote", "pre", "li", "dt", "dd", "figure", "figcaption", "form", "address",
+    "ul", "ol", "dl", "table", "body", "html",
+}
+HTML_INLINE = {
+    "b": "b", "strong": "b", "i": "i", "em": "i", "cite": "i", "u": "u", "ins": "u",
+    "s": "strike", "strike": "strike", "del": "strike", "sub": "sub", "sup": "super",
+}
+HTML_VOID = {"br", "hr", "img", "input", "meta", "link", "area", "base", "col", "embed",
+             "source", "track", "wbr", "param"}
+
+# Rows per emitted table so huge tables do not sit in memory as one flowable
+HTML_TABLE_CHUNK = 200
+HTML_READ_SIZE = 64 * 1024
+
+
+def _close_tag(markup_tag):
+    return "</font>" if markup_tag.startswith("font") else f"</{markup_tag.split()[0]}>"
+
+
+class HTMLBlockParser(HTMLParser):
+    """Incremental HTML parser that turns tags into layout blocks as they complete.
+
+    Blocks are tuples: ("h1".."h6" | "p" | "quote", markup), ("li", markup, depth, bullet),
+    ("pre", text), ("table", rows, has_header) and ("hr",). Nothing but the
+    current block and the open-tag stack is kept between feed() calls.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self._skip = 0
+        self._buffer = []
+        self._inline = []
+        self._kind = "p"
+        self._lists = []
+        self._li = None
+        self._quote = 0
+        self._pre = 0
+        self._table = 0
+        self._rows = []
+        self._row = None
+        self._cell = None
+        self._header_row = False
+
+    # -- block management --
+    def _flush(self):
+        text = "".join(self._buffer)
+        self._buffer = [f"<{t}>" for t in self._inline]
+        if self._pre:
+            return
+        text = re.sub(r"\s+", " ", text).strip()
+        closing = "".join(_close_tag(t) for t in reversed(self._inline))
+        if not re.sub(r"<[^>]+>", "", text).strip():
+            return
+        text += closing
+        if self._li is not None:
+            depth, bullet = self._li
+            self.blocks.append(("li", text, depth, bullet))
+            self._li = (depth, "")
+        elif self._kind in HTML_HEADINGS:
+            self.blocks.append((self._kind, text))
+        elif self._quote:
+            self.blocks.append(("quote", text))
+        else:
+            self.blocks.append(("p", text))
+
+    def _emit_rows(self, final):
+        if self._rows:
+            self.blocks.append(("table", self._rows, self._header_row))
+            if not final and self._header_row:
+                self._rows = [self._rows[0]]
+            else:
+                self._rows = []
+                self._header_row = False
+
+    def pop_blocks(self):
+        blocks, self.blocks = self.blocks, []
+        return blocks
+
+    # -- parser callbacks --
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            # An unclosed <head> must not swallow the page
+            self._skip = 0
+        if tag in HTML_SKIP:
+            if tag not in HTML_VOID:
+                self._skip += 1
+            return
+        if self._skip:
+            return
+
+        if self._table:
+            self._table_start(tag)
+            return
+        if self._pre:
+            if tag == "pre":
+                self._pre += 1
+            elif tag == "br":
+                self._buffer.append("\n")
+            return
+
+        if tag == "table":
+            self._flush()
+            self._table = 1
+            return
+        if tag in HTML_INLINE:
+            self._inline.append(HTML_INLINE[tag])
+            self._buffer.append(f"<{HTML_INLINE[tag]}>")
+            return
+        if tag in ("code", "kbd", "samp", "tt") and not self._pre:
+            self._inline.append('font face="Courier"')
+            self._buffer.append('<font face="Courier">')
+            return
+        if tag == "a":
+            href = dict(attrs).get("href") or ""
+            if re.match(r"^(https?|mailto):", href):
+                markup = f'a href="{escape(href, {chr(34): "&quot;"})}" color="blue"'
+                self._inline.append(markup)
+                self._buffer.append(f"<{markup}>")
+            return
+        if tag == "br":
+            self._buffer.append("<br/>")
+            return
+        if tag == "hr":
+            self._flush()
+            self.blocks.append(("hr",))
+            return
+        if tag == "img":
+            alt = dict(attrs).get("alt")
+            if alt:
+                self._buffer.append(f"<i>[{escape(alt)}]</i>")
+            return
+        if tag in HTML_BLOCKS:
+            self._flush()
+            if tag in HTML_HEADINGS:
+                self._kind = tag
+            elif tag == "blockquote":
+                self._quote += 1
+            elif tag == "pre":
+                self._pre += 1
+                self._buffer = []
+            elif tag in ("ul", "ol"):
+                self._lists.append([tag, 0])
+            elif tag == "li":
+                depth = max(len(self._lists), 1)
+                bullet = "•"
+                if self._lists and self._lists[-1][0] == "ol":
+                    self._lists[-1][1] += 1
+                    bullet = f"{self._lists[-1][1]}."
+                self._li = (depth, bullet)
+
+    def handle_endtag(self, tag):
+        if tag in HTML_SKIP:
+            if tag not in HTML_VOID:
+                self._skip = max(0, self._skip - 1)
+            return
+        if self._skip:
+            return
+
+        if self._table:
+            self._table_end(tag)
+            return
+        if self._pre and tag != "pre":
+            return
+
+        if tag in HTML_INLINE or tag in ("code", "kbd", "samp", "tt", "a"):
+            wanted = HTML_INLINE.get(tag)
+            for i in range(len(self._inline) - 1, -1, -1):
+                open_tag = self._inline[i]
+                if (wanted and open_tag == wanted) or \
+                        (tag == "a" and open_tag.startswith("a ")) or \
+                        (tag in ("code", "kbd", "samp", "tt") and open_tag.startswith("font")):
+                    for t in reversed(self._inline[i:]):
+                        self._buffer.append(_close_tag(t))
+                    for t in self._inline[i + 1:]:
+                        self._buffer.append(f"<{t}>")
+                    del self._inline[i]
+                    break
+            return
+        if tag == "pre" and self._pre:
+            self._pre -= 1
+            if not self._pre:
+                text = "".join(self._buffer).strip("\n")
+                self._buffer = [f"<{t}>" for t in self._inline]
+                if text:
+                    self.blocks.append(("pre", text))
+            return
+        if tag in HTML_BLOCKS:
+            self._flush()
+            if tag in HTML_HEADINGS:
+                self._kind = "p"
+            elif tag == "blockquote":
+                self._quote = max(0, self._quote - 1)
+            elif tag in ("ul", "ol") and self._lists:
+                self._lists.pop()
+                self._li = None
+            elif tag == "li":
+                self._li = None
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in HTML_VOID:
+            self.handle_endtag(tag)
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        if self._table and self._cell is None:
+            return
+        # Preformatted text is laid out verbatim, not parsed as markup
+        self._buffer.append(data if self._pre else escape(data))
+
+    # -- tables --
+    def _table_start(self, tag):
+        if tag == "table":
+            self._table += 1
+        elif tag == "tr" and self._table == 1:
+            # </td> and </tr> are optional in HTML: a new row closes the open one
+            self._close_cell()
+            self._close_row()
+            self._row = []
+        elif tag in ("td", "th") and self._table == 1:
+            self._close_cell()
+            if self._row is None:
+                self._row = []
+            if tag == "th" and not self._rows:
+                self._header_row = True
+            self._cell = []
+            self._buffer = []
+            self._inline = []
+        elif tag == "br" and self._cell is not None:
+            self._buffer.append("<br/>")
+        elif self._cell is not None and (tag in HTML_BLOCKS or tag in ("tr", "td", "th")):
+            self._buffer.append(" ")
+        elif tag in HTML_INLINE and self._cell is not None:
+            self._inline.append(HTML_INLINE[tag])
+            self._buffer.append(f"<{HTML_INLINE[tag]}>")
+
+    def _table_end(self, tag):
+        if tag in HTML_INLINE and self._cell is not None and HTML_INLINE[tag] in self._inline:
+            i = len(self._inline) - 1 - self._inline[::-1].index(HTML_INLINE[tag])
+            for t in reversed(self._inline[i:]):
+                self._buffer.append(_close_tag(t))
+            for t in self._inline[i + 1:]:
+                self._buffer.append(f"<{t}>")
+            del self._inline[i]
+        elif tag in ("td", "th") and self._table == 1:
+            self._close_cell()
+        elif tag == "tr" and self._table == 1:
+            self._close_cell()
+            self._close_row()
+        elif tag == "table":
+            if self._table == 1:
+                self._close_cell()
+                self._close_row()
+            self._table -= 1
+            if self._table == 0:
+                self._emit_rows(final=True)
+
+    def _close_cell(self):
+        if self._cell is None:
+            return
+        closing = "".join(_close_tag(t) for t in reversed(self._inline))
+        self._cell.append("".join(self._buffer) + closing)
+        text = re.sub(r"\s+", " ", "".join(self._cell)).strip()
+        self._row.append(text)
+        self._cell = None
+        self._buffer = []
+        self._inline = []
+
+    def _close_row(self):
+        if self._row:
+            self._rows.append(self._row)
+        self._row = None
+        if len(self._rows) >= HTML_TABLE_CHUNK:
+            self._emit_rows(final=False)
+
+    def close(self):
+        super().close()
+        if self._table:
+            self._table = 1
+            self._close_cell()
+            self._close_row()
+            self._emit_rows(final=True)
+            self._table = 0
+        self._flush()
+
+
+def iter_text_chunks(source, size=HTML_READ_SIZE, encoding="utf-8"):
+    """Split markup (str), a path (os.PathLike) or a binary/text file into text chunks."""
+    if isinstance(source, str):
+        for i in range(0, len(source), size):
+            yield source[i:i + size]
+        return
+
+    f = open(source, "rb") if isinstance(source, os.PathLike) else source
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                break
+            yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        yield decoder.decode(b"", final=True)
+    finally:
+        if f is not source:
+            f.close()
+
+
+def iter_html_blocks(source):
+    """Yield layout blocks from HTML while it is being read, chunk by chunk."""
+    parser = HTMLBlockParser()
+    for chunk in iter_text_chunks(source):
+        parser.feed(chunk)
+        yield from parser.pop_blocks()
+    parser.close()
+    yield from parser.pop_blocks()
+
+
+def _plain(markup):
+    text = re.sub(r"<br/>", "\n", markup)
+    return unescape(re.sub(r"<[^>]+>", "", text))
+
+
+def html_to_text(source, output):
+    """Write readable text (no script/style) to a text stream. Returns characters written."""
+    written = 0
+    previous = None
+    for block in iter_html_blocks(source):
+        kind = block[0]
+        if kind == "li":
+            text = f"{'  ' * (block[2] - 1)}{block[3] or ' '} {_plain(block[1])}\n"
+        elif kind == "table":
+            text = "".join("\t".join(_plain(c) for c in row) + "\n" for row in block[1]) + "\n"
+        elif kind == "pre":
+            text = block[1] + "\n\n"
+        elif kind == "hr":
+            text = "-" * 40 + "\n\n"
+        else:
+            text = _plain(block[1]) + "\n\n"
+        if previous == "li" and kind != "li":
+            text = "\n" + text
+        previous = kind
+        output.write(text)
+        written += len(text)
+    return written
+
+
+def _safe_paragraph(markup, style, **kwargs):
+    # Malformed real-world markup must not abort a 500 page conversion
+    try:
+        return Paragraph(markup, style, **kwargs)
+    except ValueError:
+        return Paragraph(escape(_plain(markup)), style, **kwargs)
+
+
+def iter_html_flowables(source):
+    styles = get_styles()
+    for block in iter_html_blocks(source):
+        kind = block[0]
+        if kind in HTML_HEADINGS:
+            yield _safe_paragraph(block[1], styles[kind])
+        elif kind == "li":
+            yield _safe_paragraph(block[1], styles[f"list{min(block[2], 4)}"], bulletText=block[3] or None)
+        elif kind == "quote":
+            yield _safe_paragraph(block[1], styles["quote"])
+        elif kind == "pre":
+            yield Preformatted(block[1], styles["code"], maxLineLength=95)
+            yield Spacer(1, 6)
+        elif kind == "table":
+            yield make_table(block[1], header=block[2])
+            yield Spacer(1, 6)
+        elif kind == "hr":
+            yield HRFlowable(width="100%", color=colors.grey, spaceBefore=4, spaceAfter=8)
+        else:
+            yield _safe_paragraph(block[1], styles["body"])
+
+
+def html_to_pdf(source, output):
+    """Convert HTML (markup str, pathlib path or file) to a paginated PDF. Returns page count."""
+    return build_pdf(iter_html_flowables(source), output, title="HTML document")
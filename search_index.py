@@ -0,0 +1,68 @@
+import re
+from bisect import bisect_left
+from collections import Counter
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text):
+    """Lowercase, trim and collapse whitespace; the key form used by every index."""
+    return _SPACES.sub(" ", str(text).strip().lower())
+
+
+def trigrams(text):
+    """Character trigrams of normalize(text), padded so short words still match."""
+    padded = f"  {normalize(text)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PrefixIndex:
+    """Sorted keys searched with bisect: O(log n + k) prefix lookups."""
+
+    def __init__(self, items):
+        # items: (key, value) pairs; keys are normalized, duplicates allowed
+        self._entries = sorted((normalize(key), i, value) for i, (key, value) in enumerate(items))
+        self._keys = [entry[0] for entry in self._entries]
+
+    def search(self, prefix, limit=10):
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        results = []
+        for i in range(bisect_left(self._keys, prefix), len(self._keys)):
+            if not self._keys[i].startswith(prefix) or len(results) >= limit:
+                break
+            results.append(self._entries[i][2])
+        return results
+
+
+class TrigramIndex:
+    """Inverted trigram index for typo-tolerant lookups ("hydorgen" → Hydrogen)."""
+
+    def __init__(self, items):
+        self._values = []
+        self._sizes = []
+        self._postings = {}
+        for key, value in items:
+            grams = trigrams(key)
+            doc = len(self._values)
+            self._values.append(value)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(doc)
+
+    def search(self, query, limit=10, threshold=0.3):
+        """Values ranked by Dice similarity of trigram sets, best first."""
+        grams = trigrams(query)
+        if not grams:
+            return []
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        scored = []
+        for doc, count in shared.items():
+            score = 2 * count / (len(grams) + self._sizes[doc])
+            if score >= threshold:
+                scored.append((score, doc))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(self._values[doc], score) for score, doc in scored[:limit]]
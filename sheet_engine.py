@@ -0,0 +1,156 @@
+import csv
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+# Excel's hard limit, including the header row
+EXCEL_MAX_ROWS = 1048576
+CHUNK_ROWS = 50000
+PREVIEW_ROWS = 100
+
+
+# ---- TYPE INFERENCE ----
+def infer_column_types(frame):
+    """Decide once, from the first chunk, which columns hold numbers."""
+    kinds = {}
+    for column in frame.columns:
+        values = frame[column]
+        values = values[values != ""]
+        if values.empty:
+            kinds[column] = "str"
+            continue
+        # Leading zeros and long digit runs are identifiers (roll numbers, phone
+        # numbers) that Excel would mangle as numbers
+        if values.str.match(r"^[+-]?0\d").any() or values.str.len().max() > 15:
+            kinds[column] = "str"
+            continue
+        numeric = pd.to_numeric(values, errors="coerce")
+        if numeric.notna().all():
+            is_int = (numeric == numeric.round()).all() and not values.str.contains(r"[.eE]").any()
+            kinds[column] = "int" if is_int else "float"
+        else:
+            kinds[column] = "str"
+    return kinds
+
+
+def _typed_rows(frame, kinds):
+    """Rows of Python values with numeric columns converted; unparsable cells stay text."""
+    columns = []
+    for column in frame.columns:
+        values = frame[column]
+        kind = kinds.get(column, "str")
+        if kind != "str":
+            numeric = pd.to_numeric(values, errors="coerce")
+            if kind == "int" and numeric.notna().all() and (numeric == numeric.round()).all():
+                numeric = numeric.astype("int64")
+            converted = numeric.astype(object).where(numeric.notna(), values)
+        else:
+            converted = values.astype(object)
+        columns.append(converted.where(values != "", None).tolist())
+    return zip(*columns)
+
+
+# ---- CSV → EXCEL ----
+def csv_to_xlsx(source, output, chunk_rows=CHUNK_ROWS, preview_rows=PREVIEW_ROWS,
+                max_rows=EXCEL_MAX_ROWS, encoding="utf-8"):
+    """Stream a CSV into a write-only workbook, starting a new sheet at the row limit.
+
+    Returns a dict with row/sheet counts and a preview DataFrame of the first rows.
+    """
+    reader = pd.read_csv(source, chunksize=chunk_rows, dtype=str, keep_default_na=False,
+                         encoding=encoding, encoding_errors="replace")
+
+    wb = Workbook(write_only=True)
+    header = None
+    kinds = None
+    sheet = None
+    sheet_rows = 0
+    sheets = 0
+    total = 0
+    preview = []
+
+    for chunk in reader:
+        if kinds is None:
+            header = [str(c) for c in chunk.columns]
+            kinds = infer_column_types(chunk)
+
+        for row in _typed_rows(chunk, kinds):
+            if sheet is None or sheet_rows >= max_rows - 1:
+                sheets += 1
+                sheet = wb.create_sheet(f"Sheet{sheets}")
+                sheet.append(header)
+                sheet_rows = 0
+            sheet.append(row)
+            sheet_rows += 1
+            total += 1
+            if len(preview) < preview_rows:
+                preview.append(row)
+
+    if sheet is None:
+        sheets = 1
+        sheet = wb.create_sheet("Sheet1")
+        if header:
+            sheet.append(header)
+
+    wb.save(output)
+    return {
+        "rows": total,
+        "sheets": sheets,
+        "column_types": kinds or {},
+        "preview": pd.DataFrame(preview, columns=header),
+    }
+
+
+# ---- EXCEL → CSV ----
+def sheet_names(source):
+    wb = load_workbook(source, read_only=True)
+    try:
+        return wb.sheetnames
+    finally:
+        wb.close()
+        if hasattr(source, "seek"):
+            source.seek(0)
+
+
+def xlsx_to_csv(source, output, sheet=None, preview_rows=PREVIEW_ROWS):
+    """Copy one worksheet to CSV row by row without building a DataFrame.
+
+    output is a text stream. Returns a dict with the row count and a preview.
+    Read-only mode drops trailing empty cells when the sheet has no stored
+    dimension, so every row is padded to the width of the header (or of the
+    sheet, if wider) to keep the CSV rectangular.
+    """
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.worksheets[0]
+        writer = csv.writer(output)
+        header = None
+        width = 0
+        preview = []
+        total = 0
+
+        for row in ws.iter_rows(values_only=True):
+            if header is None:
+                width = max(len(row), ws.max_column or 0)
+                header = ["" if v is None else str(v) for v in row]
+                header += [""] * (width - len(header))
+                writer.writerow(header)
+                continue
+            values = ["" if v is None else v for v in row]
+            values += [""] * (width - len(values))
+            writer.writerow(values)
+            total += 1
+            if len(preview) < preview_rows:
+                preview.append(row)
+    finally:
+        wb.close()
+
+    preview = [tuple(r[:width]) + (None,) * (width - len(r)) for r in preview]
+    return {"rows": total, "preview": pd.DataFrame(preview, columns=header)}
+
+
+def xls_to_csv(source, output, sheet=None, preview_rows=PREVIEW_ROWS):
+    """Legacy .xls files have no streaming reader; load through pandas."""
+    df = pd.read_excel(source, sheet_name=sheet or 0)
+    df.to_csv(output, index=False)
+    return {"rows": len(df), "preview": df.head(preview_rows)}
@@ -4,466 +4,445 @@ import pandas as pd
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 import io
+import lazy_tabs
+import list_view
+import timers
 
 def show():
     st.markdown("## 🎓 Student Utilities")
     
-    tabs = st.tabs(["Study Planner", "Exam Countdown", "Notes Manager", "Productivity Tracker", "Calculator", "To-Do List", "Countdown Timer", "Stopwatch", "Pomodoro Timer"])
+    tabs = lazy_tabs.tabs("student_utils", ["Study Planner", "Exam Countdown", "Notes Manager", "Productivity Tracker", "Calculator", "To-Do List", "Countdown Timer", "Stopwatch", "Pomodoro Timer"])
     
-    with tabs[0]:
-        st.markdown("### 📅 Daily Study Planner")
-        
-        if 'schedule' not in st.session_state:
-            st.session_state.schedule = []
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            subject = st.text_input("Subject", key="subject_input")
-        with col2:
-            time_slot = st.text_input("Time (e.g., 9:00 AM - 10:00 AM)", key="time_input")
-        with col3:
-            if st.button("Add to Schedule"):
-                if subject and time_slot:
-                    st.session_state.schedule.append({"Subject": subject, "Time": time_slot})
-                    st.success("Added!")
-        
-        if st.session_state.schedule:
-            df = pd.DataFrame(st.session_state.schedule)
-            st.dataframe(df, use_container_width=True)
-            
-            if st.button("Clear Schedule"):
+    if tabs[0].open:
+        with tabs[0]:
+            st.markdown("### 📅 Daily Study Planner")
+        
+            if 'schedule' not in st.session_state:
                 st.session_state.schedule = []
-                st.rerun()
+        
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                subject = st.text_input("Subject", key="subject_input")
+            with col2:
+                time_slot = st.text_input("Time (e.g., 9:00 AM - 10:00 AM)", key="time_input")
+            with col3:
+                if st.button("Add to Schedule"):
+                    if subject and time_slot:
+                        st.session_state.schedule.append({"Subject": subject, "Time": time_slot})
+                        st.success("Added!")
+        
+            if st.session_state.schedule:
+                df = pd.DataFrame(st.session_state.schedule)
+                st.dataframe(df, use_container_width=True)
+            
+                if st.button("Clear Schedule"):
+                    st.session_state.schedule = []
+                    st.rerun()
     
-    with tabs[1]:
-        st.markdown("### ⏰ Exam Countdown Timer")
+    if tabs[1].open:
+        with tabs[1]:
+            st.markdown("### ⏰ Exam Countdown Timer")
         
-        exam_name = st.text_input("Exam Name", "Final Exams")
-        exam_date = st.date_input("Exam Date", datetime.date.today() + datetime.timedelta(days=30))
+            exam_name = st.text_input("Exam Name", "Final Exams")
+            exam_date = st.date_input("Exam Date", datetime.date.today() + datetime.timedelta(days=30))
         
-        today = datetime.date.today()
-        days_left = (exam_date - today).days
+            today = datetime.date.today()
+            days_left = (exam_date - today).days
         
-        if days_left > 0:
-            st.markdown(f"### 🎯 {days_left} Days Until {exam_name}")
-            st.progress(max(0, min(1, (30 - days_left) / 30)))
+            if days_left > 0:
+                st.markdown(f"### 🎯 {days_left} Days Until {exam_name}")
+                st.progress(max(0, min(1, (30 - days_left) / 30)))
             
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Days", days_left)
+                with col2:
+                    st.metric("Weeks", round(days_left / 7, 1))
+                with col3:
+                    st.metric("Months", round(days_left / 30, 1))
+            elif days_left == 0:
+                st.success("🎉 Exam is TODAY! Good luck!")
+            else:
+                st.info("Exam has passed")
+    
+    if tabs[2].open:
+        with tabs[2]:
+            st.markdown("### 📝 Notes Manager")
+        
+            if isinstance(st.session_state.get('notes'), dict):  # older sessions: {"folder/subject": text}
+                st.session_state.notes = [{"path": path, "folder": path.split("/", 1)[0], "subject": path.split("/", 1)[-1],
+                                           "content": content, "saved": ""}
+                                          for path, content in st.session_state.notes.items()]
+            notes = list_view.item_list('notes', sort=["subject", "saved"], index=["folder", "path"],
+                                        text=["subject", "content"])
+        
+            col1, col2 = st.columns([2, 1])
+            with col1:
+                note_subject = st.text_input("Subject/Topic", key="note_subject")
+            with col2:
+                folder = st.selectbox("Folder", ["General", "Important", "Revision", "Assignments"])
+        
+            note_content = st.text_area("Write your notes here...", height=200, key="note_content")
+        
+            if st.button("Save Note"):
+                if note_subject and note_content:
+                    key = f"{folder}/{note_subject}"
+                    saved = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+                    existing = notes.find(path=key)
+                    if existing:
+                        notes.update(existing[0], content=note_content, saved=saved)
+                    else:
+                        notes.add({"path": key, "folder": folder, "subject": note_subject,
+                                   "content": note_content, "saved": saved})
+                    st.success(f"✅ Saved to {folder}")
+        
+            st.markdown("### 📚 Saved Notes")
+        
+            def show_note(note_id, note):
+                with st.expander(f"📄 {note['path']}"):
+                    st.write(note['content'])
+                    if st.button(f"Delete", key=f"del_note_{note_id}"):
+                        notes.remove(note_id)
+                        st.rerun()
+        
+            list_view.render(notes, "notes", show_note, page_size=10,
+                             sort_options={"Recently saved": ("saved", True), "Subject": ("subject", False)},
+                             filters={"Folder": "folder"})
+    
+    if tabs[3].open:
+        with tabs[3]:
+            st.markdown("### 📊 Daily Productivity Tracker")
+        
+            if 'productivity' not in st.session_state:
+                st.session_state.productivity = []
+        
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Days", days_left)
+                task = st.text_input("Task", key="task_input")
             with col2:
-                st.metric("Weeks", round(days_left / 7, 1))
+                hours = st.number_input("Hours Spent", 0.0, 24.0, 1.0, 0.5)
             with col3:
-                st.metric("Months", round(days_left / 30, 1))
-        elif days_left == 0:
-            st.success("🎉 Exam is TODAY! Good luck!")
-        else:
-            st.info("Exam has passed")
-    
-    with tabs[2]:
-        st.markdown("### 📝 Notes Manager")
-        
-        if 'notes' not in st.session_state:
-            st.session_state.notes = {}
-        
-        col1, col2 = st.columns([2, 1])
-        with col1:
-            note_subject = st.text_input("Subject/Topic", key="note_subject")
-        with col2:
-            folder = st.selectbox("Folder", ["General", "Important", "Revision", "Assignments"])
-        
-        note_content = st.text_area("Write your notes here...", height=200, key="note_content")
-        
-        if st.button("Save Note"):
-            if note_subject and note_content:
-                key = f"{folder}/{note_subject}"
-                st.session_state.notes[key] = note_content
-                st.success(f"✅ Saved to {folder}")
-        
-        st.markdown("### 📚 Saved Notes")
-        for key, content in st.session_state.notes.items():
-            with st.expander(f"📄 {key}"):
-                st.write(content)
-                if st.button(f"Delete", key=f"del_{key}"):
-                    del st.session_state.notes[key]
-                    st.rerun()
-    
-    with tabs[3]:
-        st.markdown("### 📊 Daily Productivity Tracker")
-        
-        if 'productivity' not in st.session_state:
-            st.session_state.productivity = []
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            task = st.text_input("Task", key="task_input")
-        with col2:
-            hours = st.number_input("Hours Spent", 0.0, 24.0, 1.0, 0.5)
-        with col3:
-            status = st.selectbox("Status", ["Completed", "In Progress", "Pending"])
-        
-        if st.button("Log Task"):
-            if task:
-                st.session_state.productivity.append({
-                    "Date": datetime.date.today(),
-                    "Task": task,
-                    "Hours": hours,
-                    "Status": status
-                })
-                st.success("Logged!")
-        
-        if st.session_state.productivity:
-            df = pd.DataFrame(st.session_state.productivity)
-            st.dataframe(df, use_container_width=True)
+                status = st.selectbox("Status", ["Completed", "In Progress", "Pending"])
+        
+            if st.button("Log Task"):
+                if task:
+                    st.session_state.productivity.append({
+                        "Date": datetime.date.today(),
+                        "Task": task,
+                        "Hours": hours,
+                        "Status": status
+                    })
+                    st.success("Logged!")
+        
+            if st.session_state.productivity:
+                df = pd.DataFrame(st.session_state.productivity)
+                st.dataframe(df, use_container_width=True)
             
-            total_hours = sum([item['Hours'] for item in st.session_state.productivity])
-            st.metric("Total Hours Tracked", f"{total_hours} hrs")
+                total_hours = sum([item['Hours'] for item in st.session_state.productivity])
+                st.metric("Total Hours Tracked", f"{total_hours} hrs")
             
-            if st.button("Export as PDF"):
-                buffer = io.BytesIO()
-                c = canvas.Canvas(buffer, pagesize=letter)
-                c.drawString(100, 750, "Productivity Report")
-                y = 700
-                for item in st.session_state.productivity:
-                    c.drawString(50, y, f"{item['Date']} - {item['Task']} - {item['Hours']}h - {item['Status']}")
-                    y -= 20
-                c.save()
-                buffer.seek(0)
-                st.download_button("Download PDF", buffer, "productivity.pdf", "application/pdf")
+                if st.button("Export as PDF"):
+                    buffer = io.BytesIO()
+                    c = canvas.Canvas(buffer, pagesize=letter)
+                    c.drawString(100, 750, "Productivity Report")
+                    y = 700
+                    for item in st.session_state.productivity:
+                        c.drawString(50, y, f"{item['Date']} - {item['Task']} - {item['Hours']}h - {item['Status']}")
+                        y -= 20
+                    c.save()
+                    buffer.seek(0)
+                    st.download_button("Download PDF", buffer, "productivity.pdf", "application/pdf")
     
-    with tabs[4]:
-        st.markdown("### 🧮 Student Calculator")
+    if tabs[4].open:
+        with tabs[4]:
+            st.markdown("### 🧮 Student Calculator")
         
-        calc_type = st.selectbox("Calculator Type", ["GPA Calculator", "Percentage Calculator", "CGPA Calculator"])
+            calc_type = st.selectbox("Calculator Type", ["GPA Calculator", "Percentage Calculator", "CGPA Calculator"])
         
-        if calc_type == "GPA Calculator":
-            st.markdown("#### Calculate GPA")
-            num_subjects = st.number_input("Number of Subjects", 1, 10, 5)
+            if calc_type == "GPA Calculator":
+                st.markdown("#### Calculate GPA")
+                num_subjects = st.number_input("Number of Subjects", 1, 10, 5)
             
-            grades = []
-            credits = []
+                grades = []
+                credits = []
             
-            for i in range(num_subjects):
-                col1, col2 = st.columns(2)
-                with col1:
-                    grade = st.selectbox(f"Subject {i+1} Grade", ["A+", "A", "B+", "B", "C", "D", "F"], key=f"grade_{i}")
-                with col2:
-                    credit = st.number_input(f"Credits", 1, 6, 3, key=f"credit_{i}")
+                for i in range(num_subjects):
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        grade = st.selectbox(f"Subject {i+1} Grade", ["A+", "A", "B+", "B", "C", "D", "F"], key=f"grade_{i}")
+                    with col2:
+                        credit = st.number_input(f"Credits", 1, 6, 3, key=f"credit_{i}")
                 
-                grade_points = {"A+": 4.0, "A": 3.7, "B+": 3.3, "B": 3.0, "C": 2.0, "D": 1.0, "F": 0.0}
-                grades.append(grade_points[grade])
-                credits.append(credit)
+                    grade_points = {"A+": 4.0, "A": 3.7, "B+": 3.3, "B": 3.0, "C": 2.0, "D": 1.0, "F": 0.0}
+                    grades.append(grade_points[grade])
+                    credits.append(credit)
             
-            if st.button("Calculate GPA"):
-                gpa = sum([g * c for g, c in zip(grades, credits)]) / sum(credits)
-                st.success(f"### Your GPA: {gpa:.2f}")
+                if st.button("Calculate GPA"):
+                    gpa = sum([g * c for g, c in zip(grades, credits)]) / sum(credits)
+                    st.success(f"### Your GPA: {gpa:.2f}")
         
-        elif calc_type == "Percentage Calculator":
-            obtained = st.number_input("Marks Obtained", 0, 1000, 450)
-            total = st.number_input("Total Marks", 0, 1000, 500)
+            elif calc_type == "Percentage Calculator":
+                obtained = st.number_input("Marks Obtained", 0, 1000, 450)
+                total = st.number_input("Total Marks", 0, 1000, 500)
             
-            if st.button("Calculate"):
-                percentage = (obtained / total) * 100
-                st.success(f"### Percentage: {percentage:.2f}%")
+                if st.button("Calculate"):
+                    percentage = (obtained / total) * 100
+                    st.success(f"### Percentage: {percentage:.2f}%")
         
-        else:
-            st.markdown("#### CGPA Calculator")
-            num_semesters = st.number_input("Number of Semesters", 1, 8, 4)
+            else:
+                st.markdown("#### CGPA Calculator")
+                num_semesters = st.number_input("Number of Semesters", 1, 8, 4)
             
-            gpas = []
-            for i in range(num_semesters):
-                gpa = st.number_input(f"Semester {i+1} GPA", 0.0, 4.0, 3.5, key=f"sem_{i}")
-                gpas.append(gpa)
+                gpas = []
+                for i in range(num_semesters):
+                    gpa = st.number_input(f"Semester {i+1} GPA", 0.0, 4.0, 3.5, key=f"sem_{i}")
+                    gpas.append(gpa)
             
-            if st.button("Calculate CGPA"):
-                cgpa = sum(gpas) / len(gpas)
-                st.success(f"### Your CGPA: {cgpa:.2f}")
+                if st.button("Calculate CGPA"):
+                    cgpa = sum(gpas) / len(gpas)
+                    st.success(f"### Your CGPA: {cgpa:.2f}")
     
     # To-Do List
-    with tabs[5]:
-        st.markdown("### ✅ To-Do List Manager")
-        
-        if 'todo_list' not in st.session_state:
-            st.session_state.todo_list = []
-        
-        col1, col2, col3 = st.columns([3, 1, 1])
-        with col1:
-            new_task = st.text_input("Add new task", key="new_task", placeholder="Enter your task here...")
-        with col2:
-            priority = st.selectbox("Priority", ["🔴 High", "🟡 Medium", "🟢 Low"], key="priority")
-        with col3:
-            st.write("")
-            st.write("")
-            if st.button("➕ Add Task", use_container_width=True):
-                if new_task:
-                    st.session_state.todo_list.append({
-                        "task": new_task,
-                        "priority": priority,
-                        "completed": False,
-                        "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-                    })
-                    st.success("Task added!")
-                    st.rerun()
+    if tabs[5].open:
+        with tabs[5]:
+            st.markdown("### ✅ To-Do List Manager")
         
-        if st.session_state.todo_list:
-            st.markdown("---")
-            st.markdown("### 📋 Your Tasks")
+            todos = list_view.item_list('todo_list', sort=["created", "priority", "task"],
+                                        index=["priority", "completed"], text=["task"])
+        
+            col1, col2, col3 = st.columns([3, 1, 1])
+            with col1:
+                new_task = st.text_input("Add new task", key="new_task", placeholder="Enter your task here...")
+            with col2:
+                priority = st.selectbox("Priority", ["🔴 High", "🟡 Medium", "🟢 Low"], key="priority")
+            with col3:
+                st.write("")
+                st.write("")
+                if st.button("➕ Add Task", use_container_width=True):
+                    if new_task:
+                        todos.add({
+                            "task": new_task,
+                            "priority": priority,
+                            "completed": False,
+                            "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+                        })
+                        st.success("Task added!")
+                        st.rerun()
+        
+            if len(todos):
+                st.markdown("---")
+                st.markdown("### 📋 Your Tasks")
             
-            # Filter options
-            filter_opt = st.radio("Filter", ["All", "Active", "Completed"], horizontal=True)
+                # Filter options
+                filter_opt = st.radio("Filter", ["All", "Active", "Completed"], horizontal=True)
+                where = {"Active": {"completed": False}, "Completed": {"completed": True}}.get(filter_opt)
             
-            for idx, item in enumerate(st.session_state.todo_list):
-                if filter_opt == "Active" and item['completed']:
-                    continue
-                if filter_opt == "Completed" and not item['completed']:
-                    continue
-                
-                col_a, col_b, col_c, col_d = st.columns([0.5, 3, 1.5, 1])
+                def show_todo(todo_id, item):
+                    col_a, col_b, col_c, col_d = st.columns([0.5, 3, 1.5, 1])
                 
-                with col_a:
-                    if st.checkbox("", value=item['completed'], key=f"check_{idx}"):
-                        st.session_state.todo_list[idx]['completed'] = True
-                    else:
-                        st.session_state.todo_list[idx]['completed'] = False
+                    with col_a:
+                        done = st.checkbox("Done", value=item['completed'], key=f"check_{todo_id}",
+                                           label_visibility="collapsed")
+                        todos.update(todo_id, completed=done)
                 
-                with col_b:
-                    if item['completed']:
-                        st.markdown(f"~~{item['task']}~~")
-                    else:
-                        st.markdown(f"**{item['task']}**")
+                    with col_b:
+                        if item['completed']:
+                            st.markdown(f"~~{item['task']}~~")
+                        else:
+                            st.markdown(f"**{item['task']}**")
                 
-                with col_c:
-                    st.text(f"{item['priority']} • {item['created']}")
+                    with col_c:
+                        st.text(f"{item['priority']} • {item['created']}")
                 
-                with col_d:
-                    if st.button("🗑️", key=f"del_todo_{idx}"):
-                        st.session_state.todo_list.pop(idx)
-                        st.rerun()
+                    with col_d:
+                        if st.button("🗑️", key=f"del_todo_{todo_id}"):
+                            todos.remove(todo_id)
+                            st.rerun()
             
-            # Statistics
-            total = len(st.session_state.todo_list)
-            completed = sum(1 for item in st.session_state.todo_list if item['completed'])
-            pending = total - completed
+                list_view.render(todos, "todo", show_todo, where=where,
+                                 sort_options={"Newest": ("created", True), "Priority": ("priority", False),
+                                               "Task": ("task", False)},
+                                 filters={"Priority": "priority"})
             
-            st.markdown("---")
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total Tasks", total)
-            with col2:
-                st.metric("Completed", completed)
-            with col3:
-                st.metric("Pending", pending)
+                # Statistics
+                total = len(todos)
+                completed = todos.count(completed=True)
+                pending = total - completed
             
-            if total > 0:
-                st.progress(completed / total)
+                st.markdown("---")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Total Tasks", total)
+                with col2:
+                    st.metric("Completed", completed)
+                with col3:
+                    st.metric("Pending", pending)
             
-            if st.button("🗑️ Clear All Completed"):
-                st.session_state.todo_list = [item for item in st.session_state.todo_list if not item['completed']]
-                st.rerun()
-        else:
-            st.info("📝 No tasks yet. Add your first task above!")
+                if total > 0:
+                    st.progress(completed / total)
+            
+                if st.button("🗑️ Clear All Completed"):
+                    todos.remove_where(completed=True)
+                    st.rerun()
+            else:
+                st.info("📝 No tasks yet. Add your first task above!")
     
     # Countdown Timer
-    with tabs[6]:
-        st.markdown("### ⏱️ Countdown Timer")
-        
-        st.info("Set a countdown timer for your study sessions, breaks, or any timed activity!")
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            hours = st.number_input("Hours", 0, 23, 0, key="countdown_hours")
-        with col2:
-            minutes = st.number_input("Minutes", 0, 59, 25, key="countdown_minutes")
-        with col3:
-            seconds = st.number_input("Seconds", 0, 59, 0, key="countdown_seconds")
-        
-        total_seconds = hours * 3600 + minutes * 60 + seconds
-        
-        if 'countdown_active' not in st.session_state:
-            st.session_state.countdown_active = False
-        if 'countdown_remaining' not in st.session_state:
-            st.session_state.countdown_remaining = 0
-        
-        col_a, col_b, col_c = st.columns(3)
-        
-        with col_a:
-            if st.button("▶️ Start", use_container_width=True, key="countdown_start"):
-                st.session_state.countdown_active = True
-                st.session_state.countdown_remaining = total_seconds
-                st.success(f"Timer started for {hours}h {minutes}m {seconds}s")
-        
-        with col_b:
-            if st.button("⏸️ Pause", use_container_width=True, key="countdown_pause"):
-                st.session_state.countdown_active = False
-                st.info("Timer paused")
-        
-        with col_c:
-            if st.button("🔄 Reset", use_container_width=True, key="countdown_reset"):
-                st.session_state.countdown_active = False
-                st.session_state.countdown_remaining = 0
-                st.warning("Timer reset")
-        
-        if st.session_state.countdown_remaining > 0:
-            hrs = st.session_state.countdown_remaining // 3600
-            mins = (st.session_state.countdown_remaining % 3600) // 60
-            secs = st.session_state.countdown_remaining % 60
-            
-            st.markdown(f"### ⏰ {hrs:02d}:{mins:02d}:{secs:02d}")
-            st.progress(1 - (st.session_state.countdown_remaining / total_seconds if total_seconds > 0 else 0))
-            
-            if st.session_state.countdown_remaining == 0:
-                st.success("⏰ Time's up!")
+    if tabs[6].open:
+        with tabs[6]:
+            st.markdown("### ⏱️ Countdown Timer")
+        
+            st.info("Set a countdown timer for your study sessions, breaks, or any timed activity!")
+        
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                hours = st.number_input("Hours", 0, 23, 0, key="countdown_hours")
+            with col2:
+                minutes = st.number_input("Minutes", 0, 59, 25, key="countdown_minutes")
+            with col3:
+                seconds = st.number_input("Seconds", 0, 59, 0, key="countdown_seconds")
+            subject = st.text_input("Log to Study Analytics as", placeholder="Subject (leave empty to not log)",
+                                    key="countdown_subject")
+        
+            total_seconds = hours * 3600 + minutes * 60 + seconds
+            timer = timers.get("countdown", total_seconds, subject.strip() or None)
+            if timers.check(timer):
+                st.success("⏰ Time's up!" + (f" Logged to Study Analytics under {timer.subject}." if timer.subject else ""))
                 st.balloons()
+        
+            col_a, col_b, col_c = st.columns(3)
+        
+            with col_a:
+                st.button("▶️ Start", use_container_width=True, key="countdown_start", on_click=timer.start)
+        
+            with col_b:
+                st.button("⏸️ Pause", use_container_width=True, key="countdown_pause", on_click=timer.pause)
+        
+            with col_c:
+                st.button("🔄 Reset", use_container_width=True, key="countdown_reset", on_click=timer.reset)
+        
+            if timer.duration:
+                timers.display(timer, "countdown")
+                if timer.duration != total_seconds:
+                    st.caption(f"Counting down from {timers.format_seconds(timer.duration)}; reset to use the new time.")
     
     # Stopwatch
-    with tabs[7]:
-        st.markdown("### ⏲️ Stopwatch")
-        
-        st.info("Track time spent on tasks, study sessions, or any activity!")
-        
-        if 'stopwatch_start' not in st.session_state:
-            st.session_state.stopwatch_start = None
-        if 'stopwatch_elapsed' not in st.session_state:
-            st.session_state.stopwatch_elapsed = 0
-        if 'stopwatch_running' not in st.session_state:
-            st.session_state.stopwatch_running = False
-        if 'stopwatch_laps' not in st.session_state:
-            st.session_state.stopwatch_laps = []
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if st.button("▶️ Start", use_container_width=True, key="sw_start"):
-                if not st.session_state.stopwatch_running:
-                    st.session_state.stopwatch_start = datetime.datetime.now()
-                    st.session_state.stopwatch_running = True
-                    st.success("Stopwatch started!")
-        
-        with col2:
-            if st.button("⏸️ Stop", use_container_width=True, key="sw_stop"):
-                if st.session_state.stopwatch_running:
-                    elapsed = (datetime.datetime.now() - st.session_state.stopwatch_start).total_seconds()
-                    st.session_state.stopwatch_elapsed += elapsed
-                    st.session_state.stopwatch_running = False
-                    st.info("Stopwatch stopped")
-        
-        with col3:
-            if st.button("📍 Lap", use_container_width=True, key="sw_lap"):
-                if st.session_state.stopwatch_running:
-                    current_elapsed = st.session_state.stopwatch_elapsed
-                    if st.session_state.stopwatch_running:
-                        current_elapsed += (datetime.datetime.now() - st.session_state.stopwatch_start).total_seconds()
-                    st.session_state.stopwatch_laps.append(current_elapsed)
-                    st.success(f"Lap {len(st.session_state.stopwatch_laps)} recorded!")
-        
-        with col4:
-            if st.button("🔄 Reset", use_container_width=True, key="sw_reset"):
-                st.session_state.stopwatch_start = None
-                st.session_state.stopwatch_elapsed = 0
-                st.session_state.stopwatch_running = False
-                st.session_state.stopwatch_laps = []
-                st.warning("Stopwatch reset")
-        
-        # Display elapsed time
-        current_elapsed = st.session_state.stopwatch_elapsed
-        if st.session_state.stopwatch_running and st.session_state.stopwatch_start:
-            current_elapsed += (datetime.datetime.now() - st.session_state.stopwatch_start).total_seconds()
-        
-        hrs = int(current_elapsed // 3600)
-        mins = int((current_elapsed % 3600) // 60)
-        secs = int(current_elapsed % 60)
-        msecs = int((current_elapsed % 1) * 100)
-        
-        st.markdown(f"### ⏱️ {hrs:02d}:{mins:02d}:{secs:02d}.{msecs:02d}")
-        
-        # Display laps
-        if st.session_state.stopwatch_laps:
-            st.markdown("### 📍 Lap Times")
-            for i, lap_time in enumerate(st.session_state.stopwatch_laps):
-                lap_hrs = int(lap_time // 3600)
-                lap_mins = int((lap_time % 3600) // 60)
-                lap_secs = int(lap_time % 60)
-                st.text(f"Lap {i+1}: {lap_hrs:02d}:{lap_mins:02d}:{lap_secs:02d}")
+    if tabs[7].open:
+        with tabs[7]:
+            st.markdown("### ⏲️ Stopwatch")
+        
+            st.info("Track time spent on tasks, study sessions, or any activity!")
+        
+            timer = timers.get("stopwatch")
+        
+            col1, col2, col3, col4 = st.columns(4)
+        
+            with col1:
+                st.button("▶️ Start", use_container_width=True, key="sw_start", on_click=timer.start)
+        
+            with col2:
+                st.button("⏸️ Stop", use_container_width=True, key="sw_stop", on_click=timer.pause)
+        
+            with col3:
+                st.button("📍 Lap", use_container_width=True, key="sw_lap", on_click=timer.lap)
+        
+            with col4:
+                st.button("🔄 Reset", use_container_width=True, key="sw_reset", on_click=timer.reset)
+        
+            timers.display(timer, "stopwatch")
+        
+            # Display laps
+            if timer.laps:
+                st.markdown("### 📍 Lap Times")
+                for i, lap_time in enumerate(timer.laps):
+                    st.text(f"Lap {i+1}: {timers.format_seconds(lap_time)}")
+        
+            # A stopped stopwatch can be logged as a study session
+            if not timer.running and timer.elapsed >= 60:
+                col_s, col_l = st.columns([3, 1])
+                with col_s:
+                    subject = st.text_input("Subject", key="sw_subject", placeholder="e.g., Physics")
+                with col_l:
+                    st.write("")
+                    if st.button("📊 Log Session", use_container_width=True, key="sw_log"):
+                        timers.log_session(subject.strip(), timer.elapsed)
+                        st.success(f"Logged {timers.format_seconds(timer.elapsed)} to Study Analytics!")
+                        timer.reset()
     
     # Pomodoro Timer
-    with tabs[8]:
-        st.markdown("### 🍅 Pomodoro Timer")
-        
-        st.info("Boost productivity with the Pomodoro Technique: 25 min work + 5 min break cycles!")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            work_duration = st.number_input("Work Duration (minutes)", 1, 60, 25, key="pomodoro_work")
-        with col2:
-            break_duration = st.number_input("Break Duration (minutes)", 1, 30, 5, key="pomodoro_break")
-        
-        if 'pomodoro_mode' not in st.session_state:
-            st.session_state.pomodoro_mode = "work"  # "work" or "break"
-        if 'pomodoro_remaining' not in st.session_state:
-            st.session_state.pomodoro_remaining = work_duration * 60
-        if 'pomodoro_active' not in st.session_state:
-            st.session_state.pomodoro_active = False
-        if 'pomodoro_completed' not in st.session_state:
-            st.session_state.pomodoro_completed = 0
-        
-        # Display current mode
-        if st.session_state.pomodoro_mode == "work":
-            st.markdown("### 💼 Work Session")
-            mode_color = "🔴"
-        else:
-            st.markdown("### ☕ Break Time")
-            mode_color = "🟢"
-        
-        col_a, col_b, col_c = st.columns(3)
-        
-        with col_a:
-            if st.button("▶️ Start Pomodoro", use_container_width=True, key="pomodoro_start"):
-                st.session_state.pomodoro_active = True
+    if tabs[8].open:
+        with tabs[8]:
+            st.markdown("### 🍅 Pomodoro Timer")
+        
+            st.info("Boost productivity with the Pomodoro Technique: 25 min work + 5 min break cycles!")
+        
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                work_duration = st.number_input("Work Duration (minutes)", 1, 60, 25, key="pomodoro_work")
+            with col2:
+                break_duration = st.number_input("Break Duration (minutes)", 1, 30, 5, key="pomodoro_break")
+            with col3:
+                subject = st.text_input("Subject", "Study", key="pomodoro_subject")
+        
+            if 'pomodoro_mode' not in st.session_state:
+                st.session_state.pomodoro_mode = "work"  # "work" or "break"
+            if 'pomodoro_completed' not in st.session_state:
+                st.session_state.pomodoro_completed = 0
+        
+            on_break = st.session_state.pomodoro_mode == "break"
+            timer = timers.get("pomodoro", (break_duration if on_break else work_duration) * 60,
+                               None if on_break else subject.strip())
+        
+            # Work sessions are logged by timers.check (here or on the analytics page);
+            # a phase that ran out while nobody was watching is caught up from its end time
+            just_finished = timers.check(timer)
+            while timer.done:
                 if st.session_state.pomodoro_mode == "work":
-                    st.session_state.pomodoro_remaining = work_duration * 60
+                    ended = timer.ended
+                    st.session_state.pomodoro_mode = "break"
+                    st.session_state.pomodoro_completed += 1
+                    timer.reset(break_duration * 60)
+                    timer.subject = None
+                    timer.start(at=ended)
+                    timers.check(timer)
+                    if just_finished:
+                        st.success("🎉 Work session completed! Time for a break!")
+                        st.balloons()
                 else:
-                    st.session_state.pomodoro_remaining = break_duration * 60
-                st.success("Pomodoro started!")
+                    st.session_state.pomodoro_mode = "work"
+                    timer.reset(work_duration * 60)
+                    if just_finished:
+                        st.success("✨ Break over! Ready for another work session?")
         
-        with col_b:
-            if st.button("⏸️ Pause", use_container_width=True, key="pomodoro_pause"):
-                st.session_state.pomodoro_active = False
-                st.info("Pomodoro paused")
+            # Display current mode
+            if st.session_state.pomodoro_mode == "work":
+                st.markdown("### 💼 Work Session")
+            else:
+                st.markdown("### ☕ Break Time")
         
-        with col_c:
-            if st.button("🔄 Reset", use_container_width=True, key="pomodoro_reset"):
-                st.session_state.pomodoro_active = False
+            def reset_pomodoro():
                 st.session_state.pomodoro_mode = "work"
-                st.session_state.pomodoro_remaining = work_duration * 60
-                st.warning("Pomodoro reset")
+                timer.reset(work_duration * 60)
         
-        # Display timer
-        mins = st.session_state.pomodoro_remaining // 60
-        secs = st.session_state.pomodoro_remaining % 60
+            col_a, col_b, col_c = st.columns(3)
         
-        st.markdown(f"### {mode_color} {mins:02d}:{secs:02d}")
+            with col_a:
+                st.button("▶️ Start Pomodoro", use_container_width=True, key="pomodoro_start", on_click=timer.start)
         
-        total = work_duration * 60 if st.session_state.pomodoro_mode == "work" else break_duration * 60
-        st.progress(1 - (st.session_state.pomodoro_remaining / total if total > 0 else 0))
+            with col_b:
+                st.button("⏸️ Pause", use_container_width=True, key="pomodoro_pause", on_click=timer.pause)
         
-        # Statistics
-        st.markdown("---")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("🍅 Pomodoros Completed", st.session_state.pomodoro_completed)
-        with col2:
-            total_time = st.session_state.pomodoro_completed * work_duration
-            st.metric("⏱️ Total Focus Time", f"{total_time} min")
+            with col_c:
+                st.button("🔄 Reset", use_container_width=True, key="pomodoro_reset", on_click=reset_pomodoro)
         
-        if st.session_state.pomodoro_remaining == 0 and st.session_state.pomodoro_active:
-            if st.session_state.pomodoro_mode == "work":
-                st.success("🎉 Work session completed! Time for a break!")
-                st.balloons()
-                st.session_state.pomodoro_mode = "break"
-                st.session_state.pomodoro_remaining = break_duration * 60
-                st.session_state.pomodoro_completed += 1
-            else:
-                st.success("✨ Break over! Ready for another work session?")
-                st.session_state.pomodoro_mode = "work"
-                st.session_state.pomodoro_remaining = work_duration * 60
-                st.session_state.pomodoro_active = False
+            # Display timer
+            timers.display(timer, "pomodoro")
+        
+            # Statistics
+            st.markdown("---")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("🍅 Pomodoros Completed", st.session_state.pomodoro_completed)
+            with col2:
+                total_time = st.session_state.pomodoro_completed * work_duration
+                st.metric("⏱️ Total Focus Time", f"{total_time} min")
@@ -0,0 +1,119 @@
+"""Logged study sessions with daily, subject and weekly rollups kept up to date.
+
+st.session_state.study_sessions holds a StudyLog. Besides the sessions
+themselves ({"subject", "duration" in hours, "date" ISO string}) it
+keeps running totals:
+
+    daily    date → [hours, sessions]
+    subject  subject → hours
+    weekly   Monday of the ISO week → hours
+
+append() updates them in O(1); a plain list of sessions (older sessions,
+benchmarks) is rolled up once with a vectorized groupby. Charts read the
+totals as pandas Series, built on first use and cached until the next
+append.
+"""
+import datetime
+
+import pandas as pd
+import streamlit as st
+
+_COLUMNS = ["subject", "duration", "date"]
+
+
+def week_start(day):
+    return day - datetime.timedelta(days=day.weekday())
+
+
+class StudyLog:
+    """Study sessions, iterable like the plain list they replace."""
+
+    def __init__(self, sessions=()):
+        self._sessions = list(sessions)
+        self.total = 0.0
+        self._daily = {}
+        self._subjects = {}
+        self._weekly = {}
+        self._series = {}
+        if self._sessions:
+            self._rollup(self._sessions)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __iter__(self):
+        return iter(self._sessions)
+
+    def __bool__(self):
+        return bool(self._sessions)
+
+    def _rollup(self, sessions):
+        """All totals at once, vectorized (initial load)."""
+        frame = pd.DataFrame.from_records(sessions, columns=_COLUMNS)
+        hours = frame["duration"].astype("float64")
+        dates = pd.to_datetime(frame["date"], format="ISO8601").dt.normalize()
+        self.total = float(hours.sum())
+
+        daily = hours.groupby(dates).agg(["sum", "count"])
+        self._daily = {day.date(): [total, int(count)]
+                       for day, total, count in zip(daily.index, daily["sum"], daily["count"])}
+        subjects = hours.groupby(frame["subject"].fillna("")).sum()
+        self._subjects = dict(zip(subjects.index, subjects.to_numpy().tolist()))
+        weeks = hours.groupby(dates - pd.to_timedelta(dates.dt.weekday, unit="D")).sum()
+        self._weekly = dict(zip(weeks.index.date, weeks.to_numpy().tolist()))
+
+    def append(self, session):
+        self._sessions.append(session)
+        hours = float(session["duration"])
+        day = datetime.date.fromisoformat(str(session["date"])[:10])
+        self.total += hours
+        totals = self._daily.setdefault(day, [0.0, 0])
+        totals[0] += hours
+        totals[1] += 1
+        subject = session.get("subject") or ""
+        self._subjects[subject] = self._subjects.get(subject, 0.0) + hours
+        week = week_start(day)
+        self._weekly[week] = self._weekly.get(week, 0.0) + hours
+        self._series.clear()
+
+    # ---- precomputed series ----
+    def _cached(self, key, compute):
+        if key not in self._series:
+            self._series[key] = compute()
+        return self._series[key]
+
+    def by_subject(self):
+        """Hours per subject, largest first."""
+        return self._cached("subject", lambda: pd.Series(self._subjects, dtype="float64", name="duration")
+                            .rename_axis("subject").sort_values(ascending=False))
+
+    def daily(self):
+        """Hours per day that has sessions, in date order."""
+        def compute():
+            days = sorted(self._daily)
+            return pd.Series([self._daily[d][0] for d in days], index=pd.DatetimeIndex(days, name="date"),
+                             dtype="float64", name="duration")
+        return self._cached("daily", compute)
+
+    def weekly(self):
+        """Hours per ISO week (indexed by its Monday), in date order."""
+        def compute():
+            weeks = sorted(self._weekly)
+            return pd.Series([self._weekly[w] for w in weeks], index=pd.DatetimeIndex(weeks, name="week"),
+                             dtype="float64", name="duration")
+        return self._cached("weekly", compute)
+
+    def week_hours(self, day=None):
+        return self._weekly.get(week_start(day or datetime.date.today()), 0.0)
+
+    def sessions_per_day(self, first, days=7):
+        """Number of sessions on each of the `days` days from first."""
+        return [self._daily.get(first + datetime.timedelta(days=i), (0, 0))[1] for i in range(days)]
+
+
+def get(name="study_sessions"):
+    """The StudyLog at st.session_state[name]; a plain list there is converted in place."""
+    current = st.session_state.get(name)
+    if not isinstance(current, StudyLog):
+        st.session_state[name] = StudyLog(current or [])
+    return st.session_state[name]
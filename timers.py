@@ -0,0 +1,146 @@
+"""Countdown, stopwatch, focus and Pomodoro timers that tick in the browser.
+
+A Timer keeps only what it needs to know the time at any moment: seconds
+accumulated by earlier runs and the wall-clock start of the current one.
+The server touches it on start, pause, lap and reset (button reruns) and
+when a countdown completes. In between, static/timer/ counts on the
+client, so a running timer causes no reruns at all.
+
+    timer = timers.get("countdown", 25 * 60, subject="Maths")
+    if timers.check(timer):      # completed: logged to Study Analytics
+        st.balloons()
+    timers.display(timer, "countdown")
+
+Completion is decided by the server clock, so a countdown that ran out
+while its tab was closed is still logged on the next rerun that polls
+it (Study Analytics calls poll_all).
+"""
+import datetime
+import time
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+import study_log
+
+# The browser reports completion from its own clock; allow for the render
+# message having arrived a little after the server sent it
+SLACK = 1.0
+
+_display = components.declare_component("timer", path=str(Path(__file__).parent / "static" / "timer"))
+
+
+class Timer:
+    """A countdown (duration in seconds) or, with duration None, a stopwatch."""
+
+    def __init__(self, duration=None, subject=None):
+        self.duration = duration
+        self.subject = subject # logged to Study Analytics on completion, if set
+        self.elapsed = 0.0     # seconds from runs before the current one
+        self.started = None    # time.time() when the current run started
+        self.ended = None      # time.time() when the countdown reached zero
+        self.run = 0           # bumped on every start, to tell runs apart
+        self.laps = []
+
+    @property
+    def running(self):
+        return self.started is not None
+
+    @property
+    def done(self):
+        return self.ended is not None
+
+    def current(self, now=None):
+        """Seconds counted so far."""
+        if self.started is None:
+            return self.elapsed
+        return self.elapsed + (now or time.time()) - self.started
+
+    def remaining(self, now=None):
+        return max(0.0, self.duration - self.current(now)) if self.duration is not None else None
+
+    def start(self, at=None):
+        if self.done:
+            self.reset()
+        if self.duration is not None and self.duration <= 0:
+            return
+        if not self.running:
+            self.started = at or time.time()
+            self.run += 1
+
+    def pause(self, now=None):
+        if self.running:
+            self.elapsed = self.current(now)
+            self.started = None
+
+    def reset(self, duration=None):
+        self.started = self.ended = None
+        self.elapsed = 0.0
+        self.laps = []
+        if duration is not None:
+            self.duration = duration
+
+    def lap(self, now=None):
+        if self.running:
+            self.laps.append(self.current(now))
+
+    def finished(self, now=None):
+        """True once, when a running countdown has reached zero; it then stops."""
+        if not self.running or self.duration is None:
+            return False
+        if self.current(now) < self.duration - SLACK:
+            return False
+        self.ended = self.started + self.duration - self.elapsed
+        self.elapsed = self.duration
+        self.started = None
+        return True
+
+
+def get(name, duration=None, subject=None):
+    """The Timer at st.session_state["timer_<name>"].
+
+    A stopped timer picks up a changed duration (the settings inputs);
+    a running or finished one keeps the duration it was started with.
+    """
+    timer = st.session_state.setdefault(f"timer_{name}", Timer(duration))
+    if duration != timer.duration and not timer.running and not timer.done and not timer.elapsed:
+        timer.duration = duration
+    timer.subject = subject
+    return timer
+
+
+def check(timer, now=None):
+    """Finish the timer if its time is up, logging it; True on that rerun only."""
+    if not timer.finished(now):
+        return False
+    if timer.subject:
+        log_session(timer.subject, timer.duration, datetime.date.fromtimestamp(timer.ended))
+    return True
+
+
+def poll_all(now=None):
+    """check() every timer in the session, e.g. before showing study totals."""
+    for value in list(st.session_state.values()):
+        if isinstance(value, Timer):
+            check(value, now)
+
+
+def display(timer, key):
+    """Render the ticking clock; the component reruns the app once, on completion."""
+    return _display(elapsed=timer.current(), duration=timer.duration, running=timer.running, run=timer.run,
+                    theme=st.session_state.get("theme", "dark"), key=f"timer_display_{key}", default=None)
+
+
+def log_session(subject, seconds, date=None):
+    """Add a timed session to Study Analytics (durations there are in hours)."""
+    study_log.get().append({
+        "subject": subject or "Study",
+        "duration": round(seconds / 3600, 2),
+        "date": str(date or datetime.date.today()),
+    })
+
+
+def format_seconds(seconds):
+    whole = int(seconds)
+    return f"{whole // 3600:02d}:{whole % 3600 // 60:02d}:{whole % 60:02d}"
@@ -0,0 +1,248 @@
+import re
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+
+PACKS_DIR = Path(__file__).parent / "data" / "phrase_packs"
+
+LANGUAGES = {
+    "en": "English",
+    "hi": "Hindi",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+}
+
+# Every spelling we accept for a language, mapped to its ISO 639-1 code
+_ALIASES = {
+    "en": ["english", "eng", "anglais", "inglés", "ingles", "englisch", "अंग्रेज़ी", "अंग्रेजी"],
+    "hi": ["hindi", "hin", "हिन्दी", "हिंदी"],
+    "es": ["spanish", "spa", "español", "espanol", "castellano", "espagnol", "spanisch"],
+    "fr": ["french", "fra", "fre", "français", "francais", "französisch", "francés"],
+    "de": ["german", "deu", "ger", "deutsch", "allemand", "alemán", "aleman"],
+}
+ALIASES = {alias: code for code, names in _ALIASES.items() for alias in names + [code]}
+
+# How each target language writes sentence punctuation
+OPENERS = {"es": {"?": "¿", "!": "¡"}}
+FULL_STOP = {"hi": "।"}
+
+# Numbers such as 3.5 or 1,000 and dotted abbreviations such as e.g. or
+# U.S. are single tokens, not words split by punctuation
+_NUMBER = r"\d+(?:[.,]\d+)+"
+_ABBREVIATION = r"(?<!\w)(?:\w\.){2,}"
+_TOKEN = re.compile(rf"{_NUMBER}|{_ABBREVIATION}|[^\s.,!?;:¿¡।\"“”()]+|[.,!?;:¿¡।]")
+# A sentence ends at . ! ? । followed by whitespace or the end of the text
+_SENTENCE = re.compile(rf"(?:{_ABBREVIATION}|[^.!?।]|[.!?।](?!\s|$))*[.!?।]*")
+_OUTER_PUNCT = "¿¡?!.,;:। "
+
+Segment = namedtuple("Segment", "source target known")
+Translation = namedtuple("Translation", "text segments coverage")
+
+
+def normalize_language(value):
+    """'Hindi', 'hi', 'HIN', 'hi-IN', 'es_MX', 'Español' → ISO code; None if unknown."""
+    if not value:
+        return None
+    key = unicodedata.normalize("NFC", str(value)).strip().casefold()
+    if key in ALIASES:
+        return ALIASES[key]
+    base = re.split(r"[-_]", key, maxsplit=1)[0]
+    return ALIASES.get(base)
+
+
+def _fold(token):
+    return unicodedata.normalize("NFC", token).casefold()
+
+
+def tokenize(text):
+    return _TOKEN.findall(unicodedata.normalize("NFC", text))
+
+
+def _is_punct(token):
+    return all(unicodedata.category(ch).startswith("P") for ch in token)
+
+
+def _phrase_key(text):
+    return tuple(_fold(t) for t in tokenize(text) if not _is_punct(t))
+
+
+def _join(tokens):
+    out = ""
+    for token in tokens:
+        if not out or out[-1] in "¿¡" or (_is_punct(token) and token not in "¿¡"):
+            out += token
+        else:
+            out += " " + token
+    return out
+
+
+def _mid_sentence(phrase, target):
+    """Drop the capital a stored phrase carries when it lands mid-sentence."""
+    if target == "de" or len(phrase) < 2 or not phrase[1].islower():
+        return phrase  # German nouns stay capitalized; so do acronyms
+    if target == "en" and phrase.split()[0] in ("I", "I'm"):
+        return phrase
+    return phrase[0].lower() + phrase[1:]
+
+
+class PhraseTable:
+    """Multilingual phrase entries indexed per language by their token n-grams."""
+
+    def __init__(self):
+        self.entries = []          # [{code: phrase}]
+        self._index = {}           # code → {token tuple: entry id}
+        self._lengths = {}         # code → {first token: lengths longest first}
+
+    def add(self, phrases):
+        """phrases: {code: text} for one meaning; codes are normalized."""
+        entry = {}
+        for code, text in phrases.items():
+            code = normalize_language(code)
+            if code and text:
+                entry[code] = str(text).strip()
+        if not entry:
+            return
+        eid = len(self.entries)
+        self.entries.append(entry)
+        for code, text in entry.items():
+            key = _phrase_key(text)
+            if not key:
+                continue
+            index = self._index.setdefault(code, {})
+            if key in index:
+                continue  # first definition wins ("never mind" vs "no problem")
+            index[key] = eid
+            lengths = self._lengths.setdefault(code, {}).setdefault(key[0], [])
+            if len(key) not in lengths:
+                lengths.append(len(key))
+                lengths.sort(reverse=True)
+
+    def load(self, data):
+        """translations.json layout: {"common_phrases": {id: {code: text}}}."""
+        for phrase_id, phrases in (data.get("common_phrases") or data.get("phrases") or {}).items():
+            phrases = dict(phrases)
+            phrases.setdefault("en", phrase_id.replace("_", " "))
+            self.add(phrases)
+
+    def load_tsv(self, path):
+        """Phrase pack with a header row of language codes, one meaning per line."""
+        with open(path, encoding="utf-8") as f:
+            header = [normalize_language(h) for h in f.readline().rstrip("\n").split("\t")]
+            for line in f:
+                cells = line.rstrip("\n").split("\t")
+                self.add({code: cell for code, cell in zip(header, cells) if code})
+
+    def languages(self):
+        return [code for code in LANGUAGES if code in self._index]
+
+    def segment(self, tokens, source):
+        """Longest-match segmentation: [(start, end, entry id or None)]."""
+        index = self._index.get(source, {})
+        lengths = self._lengths.get(source, {})
+        folded = [_fold(t) for t in tokens]
+        spans = []
+        i = 0
+        while i < len(tokens):
+            if _is_punct(tokens[i]):
+                spans.append((i, i + 1, None))
+                i += 1
+                continue
+            match = None
+            for n in lengths.get(folded[i], ()):
+                window = folded[i:i + n]
+                if len(window) == n and not any(_is_punct(t) for t in window):
+                    eid = index.get(tuple(window))
+                    if eid is not None:
+                        match = (i, i + n, eid)
+                        break
+            if match:
+                spans.append(match)
+                i = match[1]
+            else:
+                spans.append((i, i + 1, None))
+                i += 1
+        return spans
+
+
+class Translator:
+    """Phrase-table translation with per-sentence caching.
+
+    Text is split into sentences and each (sentence, source, target) result
+    is memoized, so re-translating while typing only redoes the sentence
+    being edited.
+    """
+
+    def __init__(self, table, cache_size=4096):
+        self.table = table
+        self._sentence = lru_cache(maxsize=cache_size)(self._translate_sentence)
+
+    def translate(self, text, source, target):
+        source = normalize_language(source)
+        target = normalize_language(target)
+        if source is None or target is None:
+            raise ValueError("unknown language")
+        sentences = [s.strip() for s in _SENTENCE.findall(text or "") if s.strip()]
+        parts = [self._sentence(s, source, target) for s in sentences]
+        segments = [seg for part in parts for seg in part.segments]
+        words = [seg for seg in segments if not _is_punct(seg.source)]
+        coverage = sum(seg.known for seg in words) / len(words) if words else 1.0
+        return Translation(" ".join(part.text for part in parts), segments, coverage)
+
+    def _translate_sentence(self, sentence, source, target):
+        tokens = tokenize(sentence)
+        if source == target:
+            segments = [Segment(t, t, True) for t in tokens]
+            return Translation(_join(tokens), segments, 1.0)
+
+        segments = []
+        for start, end, eid in self.table.segment(tokens, source):
+            original = _join(tokens[start:end])
+            if eid is None:
+                if original in "¿¡":
+                    continue  # re-added below for Spanish, dropped elsewhere
+                if _is_punct(original):
+                    segments.append(Segment(original, FULL_STOP.get(target, ".") if original == "." else original, True))
+                else:
+                    segments.append(Segment(original, original, False))
+                continue
+            translated = self.table.entries[eid].get(target)
+            if translated is None:
+                segments.append(Segment(original, original, False))
+            else:
+                translated = translated.strip(_OUTER_PUNCT)
+                if segments:
+                    translated = _mid_sentence(translated, target)
+                segments.append(Segment(original, translated, True))
+
+        out = [seg.target for seg in segments]
+        # ¿...? and ¡...! in Spanish
+        if out and out[-1] in OPENERS.get(target, {}):
+            out.insert(0, OPENERS[target][out[-1]])
+        text = _join(out)
+        if text and tokens and tokens[0][:1].isupper():
+            text = text[0].upper() + text[1:] if text[0] not in "¿¡" else text[0] + text[1:2].upper() + text[2:]
+        words = [seg for seg in segments if not _is_punct(seg.source)]
+        coverage = sum(seg.known for seg in words) / len(words) if words else 1.0
+        return Translation(text, segments, coverage)
+
+    def cache_info(self):
+        return self._sentence.cache_info()
+
+
+def build_translator(data, packs_dir=PACKS_DIR):
+    """Translator over translations.json data plus any data/phrase_packs/*.tsv|*.json."""
+    import json
+
+    table = PhraseTable()
+    table.load(data)
+    packs_dir = Path(packs_dir)
+    if packs_dir.is_dir():
+        for path in sorted(packs_dir.iterdir()):
+            if path.suffix == ".tsv":
+                table.load_tsv(path)
+            elif path.suffix == ".json":
+                with open(path, encoding="utf-8") as f:
+                    table.load(json.load(f))
+    return Translator(table)
@@ -0,0 +1,287 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+# Base dimensions: length, mass, time, temperature
+BASE = ("m", "kg", "s", "K")
+
+DIMENSIONS = {
+    "Length": (1, 0, 0, 0),
+    "Mass": (0, 1, 0, 0),
+    "Time": (0, 0, 1, 0),
+    "Temperature": (0, 0, 0, 1),
+    "Speed": (1, 0, -1, 0),
+    "Area": (2, 0, 0, 0),
+    "Volume": (3, 0, 0, 0),
+    "Force": (1, 1, -2, 0),
+    "Energy": (2, 1, -2, 0),
+    "Power": (2, 1, -3, 0),
+    "Pressure": (-1, 1, -2, 0),
+}
+_DIMENSION_NAMES = {dims: name for name, dims in DIMENSIONS.items()}
+
+# SI value = value * scale + offset
+Quantity = namedtuple("Quantity", "scale offset dims")
+Unit = namedtuple("Unit", "symbol name dimension scale offset")
+
+
+class DimensionError(ValueError):
+    pass
+
+
+# Each unit is an edge to units defined before it: "<factor> <expression>".
+# The registry walks these once to get every unit's SI scale, then
+# precomputes the pairwise conversion table for each dimension.
+UNIT_DEFINITIONS = [
+    # symbol, name, definition, aliases
+    ("m", "meter", None, ["meters", "metre", "metres"]),
+    ("kg", "kilogram", None, ["kilograms", "kilo", "kilos"]),
+    ("s", "second", None, ["seconds", "sec", "secs"]),
+    ("K", "kelvin", None, ["kelvins"]),
+
+    ("km", "kilometer", "1000 m", ["kilometers", "kilometre", "kilometres"]),
+    ("cm", "centimeter", "0.01 m", ["centimeters", "centimetre", "centimetres"]),
+    ("mm", "millimeter", "0.001 m", ["millimeters", "millimetre", "millimetres"]),
+    ("µm", "micrometer", "1e-6 m", ["um", "micrometers", "micron", "microns"]),
+    ("nm", "nanometer", "1e-9 m", ["nanometers"]),
+    ("in", "inch", "2.54 cm", ["inches"]),
+    ("ft", "foot", "12 in", ["feet"]),
+    ("yd", "yard", "3 ft", ["yards"]),
+    ("mi", "mile", "5280 ft", ["miles"]),
+    ("nmi", "nautical mile", "1852 m", ["nautical miles"]),
+
+    ("g", "gram", "0.001 kg", ["grams", "gm"]),
+    ("mg", "milligram", "0.001 g", ["milligrams"]),
+    ("t", "tonne", "1000 kg", ["tonnes", "ton", "tons", "metric ton"]),
+    ("lb", "pound", "0.45359237 kg", ["pounds", "lbs"]),
+    ("oz", "ounce", "0.0625 lb", ["ounces"]),
+
+    ("ms", "millisecond", "0.001 s", ["milliseconds"]),
+    ("min", "minute", "60 s", ["minutes", "mins"]),
+    ("h", "hour", "60 min", ["hours", "hr", "hrs"]),
+    ("day", "day", "24 h", ["days", "d"]),
+    ("week", "week", "7 day", ["weeks", "wk"]),
+    ("yr", "year", "365.25 day", ["years", "year"]),
+
+    ("km/h", "kilometer per hour", "km/h", ["kph", "kmph"]),
+    ("mph", "mile per hour", "mi/h", ["miles per hour"]),
+    ("kn", "knot", "nmi/h", ["knot", "knots", "kt"]),
+
+    ("ha", "hectare", "10000 m^2", ["hectares"]),
+    ("acre", "acre", "4046.8564224 m^2", ["acres", "ac"]),
+
+    ("L", "liter", "0.001 m^3", ["l", "liters", "litre", "litres"]),
+    ("mL", "milliliter", "0.001 L", ["ml", "milliliters", "millilitre", "cc"]),
+    ("gal", "US gallon", "3.785411784 L", ["gallon", "gallons"]),
+    ("qt", "US quart", "0.25 gal", ["quart", "quarts"]),
+    ("pt", "US pint", "0.5 qt", ["pint", "pints"]),
+    ("cup", "US cup", "0.5 pt", ["cups"]),
+    ("fl_oz", "US fluid ounce", "0.125 cup", ["fl oz", "floz", "fluid ounce", "fluid ounces"]),
+
+    ("N", "newton", "kg*m/s^2", ["newtons"]),
+    ("lbf", "pound-force", "4.4482216152605 N", ["pound force"]),
+
+    ("J", "joule", "N*m", ["joules"]),
+    ("kJ", "kilojoule", "1000 J", ["kilojoules"]),
+    ("cal", "calorie", "4.184 J", ["calories"]),
+    ("kcal", "kilocalorie", "1000 cal", ["kilocalories", "Cal"]),
+    ("Wh", "watt-hour", "3600 J", ["watt hour", "watt hours"]),
+    ("kWh", "kilowatt-hour", "1000 Wh", ["kilowatt hour", "kilowatt hours"]),
+    ("eV", "electronvolt", "1.602176634e-19 J", ["electronvolts"]),
+    ("BTU", "British thermal unit", "1055.05585262 J", ["btu"]),
+
+    ("W", "watt", "J/s", ["watts"]),
+    ("kW", "kilowatt", "1000 W", ["kilowatts"]),
+    ("hp", "horsepower", "745.69987158227 W", ["horsepower"]),
+
+    ("Pa", "pascal", "N/m^2", ["pascals"]),
+    ("kPa", "kilopascal", "1000 Pa", ["kilopascals"]),
+    ("bar", "bar", "100000 Pa", ["bars"]),
+    ("atm", "atmosphere", "101325 Pa", ["atmospheres"]),
+    ("mmHg", "millimeter of mercury", "133.322387415 Pa", ["mm hg"]),
+    ("torr", "torr", "0.0075 atm", ["Torr"]),
+    ("psi", "pound per square inch", "lbf/in^2", ["PSI"]),
+]
+
+# Affine units: SI kelvin = value * scale + offset. Only valid on their own;
+# inside compound expressions they count as temperature differences.
+AFFINE_UNITS = [
+    ("°C", "degree Celsius", 1.0, 273.15, ["C", "degC", "celsius", "centigrade"]),
+    ("°F", "degree Fahrenheit", 5 / 9, 273.15 - 32 * 5 / 9, ["F", "degF", "fahrenheit"]),
+]
+
+_SUPERSCRIPTS = str.maketrans({"²": "^2", "³": "^3", "⁻": "^-", "¹": "1", "·": "*", "×": "*"})
+_EXPR_TOKEN = re.compile(r"\s*(?:(\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)|([A-Za-zµ°_][A-Za-z0-9µ°_]*)|(\^-?\d+)|([*/()]))")
+
+
+def _mul(a, b, sign=1):
+    return Quantity(a.scale * b.scale ** sign, 0.0, tuple(x + sign * y for x, y in zip(a.dims, b.dims)))
+
+
+class UnitRegistry:
+    """Units with dimensions, resolved once through their definition graph.
+
+    Any expression of known units works ("kg*m^2/s^2", "J/(kg*K)", "ft²");
+    conversions between named units come from a precomputed table.
+    """
+
+    def __init__(self, definitions=UNIT_DEFINITIONS, affine=AFFINE_UNITS):
+        self._quantities = {}
+        self._lookup = {}
+        self._folded = {}   # spelled-out names only: symbols are case-sensitive
+        self.units = []
+        for symbol, name, definition, aliases in definitions:
+            if definition is None:
+                dims = tuple(int(symbol == base) for base in BASE)
+                quantity = Quantity(1.0, 0.0, dims)
+            else:
+                quantity = self._evaluate(definition)
+            self._add(symbol, name, quantity, aliases)
+        for symbol, name, scale, offset, aliases in affine:
+            self._add(symbol, name, Quantity(scale, offset, DIMENSIONS["Temperature"]), aliases)
+
+        # Pairwise (factor, shift) for every two named units of a dimension
+        self.table = {}
+        for dimension in DIMENSIONS:
+            units = self.units_for(dimension)
+            for a in units:
+                for b in units:
+                    self.table[a.symbol, b.symbol] = (a.scale / b.scale, (a.offset - b.offset) / b.scale)
+
+    def _add(self, symbol, name, quantity, aliases):
+        self._quantities[symbol] = quantity
+        self.units.append(Unit(symbol, name, _DIMENSION_NAMES.get(quantity.dims), quantity.scale, quantity.offset))
+        for key in [symbol, name] + list(aliases):
+            self._lookup.setdefault(key, symbol)
+        # "Meter" and "FEET" are fine, but Mm is not mm and T is not t
+        for key in [name] + [alias for alias in aliases if len(alias) > 3]:
+            self._folded.setdefault(key.casefold(), symbol)
+
+    def resolve(self, name):
+        """Canonical symbol for a unit name, symbol or alias; None if unknown.
+
+        Symbols must match exactly; spelled-out names in any case.
+        """
+        name = name.strip()
+        return self._lookup.get(name) or self._folded.get(name.casefold())
+
+    def units_for(self, dimension):
+        return [u for u in self.units if u.dimension == dimension]
+
+    # ---- PARSING ----
+    def _evaluate(self, expression):
+        text = expression.translate(_SUPERSCRIPTS)
+        tokens = []
+        pos = 0
+        while pos < len(text.rstrip()):
+            match = _EXPR_TOKEN.match(text, pos)
+            if not match:
+                raise ValueError(f"cannot parse unit '{expression}' at '{text[pos:]}'")
+            tokens.append(match.groups())
+            pos = match.end()
+        quantity, rest = self._product(tokens, 0)
+        if rest != len(tokens):
+            raise ValueError(f"unbalanced parentheses in '{expression}'")
+        return quantity
+
+    def _product(self, tokens, i):
+        result = Quantity(1.0, 0.0, (0,) * len(BASE))
+        sign = 1
+        while i < len(tokens):
+            number, name, power, op = tokens[i]
+            if op == ")":
+                break
+            if op in ("*", "/"):
+                sign = -1 if op == "/" else 1
+                i += 1
+                continue
+            if op == "(":
+                factor, i = self._product(tokens, i + 1)
+                i += 1  # closing parenthesis
+            elif number:
+                factor = Quantity(float(number), 0.0, (0,) * len(BASE))
+                i += 1
+            else:
+                symbol = self.resolve(name)
+                if symbol is None:
+                    raise ValueError(f"unknown unit '{name}'")
+                factor = self._quantities[symbol]
+                i += 1
+            if i < len(tokens) and tokens[i][2]:
+                exponent = int(tokens[i][2][1:])
+                factor = Quantity(factor.scale ** exponent, 0.0, tuple(d * exponent for d in factor.dims))
+                i += 1
+            result = _mul(result, factor, sign)
+            sign = 1
+        return result, i
+
+    @lru_cache(maxsize=1024)
+    def parse(self, expression):
+        """Quantity for a unit name or expression; affine only when it is a bare unit."""
+        symbol = self.resolve(expression)
+        if symbol is not None:
+            return self._quantities[symbol]
+        return self._evaluate(expression)
+
+    def dimension_of(self, expression):
+        dims = self.parse(expression).dims
+        return _DIMENSION_NAMES.get(dims) or " ".join(
+            f"{b}^{d}" if d != 1 else b for b, d in zip(BASE, dims) if d)
+
+    # ---- CONVERSION ----
+    def factors(self, source, target):
+        """(factor, shift) with target = value * factor + shift."""
+        a, b = self.resolve(source), self.resolve(target)
+        if a and b and (a, b) in self.table:
+            return self.table[a, b]
+        qa, qb = self.parse(source), self.parse(target)
+        if qa.dims != qb.dims:
+            raise DimensionError(f"cannot convert {source} ({self.dimension_of(source)}) "
+                                 f"to {target} ({self.dimension_of(target)})")
+        return qa.scale / qb.scale, (qa.offset - qb.offset) / qb.scale
+
+    def convert(self, values, source, target):
+        """Convert a scalar or any array-like in one vectorized pass."""
+        factor, shift = self.factors(source, target)
+        array = np.asarray(values, dtype=float)
+        result = array * factor
+        if shift:
+            result += shift
+        return result if array.ndim else float(result)
+
+
+REGISTRY = UnitRegistry()
+
+
+def convert(values, source, target):
+    return REGISTRY.convert(values, source, target)
+
+
+_HEADER_UNIT = re.compile(r"^(.*?)\s*[\(\[]\s*([^\)\]]+?)\s*[\)\]]\s*$")
+
+
+def split_header(header, registry=REGISTRY):
+    """'Length (cm)' / 't [s]' → ('Length', 'cm'); (header, None) without a known unit."""
+    match = _HEADER_UNIT.match(str(header))
+    if match:
+        try:
+            registry.parse(match.group(2))
+            return match.group(1), match.group(2)
+        except ValueError:
+            pass
+    return str(header), None
+
+
+def convert_table(df, targets, registry=REGISTRY):
+    """Copy of df with each column in targets ({column: unit}) converted and relabelled."""
+    out = df.copy()
+    renames = {}
+    for column, target in targets.items():
+        label, source = split_header(column, registry)
+        if source is None or not target or registry.resolve(source) == registry.resolve(target):
+            continue
+        out[column] = registry.convert(out[column].to_numpy(dtype=float), source, target)
+        renames[column] = f"{label} ({target})"
+    return out.rename(columns=renames)
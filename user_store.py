@@ -0,0 +1,65 @@
+"""Where a visitor's own data (journal, flashcards, expenses) is kept.
+
+Each visitor only ever sees their own stores:
+
+    signed in (st.login)  a folder per account under data/user/users/,
+                          shared by that account's sessions and kept on disk
+    anonymous             in memory, for this browser session only (like the
+                          session_state lists these stores replaced)
+
+SUH_SINGLE_USER=1 is for a personal, one-person install: everything lives
+in data/user/ directly and persists across restarts. It must not be set
+on a server other people can reach, since every visitor would then share
+one journal, deck and ledger.
+
+    @st.cache_resource
+    def _journal_at(folder):
+        return journal_store.Journal(Path(folder) / "journal.db")
+
+    journal = user_store.get("journal", _journal_at, lambda: journal_store.Journal(None))
+"""
+import hashlib
+import os
+
+import streamlit as st
+
+from json_utils import USER_DIR
+
+SINGLE_USER = os.environ.get("SUH_SINGLE_USER", "").lower() not in ("", "0", "false", "no")
+
+
+def _account():
+    """A stable id for the signed-in account, or None."""
+    try:
+        user = st.user
+        if not user.is_logged_in:
+            return None
+        return user.get("sub") or user.get("email")
+    except Exception:  # authentication not configured
+        return None
+
+
+def user_dir():
+    """The folder for this visitor's persistent data, or None to keep it in the session."""
+    if SINGLE_USER:
+        return USER_DIR
+    account = _account()
+    if account is None:
+        return None
+    return USER_DIR / "users" / hashlib.sha256(str(account).encode("utf-8")).hexdigest()[:24]
+
+
+def get(name, shared, private):
+    """This visitor's store.
+
+    shared(folder) opens a persistent one (wrap it in st.cache_resource so
+    an account's sessions share it); private() creates a session-only one,
+    kept in st.session_state.
+    """
+    folder = user_dir()
+    if folder is not None:
+        return shared(str(folder))
+    key = f"_user_store_{name}"
+    if key not in st.session_state:
+        st.session_state[key] = private()
+    return st.session_state[key]
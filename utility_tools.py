@@ -1,215 +1,279 @@
 import streamlit as st
 import requests
 import json_utils
+import lazy_tabs
+import element_index
+import dictionary_engine
+import translation_engine
+import unit_engine
+
+@st.cache_resource
+def _element_index(stamp):
+    periodic_data = json_utils.load_reference_data('periodic_table.json')
+    return element_index.ElementIndex(periodic_data.get('elements', []))
+
+@st.cache_resource
+def _element_grid(stamp):
+    return _element_index(stamp).grid()
+
+def get_element_index():
+    """Shared element index, rebuilt only when periodic_table.json changes."""
+    return _element_index(json_utils.data_stamp('periodic_table.json'))
+
+def show_element(elem):
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Symbol", elem.symbol)
+    with col2:
+        st.metric("Atomic Number", elem.number)
+    with col3:
+        st.metric("Atomic Mass", f"{elem.mass:g}")
+    with col4:
+        st.write(f"**{elem.name}**\n{elem.category}\n\nGroup {elem.group}, Period {elem.period}")
+
+@st.cache_resource
+def _translator(stamp):
+    return translation_engine.build_translator(json_utils.load_reference_data('translations.json'))
+
+def get_translator():
+    """Shared translator (and its sentence cache), rebuilt when translations.json changes."""
+    return _translator((json_utils.data_stamp('translations.json'), json_utils.data_stamp('phrase_packs')))
+
+def show_entry(entry):
+    st.markdown(f"### {entry['word'].title()}")
+    for i, sense in enumerate(entry['senses'], 1):
+        if sense.get('part_of_speech'):
+            st.markdown(f"*{sense['part_of_speech']}*")
+        st.markdown("**Definition:**" if len(entry['senses']) == 1 else f"**Definition {i}:**")
+        st.info(sense['definition'])
+        if sense.get('example'):
+            st.markdown("**Example:**")
+            st.write(f"*\"{sense['example']}\"*")
+    if entry['synonyms']:
+        st.markdown("**Synonyms:**")
+        st.write(", ".join(entry['synonyms']))
+
+def _pick_word(word):
+    st.session_state["dict_word"] = word
+
+def word_buttons(words, key):
+    cols = st.columns(len(words))
+    for col, word in zip(cols, words):
+        with col:
+            st.button(word, key=f"{key}_{word}", on_click=_pick_word, args=(word,))
 
 def show():
     st.markdown("## 🌐 Utility Features")
     
-    tabs = st.tabs(["Unit Converter", "Periodic Table", "Dictionary", "Translator"])
+    tabs = lazy_tabs.tabs("utility_tools", ["Unit Converter", "Periodic Table", "Dictionary", "Translator"])
     
     # Unit Converter
-    with tabs[0]:
-        st.markdown("### 🔄 Unit Converter")
-        
-        conversion_type = st.selectbox("Conversion Type", 
-                                      ["Length", "Weight", "Temperature", "Time", "Speed"])
-        
-        if conversion_type == "Length":
-            col1, col2 = st.columns(2)
-            with col1:
-                value = st.number_input("Value", 0.0, 1000000.0, 1.0)
-                from_unit = st.selectbox("From", ["Meters", "Kilometers", "Miles", "Feet", "Inches", "Centimeters"])
-            
-            with col2:
-                to_unit = st.selectbox("To", ["Meters", "Kilometers", "Miles", "Feet", "Inches", "Centimeters"])
-            
-            # Conversion factors to meters
-            to_meters = {
-                "Meters": 1, "Kilometers": 1000, "Miles": 1609.34,
-                "Feet": 0.3048, "Inches": 0.0254, "Centimeters": 0.01
-            }
-            
-            result = value * to_meters[from_unit] / to_meters[to_unit]
-            st.success(f"### {value} {from_unit} = {result:.4f} {to_unit}")
+    if tabs[0].open:
+        with tabs[0]:
+            st.markdown("### 🔄 Unit Converter")
         
-        elif conversion_type == "Weight":
-            col1, col2 = st.columns(2)
-            with col1:
-                value = st.number_input("Value", 0.0, 1000000.0, 1.0)
-                from_unit = st.selectbox("From", ["Kilograms", "Grams", "Pounds", "Ounces", "Tons"])
-            
-            with col2:
-                to_unit = st.selectbox("To", ["Kilograms", "Grams", "Pounds", "Ounces", "Tons"])
-            
-            to_kg = {
-                "Kilograms": 1, "Grams": 0.001, "Pounds": 0.453592,
-                "Ounces": 0.0283495, "Tons": 1000
-            }
-            
-            result = value * to_kg[from_unit] / to_kg[to_unit]
-            st.success(f"### {value} {from_unit} = {result:.4f} {to_unit}")
+            registry = unit_engine.REGISTRY
+            categories = list(unit_engine.DIMENSIONS) + ["Custom expression"]
+            conversion_type = st.selectbox("Conversion Type", categories, key="unit_type")
         
-        elif conversion_type == "Temperature":
             col1, col2 = st.columns(2)
-            with col1:
-                value = st.number_input("Value", -273.0, 10000.0, 25.0)
-                from_unit = st.selectbox("From", ["Celsius", "Fahrenheit", "Kelvin"])
-            
-            with col2:
-                to_unit = st.selectbox("To", ["Celsius", "Fahrenheit", "Kelvin"])
-            
-            # Convert to Celsius first
-            if from_unit == "Fahrenheit":
-                celsius = (value - 32) * 5/9
-            elif from_unit == "Kelvin":
-                celsius = value - 273.15
-            else:
-                celsius = value
-            
-           # Convert from Celsius to target
-            if to_unit == "Fahrenheit":
-                result = celsius * 9/5 + 32
-            elif to_unit == "Kelvin":
-                result = celsius + 273.15
+            if conversion_type == "Custom expression":
+                with col1:
+                    value = st.number_input("Value", value=1.0, key="unit_value", format="%g")
+                    from_unit = st.text_input("From", "kg*m^2/s^2", key="unit_from_expr",
+                                              help="Any product of units, e.g. J/(kg*K), lbf/in^2, ft²")
+                with col2:
+                    to_unit = st.text_input("To", "kWh", key="unit_to_expr")
             else:
-                result = celsius
-            
-            st.success(f"### {value}° {from_unit} = {result:.2f}° {to_unit}")
+                units = registry.units_for(conversion_type)
+                symbols = [u.symbol for u in units]
+                names = {u.symbol: f"{u.name} ({u.symbol})" for u in units}
+                with col1:
+                    value = st.number_input("Value", value=1.0, key="unit_value", format="%g")
+                    from_unit = st.selectbox("From", symbols, key=f"unit_from_{conversion_type}", format_func=names.get)
+                with col2:
+                    to_unit = st.selectbox("To", symbols, index=min(1, len(symbols) - 1),
+                                           key=f"unit_to_{conversion_type}", format_func=names.get)
         
-        elif conversion_type == "Time":
-            col1, col2 = st.columns(2)
-            with col1:
-                value = st.number_input("Value", 0.0, 1000000.0, 1.0)
-                from_unit = st.selectbox("From", ["Seconds", "Minutes", "Hours", "Days", "Weeks"])
-            
-            with col2:
-                to_unit = st.selectbox("To", ["Seconds", "Minutes", "Hours", "Days", "Weeks"])
-            
-            to_seconds = {
-                "Seconds": 1, "Minutes": 60, "Hours": 3600,
-                "Days": 86400, "Weeks": 604800
-            }
-            
-            result = value * to_seconds[from_unit] / to_seconds[to_unit]
-            st.success(f"### {value} {from_unit} = {result:.4f} {to_unit}")
+            try:
+                result = registry.convert(value, from_unit, to_unit)
+                st.success(f"### {value:g} {from_unit} = {result:.6g} {to_unit}")
+                if conversion_type == "Custom expression":
+                    st.caption(f"Dimension: {registry.dimension_of(from_unit)}")
+            except ValueError as e:
+                st.error(str(e))
         
-        else:  # Speed
-            col1, col2 = st.columns(2)
-            with col1:
-                value = st.number_input("Value", 0.0, 100000.0, 100.0)
-                from_unit = st.selectbox("From", ["m/s", "km/h", "mph"])
-            
-            with col2:
-                to_unit = st.selectbox("To", ["m/s", "km/h", "mph"])
-            
-            to_ms = {"m/s": 1, "km/h": 0.277778, "mph": 0.44704}
-            
-            result = value * to_ms[from_unit] / to_ms[to_unit]
-            st.success(f"### {value} {from_unit} = {result:.2f} {to_unit}")
+            with st.expander("📋 Convert columns (paste CSV)"):
+                st.caption("Put units in the headers, e.g. `time (s),distance (ft),temp (°F)`. "
+                           "Whole columns are converted at once.")
+                csv_text = st.text_area("CSV data", height=150, key="unit_csv",
+                                        placeholder="time (s),distance (ft),temp (°F)\n0,0,68\n1,16.1,68.5")
+                if csv_text.strip():
+                    import io
+                    import pandas as pd
+                    try:
+                        df = pd.read_csv(io.StringIO(csv_text))
+                    except Exception as e:
+                        st.error(f"Could not read CSV: {e}")
+                        df = None
+                    if df is not None:
+                        targets = {}
+                        unit_columns = [c for c in df.columns if unit_engine.split_header(c)[1]]
+                        if not unit_columns:
+                            st.warning("No column headers with known units")
+                        cols = st.columns(max(1, min(4, len(unit_columns))))
+                        for i, column in enumerate(unit_columns):
+                            source = unit_engine.split_header(column)[1]
+                            dimension = registry.dimension_of(source)
+                            options = [u.symbol for u in registry.units_for(dimension)] or [source]
+                            if registry.resolve(source) not in options:
+                                options = [source] + options
+                            with cols[i % len(cols)]:
+                                targets[column] = st.selectbox(f"{column} →", options,
+                                                               index=options.index(registry.resolve(source) or source),
+                                                               key=f"unit_csv_{i}")
+                        try:
+                            converted = unit_engine.convert_table(df, targets)
+                            st.dataframe(converted, use_container_width=True)
+                            st.download_button("📥 Download CSV", converted.to_csv(index=False),
+                                               "converted.csv", "text/csv")
+                        except ValueError as e:
+                            st.error(f"Conversion failed: {e}")
     
     # Periodic Table
-    with tabs[1]:
-        st.markdown("### ⚛️ Periodic Table Reference")
+    if tabs[1].open:
+        with tabs[1]:
+            st.markdown("### ⚛️ Periodic Table Reference")
         
-        element_search = st.text_input("Search Element", "Hydrogen")
+            index = get_element_index()
+            element_search = st.text_input("Search Element", "Hydrogen", key="pt_search",
+                                           help="Name, symbol, atomic number or category; typos are OK")
         
-        # Load periodic table from JSON
-        periodic_data = json_utils.load_json_data('periodic_table.json')
-        elements = {}
-        
-        for elem in periodic_data.get('elements', []):
-            elements[elem['name']] = {
-                "symbol": elem['symbol'],
-                "number": elem['number'],
-                "mass": elem['mass'],
-                "category": elem['category']
-            }
+            matches = index.search(element_search)
+            if not matches:
+                st.warning("Element not found in database")
+            elif matches[0][1] == "exact":
+                show_element(matches[0][0])
+            else:
+                if matches[0][1] == "fuzzy":
+                    st.info("No exact match, closest elements:")
+                options = [e.number for e, _ in matches]
+                picked = st.selectbox("Matches", options, key="pt_match",
+                                      format_func=lambda n: f"{n}. {index.by_number[n].name} ({index.by_number[n].symbol})")
+                show_element(index.by_number[picked])
         
-        if element_search in elements:
-            elem = elements[element_search]
-            
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Symbol", elem["symbol"])
-            with col2:
-                st.metric("Atomic Number", elem["number"])
-            with col3:
-                st.metric("Atomic Mass", elem["mass"])
-            with col4:
-                st.write(f"**Category**\n{elem['category']}")
-        else:
-            st.warning("Element not found in database")
+            st.markdown("---")
+            st.markdown("### 🧪 Interactive Table")
+            st.caption("Click a cell to see the element")
+            frame, styled = _element_grid(json_utils.data_stamp('periodic_table.json'))
+            event = st.dataframe(styled, on_select="rerun", selection_mode="single-cell",
+                                 key="pt_grid", use_container_width=True)
+            cells = event.selection.get("cells", []) if event else []
+            if cells:
+                row, column = cells[0]
+                picked = index.at(row, column)
+                if picked:
+                    show_element(picked)
         
-        st.markdown("---")
-        st.markdown("### 📚 Common Elements")
-        for name, data in list(elements.items())[:8]:
-            st.write(f"**{data['number']}. {name} ({data['symbol']})** - {data['mass']} u")
+            with st.expander("🔎 Filter by group, period, category or mass"):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    group = st.selectbox("Group", ["Any"] + sorted(index.by_group), key="pt_group")
+                with col2:
+                    period = st.selectbox("Period", ["Any"] + sorted(index.by_period), key="pt_period")
+                with col3:
+                    category = st.selectbox("Category", ["Any"] + index.categories, key="pt_category")
+                mass = st.slider("Atomic mass (u)", 0.0, 300.0, (0.0, 300.0), key="pt_mass")
+                found = index.query(
+                    group=None if group == "Any" else group,
+                    period=None if period == "Any" else period,
+                    category=None if category == "Any" else category,
+                    mass=mass,
+                )
+                st.caption(f"{len(found)} elements")
+                for elem in found:
+                    st.write(f"**{elem.number}. {elem.name} ({elem.symbol})** - {elem.mass:g} u · {elem.category}")
     
     # Dictionary
-    with tabs[2]:
-        st.markdown("### 📖 Dictionary & Thesaurus")
-        
-        word = st.text_input("Enter a word", "serendipity")
+    if tabs[2].open:
+        with tabs[2]:
+            st.markdown("### 📖 Dictionary & Thesaurus")
         
-        if st.button("🔍 Look Up"):
-            dict_data = json_utils.load_json_data('dictionary.json')
-            words = dict_data.get('words', {})
+            dictionary = dictionary_engine.ensure_built()
+            if dictionary is None or not len(dictionary):
+                st.warning("No dictionary installed. Import a word list with: python dictionary_engine.py import words.csv")
+            else:
+                st.session_state.setdefault("dict_word", "serendipity")
+                word = st.text_input("Enter a word", key="dict_word")
             
-            if word.lower() in words:
-                word_info = words[word.lower()]
-                
-                st.markdown(f"### {word.title()}")
-                st.markdown(f"*{word_info['part_of_speech']}*")
-                
-                st.markdown("**Definition:**")
-                st.info(word_info['definition'])
-                
-                st.markdown("**Example:**")
-                st.write(f"*\"{word_info['example']}\"*")
+                if word.strip():
+                    entry = dictionary.get(word)
+                    if entry:
+                        show_entry(entry)
+                    else:
+                        st.warning(f"Word '{word}' not found in dictionary. To add it, put it in data/dictionary.json "
+                                   "(or a word list) and run: python dictionary_engine.py import [word lists...]")
+                        suggestions = [w for w, _ in dictionary.fuzzy(word, limit=6)]
+                        if suggestions:
+                            st.markdown("**Did you mean:**")
+                            word_buttons(suggestions, "dict_fuzzy")
                 
-                if word_info.get('synonyms'):
-                    st.markdown("**Synonyms:**")
-                    st.write(", ".join(word_info['synonyms']))
-            else:
-                st.warning(f"Word '{word}' not found in dictionary. Add it to dictionary.json!")
-        
-        st.markdown("---")
-        st.markdown("### 📝 Word of the Day")
-        
-        dict_data = json_utils.load_json_data('dictionary.json')
-        wotd= dict_data.get('word_of_the_day', {})
-        
-        if wotd:
-            st.markdown(f"**{wotd['word']}**")
-            st.write(f"*{wotd['part_of_speech']}*: {wotd['definition']}")
-            if wotd.get('example'):
-                st.caption(f"Example: {wotd['example']}")
+                    completions = [w for w in dictionary.complete(word, 9) if w != word.strip().lower()][:8]
+                    if completions:
+                        st.caption("Words starting with this:")
+                        word_buttons(completions, "dict_prefix")
+            
+                st.caption(f"{len(dictionary):,} words in the offline dictionary")
+            
+                st.markdown("---")
+                st.markdown("### 📝 Word of the Day")
+            
+                wotd = dictionary.word_of_the_day()
+                if wotd:
+                    sense = wotd["senses"][0]
+                    st.markdown(f"**{wotd['word']}**")
+                    st.write(f"*{sense.get('part_of_speech', '')}*: {sense['definition']}")
+                    if sense.get('example'):
+                        st.caption(f"Example: {sense['example']}")
     
     # Translator
-    with tabs[3]:
-        st.markdown("### 🌍 Language Translator")
-        
-        st.info("Simple text translation tool")
+    if tabs[3].open:
+        with tabs[3]:
+            st.markdown("### 🌍 Language Translator")
         
-        col1, col2 = st.columns(2)
-        with col1:
-            from_lang = st.selectbox("From Language", ["English", "Hindi", "Spanish", "French", "German"])
-        with col2:
-            to_lang = st.selectbox("To Language", ["Hindi", "English", "Spanish", "French", "German"])
+            translator = get_translator()
+            languages = translator.table.languages()
+            st.info("Offline phrase translation: known phrases are matched longest first, other words are kept as typed")
         
-        text_to_translate = st.text_area("Enter text to translate", height=150)
+            col1, col2 = st.columns(2)
+            with col1:
+                from_lang = st.selectbox("From Language", languages, key="tr_from",
+                                         format_func=translation_engine.LANGUAGES.get)
+            with col2:
+                to_lang = st.selectbox("To Language", languages, index=languages.index("hi") if "hi" in languages else 0,
+                                       key="tr_to", format_func=translation_engine.LANGUAGES.get)
         
-        if st.button("🔄 Translate"):
-            st.info("Note: Full translation requires API integration (Google Translate API)")
-            st.markdown("### Translated Text:")
-            st.write("Translation would appear here with API integration")
+            text_to_translate = st.text_area("Enter text to translate", height=150, key="tr_text")
         
-        st.markdown("---")
-        st.markdown("### 🗣️ Common Phrases")
+            if text_to_translate.strip():
+                result = translator.translate(text_to_translate, from_lang, to_lang)
+                st.markdown("### Translated Text:")
+                st.success(result.text)
+                unknown = sorted({seg.source for seg in result.segments if not seg.known})
+                st.caption(f"{result.coverage:.0%} of words matched the phrase table"
+                           + (f" · kept as typed: {', '.join(unknown)}" if unknown else ""))
         
-        # Load translations from JSON
-        translations_data = json_utils.load_json_data('translations.json')
-        phrases = translations_data.get('common_phrases', {})
+            st.markdown("---")
+            st.markdown("### 🗣️ Common Phrases")
         
-        for english, translations in phrases.items():
-            st.write(f"**{english}:** {translations.get(to_lang, 'N/A')}")
+            phrase_filter = st.text_input("Filter phrases", key="tr_filter").strip().casefold()
+            shown = 0
+            for entry in translator.table.entries:
+                source_text = entry.get(from_lang)
+                if not source_text or (phrase_filter and phrase_filter not in source_text.casefold()):
+                    continue
+                st.write(f"**{source_text}:** {entry.get(to_lang, 'N/A')}")
+                shown += 1
+                if shown >= 30:
+                    st.caption("Showing the first 30; type to filter")
+                    break